@@ -20,7 +20,18 @@ asyncio.run(init_db())
 "
 echo ""
 
+echo "=== Clearing Metrics Snapshots ==="
+pipenv run python -c "
+from core.metrics import reset_snapshots
+from core.settings import get_settings
+
+reset_snapshots(get_settings().metrics_dir)
+"
+echo ""
+
 WORKERS=$((2 * $(nproc) + 1))
+# Lets each worker size its connection pools to stay under max_connections
+export WEB_CONCURRENCY="$WORKERS"
 
 echo "Starting FastAPI with $WORKERS workers"
 exec pipenv run uvicorn main:app \
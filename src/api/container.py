@@ -0,0 +1,181 @@
+"""Application-scoped dependency container, built once per worker in the lifespan."""
+import importlib
+import inspect
+from typing import Any, Callable, Iterator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.bidding_use_case import RunAuctionUseCase
+from application.stats_use_case import GetStatsUseCase
+from core.logging import get_logger, log_queue_stats
+from core.metrics import Sample
+from core.settings import Settings, get_settings
+from domain.bidding import (
+    AuctionService,
+    IAuctionWriter,
+    IBiddingRepository,
+    IBidGenerator,
+    IRateLimiter,
+)
+from domain.stats import IStatsRecorder, IStatsRepository, StatsQuery, StatsService
+from infrastructure.cache import (
+    EligibilityCache,
+    SupplyRegistry,
+    get_eligibility_cache,
+    get_stats_cache,
+    get_supply_registry,
+)
+from infrastructure.db import pool_stats
+from infrastructure.db.session import engine, read_replica_engine
+from infrastructure.persistence import (
+    get_auction_event_log,
+    get_auction_writer,
+    get_stats_recorder,
+)
+from infrastructure.repositories import get_redis_stats_repository
+from infrastructure.tracing import get_trace_exporter
+
+
+logger = get_logger(__name__)
+
+
+def load_object(path: str) -> Any:
+    """Imports an object from a "module:attribute" path."""
+    module_name, _, attribute = path.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Expected a 'module:attribute' import path, got '{path}'")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class AppContainer:
+    """
+    Holds the services shared by all requests of one worker.
+    Requests only contribute their database session, from which the
+    repositories and use cases are assembled.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        bid_generator: IBidGenerator,
+        rate_limiter: IRateLimiter,
+        bidding_repository_factory: Callable[..., IBiddingRepository],
+        stats_repository_factory: Callable[[AsyncSession], IStatsRepository],
+        auction_writer: Optional[IAuctionWriter] = None,
+        stats_recorder: Optional[IStatsRecorder] = None,
+        event_log: Optional[IAuctionWriter] = None,
+        eligibility_cache: Optional[EligibilityCache] = None,
+        supply_registry: Optional[SupplyRegistry] = None
+    ):
+        """Initializes container with already built services."""
+        self.settings = settings
+        self.bid_generator = bid_generator
+        self.rate_limiter = rate_limiter
+        self.bidding_repository_factory = bidding_repository_factory
+        self.stats_repository_factory = stats_repository_factory
+        self.auction_writer = auction_writer
+        self.stats_recorder = stats_recorder
+        self.event_log = event_log
+        self.eligibility_cache = eligibility_cache
+        self.supply_registry = supply_registry
+
+        self.auction_service = AuctionService(
+            bid_generator,
+            concurrent_fan_out=settings.auction_concurrent_fan_out
+        )
+        self.stats_service = StatsService()
+
+    @classmethod
+    async def create(cls, settings: Optional[Settings] = None) -> "AppContainer":
+        """
+        Builds the container from the implementations named in settings.
+        Rate limiters from async factories are expected to be initialized already.
+        """
+        settings = settings or get_settings()
+
+        rate_limiter = load_object(settings.container_rate_limiter)()
+        if inspect.isawaitable(rate_limiter):
+            rate_limiter = await rate_limiter
+        else:
+            await rate_limiter.initialize()
+
+        container = cls(
+            settings=settings,
+            bid_generator=load_object(settings.container_bid_generator)(),
+            rate_limiter=rate_limiter,
+            bidding_repository_factory=load_object(settings.container_bidding_repository),
+            stats_repository_factory=load_object(settings.container_stats_repository),
+            auction_writer=get_auction_writer(),
+            stats_recorder=get_stats_recorder(),
+            event_log=get_auction_event_log(),
+            eligibility_cache=get_eligibility_cache(),
+            supply_registry=get_supply_registry()
+        )
+        logger.info(
+            f"Container built: bid_generator={type(container.bid_generator).__name__}, "
+            f"rate_limiter={type(rate_limiter).__name__}"
+        )
+        return container
+
+    def auction_use_case(self, session: AsyncSession) -> RunAuctionUseCase:
+        """Returns the auction use case bound to a request's session."""
+        bidding_repository = self.bidding_repository_factory(
+            session,
+            eligibility_cache=self.eligibility_cache,
+            supply_registry=self.supply_registry,
+            auto_create_supplies=self.settings.supply_auto_create
+        )
+        return RunAuctionUseCase(
+            bidding_repository=bidding_repository,
+            rate_limiter=self.rate_limiter,
+            auction_service=self.auction_service,
+            auction_writer=self.auction_writer,
+            stats_recorder=self.stats_recorder,
+            event_log=self.event_log,
+            settings=self.settings
+        )
+
+    def stats_use_case(
+        self,
+        session: AsyncSession,
+        query: Optional[StatsQuery] = None
+    ) -> GetStatsUseCase:
+        """
+        Returns the stats use case reading from the database or Redis counters.
+        Filtered queries always go to the database.
+        """
+        if self.settings.stats_backend == "redis" and (query is None or query.is_unfiltered):
+            stats_repository = get_redis_stats_repository()
+        else:
+            stats_repository = self.stats_repository_factory(session)
+        return GetStatsUseCase(
+            stats_repository=stats_repository,
+            stats_service=self.stats_service
+        )
+
+    def collect_metrics(self) -> Iterator[Sample]:
+        """Yields gauges for connection pools, caches and queues of this worker."""
+        for name, pool_engine in (("primary", engine), ("replica", read_replica_engine)):
+            for field, value in pool_stats(pool_engine).items():
+                yield f"db_pool_{field}", "gauge", "Connection pool state", {"engine": name}, value
+
+        components = {
+            "eligibility_cache": self.eligibility_cache,
+            "supply_registry": self.supply_registry,
+            "stats_cache": get_stats_cache(),
+            "auction_writer": self.auction_writer,
+            "stats_recorder": self.stats_recorder,
+            "event_log": self.event_log,
+            "rate_limiter": self.rate_limiter,
+            "trace_exporter": get_trace_exporter(),
+        }
+        for component, service in components.items():
+            for field, value in getattr(service, "stats", {}).items():
+                yield f"{component}_{field}", "gauge", f"{component} state", {}, value
+
+        for field, value in log_queue_stats().items():
+            yield f"log_queue_{field}", "gauge", "Log queue state", {}, value
+
+    async def close(self) -> None:
+        """Releases connections held by shared services."""
+        await self.rate_limiter.close()
@@ -0,0 +1,53 @@
+"""ASGI middleware starting a trace per request."""
+from core.tracing import end_trace, span, start_trace
+from infrastructure.tracing import TraceExporter
+
+
+class TracingMiddleware:
+    """
+    Traces every HTTP request, adds a Server-Timing header summarizing its
+    timings and hands sampled traces to the exporter.
+    Pure ASGI, so streaming responses are not buffered.
+    """
+
+    def __init__(self, app, exporter: TraceExporter, sample_rate: float):
+        self.app = app
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for name, value in scope["headers"]:
+            if name == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        trace = start_trace(self.sample_rate, traceparent)
+        request = span(
+            f"{scope['method']} {scope['path']}",
+            **{"http.method": scope["method"], "http.target": scope["path"]}
+        )
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                request.set(**{"http.status_code": message["status"]})
+                message = {
+                    **message,
+                    "headers": [
+                        *message.get("headers", ()),
+                        (b"server-timing", trace.server_timing().encode("latin-1")),
+                    ],
+                }
+            await send(message)
+
+        try:
+            with request:
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            end_trace()
+            if trace.sampled:
+                self.exporter.export(trace)
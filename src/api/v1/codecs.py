@@ -0,0 +1,66 @@
+"""JSON codecs for hot endpoints, using orjson when it is installed."""
+import json
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parses JSON bytes.
+    Invalid documents are re-parsed with the stdlib so callers always get json.JSONDecodeError.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def json_dumps(content: Any) -> bytes:
+    """Serializes plain JSON types to compact bytes."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response for content that is already plain dicts, lists and scalars."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+class FastJSONRequest(Request):
+    """Request whose JSON body is parsed with the fast codec."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = json_loads(await self.body())
+        return self._json
+
+
+class FastJSONRoute(APIRoute):
+    """
+    Route that parses JSON bodies with the fast codec.
+    Body validation and error responses stay with FastAPI.
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await original_route_handler(
+                FastJSONRequest(request.scope, request.receive)
+            )
+
+        return route_handler
@@ -1,6 +1,16 @@
+from fastapi import Request
+
+from api.container import AppContainer
 from infrastructure.db.session import get_db, get_read_replica_db
 
+
+async def get_container(request: Request) -> AppContainer:
+    """Returns the application container built in the lifespan."""
+    return request.app.state.container
+
+
 __all__ = [
+    "get_container",
     "get_db",
     "get_read_replica_db",
 ]
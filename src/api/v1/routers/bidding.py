@@ -1,44 +1,33 @@
+import math
+
 from fastapi import APIRouter, Depends, status, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.v1.dependencies import get_db
+from api.container import AppContainer
+from api.v1.codecs import FastJSONResponse, FastJSONRoute
+from api.v1.dependencies import get_container, get_db
 from schemas.bidding import BidRequest, BidResponse, BidErrorResponse
 from application.bidding_use_case import RunAuctionUseCase
 from domain.bidding import (
     AuctionRequest,
-    SimpleBidGenerator,
-    AuctionService,
     SupplyNotFoundException,
     NoEligibleBiddersException,
     NoBidsReceivedException,
     RateLimitExceededException,
 )
-from infrastructure.repositories import BiddingRepository
-from infrastructure.rate_limiter.redis_rate_limiter import get_rate_limiter
 from core.logging import get_logger
 
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/bid", tags=["bidding"])
+router = APIRouter(prefix="/bid", tags=["bidding"], route_class=FastJSONRoute)
 
 
 async def get_auction_use_case(
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    container: AppContainer = Depends(get_container)
 ) -> RunAuctionUseCase:
-    """Creates and configures the auction use case."""
-    bidding_repo = BiddingRepository(db)
-    rate_limiter = await get_rate_limiter()
-
-    bid_generator = SimpleBidGenerator()
-    auction_service = AuctionService(bid_generator)
-
-    use_case = RunAuctionUseCase(
-        bidding_repository=bidding_repo,
-        rate_limiter=rate_limiter,
-        auction_service=auction_service
-    )
-
-    return use_case
+    """Creates the auction use case for the request's session from shared services."""
+    return container.auction_use_case(db)
 
 
 @router.post(
@@ -63,7 +52,7 @@ async def get_auction_use_case(
 async def run_auction(
     bid_request: BidRequest,
     use_case: RunAuctionUseCase = Depends(get_auction_use_case)
-) -> BidResponse:
+) -> FastJSONResponse:
     """Runs an auction for a supply."""
     try:
         auction_request = AuctionRequest(
@@ -75,15 +64,28 @@ async def run_auction(
 
         result = await use_case.execute(auction_request)
 
-        return BidResponse(
-            winner=result.winner_bidder_id,
-            price=result.winning_price
+        headers = None
+        if result.rate_limit:
+            headers = {
+                "X-RateLimit-Limit": str(result.rate_limit.limit),
+                "X-RateLimit-Remaining": str(result.rate_limit.remaining),
+                "X-RateLimit-Reset": str(math.ceil(result.rate_limit.reset_seconds)),
+            }
+
+        # Encoded directly, skipping response_model validation; BidResponse only documents it
+        return FastJSONResponse(
+            {"winner": result.winner_bidder_id, "price": result.winning_price},
+            headers=headers
         )
 
     except RateLimitExceededException as e:
+        headers = None
+        if e.retry_after is not None:
+            headers = {"Retry-After": str(math.ceil(e.retry_after))}
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail=str(e)
+            detail=str(e),
+            headers=headers
         )
 
     except SupplyNotFoundException as e:
@@ -1,44 +1,115 @@
-from fastapi import APIRouter, Depends, status, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
+import json
+from datetime import datetime, timezone
+from typing import AsyncIterator, Literal, Optional
 
-from api.v1.dependencies import get_read_replica_db
+from fastapi import APIRouter, Depends, Query, Response, status, HTTPException
+from fastapi.responses import StreamingResponse
+
+from api.container import AppContainer
+from api.v1.dependencies import get_container
 from schemas.stats import SupplyStats
-from application.stats_use_case import GetStatsUseCase
-from domain.stats import StatsService
-from infrastructure.repositories import StatsRepository
+from domain.stats import EncodedStats, StatsQuery
+from infrastructure.cache import get_stats_cache
+from infrastructure.db.session import AsyncReadReplicaSessionLocal
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/stat", tags=["statistics"])
 
 
-async def get_stats_use_case(
-    db: AsyncSession = Depends(get_read_replica_db)
-) -> GetStatsUseCase:
-    """Creates and configures the stats use case using read replica."""
-    stats_repo = StatsRepository(db)
-    stats_service = StatsService()
+def as_utc(moment: Optional[datetime]) -> Optional[datetime]:
+    """Treats timestamps without an offset as UTC."""
+    if moment is not None and moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+async def load_statistics(container: AppContainer, query: StatsQuery) -> EncodedStats:
+    """
+    Computes the statistics response body on a dedicated read replica session.
+    The session is not request-scoped because cache refreshes outlive the request.
+    """
+    async with AsyncReadReplicaSessionLocal() as session:
+        return await container.stats_use_case(session, query).execute_json(query)
 
-    use_case = GetStatsUseCase(
-        stats_repository=stats_repo,
-        stats_service=stats_service
-    )
 
-    return use_case
+async def stream_statistics(container: AppContainer, query: StatsQuery) -> AsyncIterator[bytes]:
+    """Yields one NDJSON line per supply while reading from a server-side cursor."""
+    async with AsyncReadReplicaSessionLocal() as session:
+        try:
+            async for supply_id, stats in container.stats_use_case(session, query).stream(query):
+                yield json.dumps({"supply_id": supply_id, **stats}).encode() + b"\n"
+        except Exception as e:
+            # Headers are already sent, so the client sees a truncated stream
+            logger.error(f"Error streaming statistics: {str(e)}", exc_info=True)
+            raise
 
 
 @router.get(
     "",
     response_model=dict[str, SupplyStats],
-    status_code=status.HTTP_200_OK
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {
+            "content": {"application/x-ndjson": {}},
+            "description": "Statistics by supply ID, or one supply per line with format=ndjson"
+        }
+    }
 )
 async def get_statistics(
-    use_case: GetStatsUseCase = Depends(get_stats_use_case)
+    supply_id: Optional[list[str]] = Query(None, description="Only these supplies"),
+    country: Optional[str] = Query(
+        None, min_length=2, max_length=2, description="Only auctions from this country"
+    ),
+    bidder_id: Optional[str] = Query(None, description="Only this bidder"),
+    since: Optional[datetime] = Query(
+        None,
+        description="Only auctions created at or after; without a country filter this is "
+                    "answered from minute/hour buckets and applies to bucket start times"
+    ),
+    until: Optional[datetime] = Query(None, description="Only auctions created before"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Supplies per page"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Return supplies after this one: the X-Next-Cursor header, "
+                    "or the last supply_id line of an NDJSON page"
+    ),
+    format: Literal["json", "ndjson"] = Query("json", description="Response format"),
+    container: AppContainer = Depends(get_container)
 ) -> dict[str, SupplyStats]:
     """Retrieves auction statistics."""
     try:
-        stats = await use_case.execute()
-        return stats
+        query = StatsQuery(
+            supply_ids=tuple(supply_id) if supply_id is not None else None,
+            country=country.upper() if country else None,
+            bidder_id=bidder_id,
+            since=as_utc(since),
+            until=as_utc(until),
+            after_supply_id=cursor,
+            limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if format == "ndjson":
+        return StreamingResponse(
+            stream_statistics(container, query),
+            media_type="application/x-ndjson"
+        )
+
+    # The body is encoded from database rows in one pass; response_model only documents it
+    try:
+        headers = {}
+        stats_cache = get_stats_cache()
+        if stats_cache:
+            encoded, age = await stats_cache.get(query, lambda: load_statistics(container, query))
+            headers["Age"] = str(int(age))
+        else:
+            encoded = await load_statistics(container, query)
+
+        if limit is not None and encoded.supplies == limit:
+            headers["X-Next-Cursor"] = encoded.last_supply_id
+        return Response(encoded.body, media_type="application/json", headers=headers)
 
     except Exception as e:
         logger.error(f"Error retrieving statistics: {str(e)}", exc_info=True)
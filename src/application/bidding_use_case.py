@@ -1,10 +1,19 @@
+import logging
+import random
+import time
+from typing import Optional
 
 from core.logging import get_logger
-from core.settings import get_settings
+from core.metrics import AUCTION_STAGE_SECONDS, registry
+from core.tracing import span
+from core.settings import Settings, get_settings
 from domain.bidding import (
+    AuctionRecord,
+    Bid,
     AuctionRequest,
     AuctionResult,
     AuctionService,
+    IAuctionWriter,
     IBiddingRepository,
     IRateLimiter,
     SupplyNotFoundException,
@@ -12,9 +21,62 @@ from domain.bidding import (
     NoBidsReceivedException,
     RateLimitExceededException,
 )
+from domain.stats import IStatsRecorder
 
 logger = get_logger(__name__)
 
+AUCTION_SECONDS = registry.histogram(
+    "auction_duration_seconds", "Duration of RunAuctionUseCase.execute by outcome", ("outcome",)
+)
+OUTCOMES = {
+    RateLimitExceededException: "rate_limited",
+    SupplyNotFoundException: "supply_not_found",
+    NoEligibleBiddersException: "no_eligible_bidders",
+    NoBidsReceivedException: "no_bids",
+}
+
+
+class AuctionLogDetails:
+    """Per-bid auction summary that is only rendered when a handler formats it."""
+
+    def __init__(
+        self,
+        request: AuctionRequest,
+        bids: list[Bid],
+        result: Optional[AuctionResult] = None
+    ):
+        self.request = request
+        self.bids = bids
+        self.result = result
+
+    def __str__(self) -> str:
+        prefix = "" if self.result else "FAILED "
+        log_lines = [
+            f"\n{'='*60}",
+            f"{prefix}Auction for {self.request.supply_id} (country={self.request.country}):",
+        ]
+
+        for bid in self.bids:
+            if bid.timed_out:
+                status = f"TIMEOUT (latency={bid.latency_ms}ms)"
+            elif bid.is_no_bid:
+                status = "no bid"
+            else:
+                latency_info = f", latency={bid.latency_ms}ms" if bid.latency_ms else ""
+                status = f"price {bid.price:.2f}{latency_info}"
+
+            log_lines.append(f"  {bid.bidder_id} - {status}")
+
+        if self.result:
+            log_lines.append(
+                f"Winner: {self.result.winner_bidder_id} ({self.result.winning_price:.2f})"
+            )
+        else:
+            log_lines.append("Winner: None (no valid bids)")
+        log_lines.append(f"{'='*60}\n")
+
+        return "\n".join(log_lines)
+
 
 class RunAuctionUseCase:
     """Orchestrates the entire auction process."""
@@ -23,42 +85,78 @@ class RunAuctionUseCase:
             self,
             bidding_repository: IBiddingRepository,
             rate_limiter: IRateLimiter,
-            auction_service: AuctionService
+            auction_service: AuctionService,
+            auction_writer: Optional[IAuctionWriter] = None,
+            stats_recorder: Optional[IStatsRecorder] = None,
+            event_log: Optional[IAuctionWriter] = None,
+            settings: Optional[Settings] = None
     ):
         self.bidding_repository = bidding_repository
         self.rate_limiter = rate_limiter
         self.auction_service = auction_service
-        self.settings = get_settings()
+        self.auction_writer = auction_writer
+        self.stats_recorder = stats_recorder
+        self.event_log = event_log
+        self.settings = settings or get_settings()
 
     async def execute(self, request: AuctionRequest) -> AuctionResult:
-        """Executes the auction use case."""
+        """Executes the auction use case, recording its duration and span by outcome."""
+        started = time.perf_counter()
+        outcome = "error"
+        with span("auction", supply_id=request.supply_id, country=request.country) as auction:
+            try:
+                result = await self._run(request)
+                outcome = "won"
+                return result
+            except Exception as e:
+                outcome = OUTCOMES.get(type(e), "error")
+                raise
+            finally:
+                AUCTION_SECONDS.observe(time.perf_counter() - started, outcome)
+                auction.set(outcome=outcome)
+
+    async def _run(self, request: AuctionRequest) -> AuctionResult:
+        """Runs the auction stages."""
+        # Lazy arguments: per-auction messages are only built when INFO is enabled
         logger.info(
-            f"Starting auction for supply={request.supply_id}, "
-            f"country={request.country}, ip={request.ip_address}"
+            "Starting auction for supply=%s, country=%s, ip=%s",
+            request.supply_id, request.country, request.ip_address
         )
-        is_allowed = await self.rate_limiter.check_rate_limit(
-            key=request.ip_address,
-            max_requests=self.settings.rate_limit_max_requests,
-            window_seconds=self.settings.rate_limit_window_seconds
-        )
-        if not is_allowed:
+        with AUCTION_STAGE_SECONDS.time("rate_limit"), span(
+            "auction.rate_limit", timing="rate_limit", ip=request.ip_address
+        ):
+            rate_limit = await self.rate_limiter.check_rate_limit_detailed(
+                key=request.ip_address,
+                max_requests=self.settings.rate_limit_max_requests,
+                window_seconds=self.settings.rate_limit_window_seconds
+            )
+        if not rate_limit.allowed:
             logger.warning(f"Rate limit exceeded for IP: {request.ip_address}")
             raise RateLimitExceededException(
                 ip_address=request.ip_address,
                 limit=self.settings.rate_limit_max_requests,
-                window_seconds=self.settings.rate_limit_window_seconds
+                window_seconds=self.settings.rate_limit_window_seconds,
+                retry_after=rate_limit.reset_seconds
+            )
+        with AUCTION_STAGE_SECONDS.time("supply_lookup"), span(
+            "auction.supply_lookup", timing="supply_lookup", supply_id=request.supply_id
+        ):
+            supply = await self.bidding_repository.get_or_create_supply(
+                supply_id=request.supply_id
             )
-        supply = await self.bidding_repository.get_or_create_supply(
-            supply_id=request.supply_id
-        )
         if not supply:
             logger.error(f"Supply not found: {request.supply_id}")
             raise SupplyNotFoundException(request.supply_id)
-        logger.debug(f"Supply validated: {supply.id}")
-        eligible_bidders = await self.bidding_repository.get_eligible_bidders_for_supply(
-            supply_id=request.supply_id,
-            country=request.country
-        )
+        logger.debug("Supply validated: %s", supply.id)
+        with AUCTION_STAGE_SECONDS.time("eligibility_lookup"), span(
+            "auction.eligibility_lookup", timing="eligibility_lookup",
+            supply_id=request.supply_id, country=request.country
+        ) as lookup:
+            eligible_bidders = await self.bidding_repository.get_eligible_bidders_for_supply(
+                supply_id=request.supply_id,
+                country=request.country
+            )
+            lookup.set(bidders=len(eligible_bidders))
         if not eligible_bidders:
             logger.warning(
                 f"No eligible bidders for supply={request.supply_id}, "
@@ -67,32 +165,32 @@ class RunAuctionUseCase:
             raise NoEligibleBiddersException(
                 request.supply_id, request.country)
 
-        logger.info(
-            f"Found {len(eligible_bidders)} eligible bidders: "
-            f"{[b.id for b in eligible_bidders]}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Found %d eligible bidders: %s",
+                len(eligible_bidders), [b.id for b in eligible_bidders]
+            )
 
         try:
-            result = await self.auction_service.run_auction(
-                eligible_bidders=eligible_bidders,
-                supply_id=request.supply_id,
-                country=request.country,
-                tmax=request.tmax
-            )
+            with AUCTION_STAGE_SECONDS.time("auction_run"), span(
+                "auction.run", timing="auction_run", supply_id=request.supply_id,
+                country=request.country, bidders=len(eligible_bidders), tmax=request.tmax
+            ):
+                result = await self.auction_service.run_auction(
+                    eligible_bidders=eligible_bidders,
+                    supply_id=request.supply_id,
+                    country=request.country,
+                    tmax=request.tmax
+                )
+            result.rate_limit = rate_limit
             self._log_auction_details(request, result)
-            auction_id = await self.bidding_repository.save_auction_result(
-                supply_id=request.supply_id,
-                ip_address=request.ip_address,
-                country=request.country,
-                result=result,
-                tmax=request.tmax
+            await self._persist(
+                AuctionRecord.from_auction(request, result.all_bids, result)
             )
 
-            await self.bidding_repository.save_bids(auction_id, result.all_bids)
-
             logger.info(
-                f"Auction completed: winner={result.winner_bidder_id}, "
-                f"price={result.winning_price}"
+                "Auction completed: winner=%s, price=%s",
+                result.winner_bidder_id, result.winning_price
             )
 
             return result
@@ -107,16 +205,10 @@ class RunAuctionUseCase:
 
             self._log_failed_auction_details(request, all_bids)
 
-            auction_id = await self.bidding_repository.save_auction_result(
-                supply_id=request.supply_id,
-                ip_address=request.ip_address,
-                country=request.country,
-                result=None,
-                tmax=request.tmax
+            auction_id = await self._persist(
+                AuctionRecord.from_auction(request, all_bids)
             )
 
-            await self.bidding_repository.save_bids(auction_id, all_bids)
-
             await self.bidding_repository.session.commit()
 
             logger.info(
@@ -126,34 +218,42 @@ class RunAuctionUseCase:
 
             raise
 
+    async def _persist(self, record: AuctionRecord) -> Optional[int]:
+        """
+        Persists auction record directly or hands it to the write-behind writer,
+        then feeds the stats recorder and event log. Returns auction ID only when
+        written synchronously.
+        """
+        auction_id = None
+        with AUCTION_STAGE_SECONDS.time("persist"), span("auction.persist", timing="persist"):
+            if self.auction_writer:
+                await self.auction_writer.submit(record)
+            else:
+                auction_id = await self.bidding_repository.save_auction_with_bids(record)
+
+        if self.stats_recorder:
+            with AUCTION_STAGE_SECONDS.time("stats_record"), span(
+                "auction.stats_record", timing="stats_record"
+            ):
+                await self.stats_recorder.record_auction(record)
+        if self.event_log:
+            with AUCTION_STAGE_SECONDS.time("event_log"), span(
+                "auction.event_log", timing="event_log"
+            ):
+                await self.event_log.submit(record)
+        return auction_id
+
     def _log_auction_details(
         self,
         request: AuctionRequest,
         result: AuctionResult
     ) -> None:
-        """Logs detailed auction information to terminal."""
-        log_lines = [
-            f"\n{'='*60}",
-            f"Auction for {request.supply_id} (country={request.country}):",
-        ]
-
-        for bid in result.all_bids:
-            if bid.timed_out:
-                status = f"TIMEOUT (latency={bid.latency_ms}ms)"
-            elif bid.is_no_bid:
-                status = "no bid"
-            else:
-                latency_info = f", latency={bid.latency_ms}ms" if bid.latency_ms else ""
-                status = f"price {bid.price:.2f}{latency_info}"
-
-            log_lines.append(f"  {bid.bidder_id} - {status}")
-
-        log_lines.append(
-            f"Winner: {result.winner_bidder_id} ({result.winning_price:.2f})"
-        )
-        log_lines.append(f"{'='*60}\n")
-
-        logger.info("\n".join(log_lines))
+        """Logs detailed auction information for a sample of successful auctions."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        if random.random() >= self.settings.auction_log_sample_rate:
+            return
+        logger.info("%s", AuctionLogDetails(request, result.all_bids, result))
 
     def _log_failed_auction_details(
         self,
@@ -161,23 +261,5 @@ class RunAuctionUseCase:
         all_bids: list
     ) -> None:
         """Logs detailed auction information for failed auctions (no valid bids)."""
-        log_lines = [
-            f"\n{'='*60}",
-            f"FAILED Auction for {request.supply_id} (country={request.country}):",
-        ]
-
-        for bid in all_bids:
-            if bid.timed_out:
-                status = f"TIMEOUT (latency={bid.latency_ms}ms)"
-            elif bid.is_no_bid:
-                status = "no bid"
-            else:
-                latency_info = f", latency={bid.latency_ms}ms" if bid.latency_ms else ""
-                status = f"price {bid.price:.2f}{latency_info}"
-
-            log_lines.append(f"  {bid.bidder_id} - {status}")
-
-        log_lines.append("Winner: None (no valid bids)")
-        log_lines.append(f"{'='*60}\n")
-
-        logger.info("\n".join(log_lines))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s", AuctionLogDetails(request, all_bids))
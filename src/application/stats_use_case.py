@@ -1,10 +1,29 @@
-from typing import Dict
+import time
+from typing import AsyncIterator, Dict, Optional
 from core.logging import get_logger
-from domain.stats import IStatsRepository, StatsService
+from core.metrics import registry
+from core.tracing import span
+from domain.stats import (
+    EncodedStats,
+    IStatsRepository,
+    StatsJSONWriter,
+    StatsQuery,
+    StatsService,
+)
 
 
 logger = get_logger(__name__)
 
+STATS_SECONDS = registry.histogram(
+    "stats_duration_seconds", "Duration of statistics requests by operation", ("operation",)
+)
+STATS_STAGE_SECONDS = registry.histogram(
+    "stats_stage_duration_seconds", "Time spent fetching and encoding statistics rows", ("stage",)
+)
+STATS_SUPPLIES = registry.counter(
+    "stats_supplies_total", "Supplies returned by statistics requests", ("operation",)
+)
+
 
 class GetStatsUseCase:
     """Orchestrates retrieval of auction statistics."""
@@ -17,14 +36,63 @@ class GetStatsUseCase:
         self.stats_repository = stats_repository
         self.stats_service = stats_service
 
-    async def execute(self) -> Dict[str, dict]:
-        """Executes the get statistics use case."""
-        logger.info("Fetching all statistics")
-        raw_stats = await self.stats_repository.get_all_stats()
-        logger.debug(f"Retrieved stats for {len(raw_stats)} supplies")
-        stats_entities = self.stats_service.transform_raw_stats(raw_stats)
-        formatted_stats = self.stats_service.format_stats_for_response(
-            stats_entities)
+    async def execute(self, query: Optional[StatsQuery] = None) -> Dict[str, dict]:
+        """Executes the get statistics use case, optionally filtered and paginated."""
+        with STATS_SECONDS.time("execute"):
+            with STATS_STAGE_SECONDS.time("fetch"):
+                if query is None or query.is_unfiltered:
+                    logger.info("Fetching all statistics")
+                    raw_stats = await self.stats_repository.get_all_stats()
+                else:
+                    logger.info(f"Fetching statistics for {query}")
+                    raw_stats = await self.stats_repository.query_stats(query)
+            logger.debug(f"Retrieved stats for {len(raw_stats)} supplies")
+            with STATS_STAGE_SECONDS.time("encode"):
+                stats_entities = self.stats_service.transform_raw_stats(raw_stats)
+                formatted_stats = self.stats_service.format_stats_for_response(
+                    stats_entities)
+        STATS_SUPPLIES.inc("execute", amount=len(formatted_stats))
         logger.info(
             f"Statistics retrieved successfully for {len(formatted_stats)} supplies")
         return formatted_stats
+
+    async def execute_json(self, query: Optional[StatsQuery] = None) -> EncodedStats:
+        """
+        Executes the get statistics use case straight into the JSON response body.
+        Rows are encoded as they arrive, without per-supply dictionaries or entities.
+        """
+        query = query or StatsQuery()
+        logger.info(f"Encoding statistics for {query}")
+        started = time.perf_counter()
+        encoding = 0.0
+        writer = StatsJSONWriter()
+        async for rows in self.stats_repository.stream_stats_rows(query):
+            with span("stats.encode_rows", timing="encode", rows=len(rows)):
+                batch_started = time.perf_counter()
+                writer.write_rows(rows)
+                encoding += time.perf_counter() - batch_started
+        encoded = writer.finish()
+
+        elapsed = time.perf_counter() - started
+        STATS_SECONDS.observe(elapsed, "execute_json")
+        STATS_STAGE_SECONDS.observe(elapsed - encoding, "fetch")
+        STATS_STAGE_SECONDS.observe(encoding, "encode")
+        STATS_SUPPLIES.inc("execute_json", amount=encoded.supplies)
+        logger.info(
+            f"Statistics retrieved successfully for {encoded.supplies} supplies")
+        return encoded
+
+    async def stream(self, query: StatsQuery) -> AsyncIterator[tuple[str, dict]]:
+        """Yields formatted statistics one supply at a time."""
+        logger.info(f"Streaming statistics for {query}")
+        started = time.perf_counter()
+        supplies = 0
+        try:
+            async for supply_id, raw_stats in self.stats_repository.stream_stats(query):
+                stats_entities = self.stats_service.transform_raw_stats(
+                    {supply_id: raw_stats})
+                supplies += 1
+                yield supply_id, stats_entities.supplies[supply_id].to_dict()
+        finally:
+            STATS_SECONDS.observe(time.perf_counter() - started, "stream")
+            STATS_SUPPLIES.inc("stream", amount=supplies)
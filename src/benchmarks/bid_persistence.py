@@ -0,0 +1,126 @@
+"""
+Benchmark for auction persistence: per-bid flush versus bulk insert.
+
+Run from the src directory against the configured primary database:
+
+    python -m benchmarks.bid_persistence --iterations 200
+
+All rows written by the benchmark are rolled back.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import event
+
+from domain.bidding import AuctionRecord, Bid
+from infrastructure.db.models.bidding import BidderModel, SupplyModel
+from infrastructure.db.session import AsyncSessionLocal, engine
+from infrastructure.repositories import BiddingRepository
+
+
+BIDDER_COUNTS = (1, 5, 10, 25, 50)
+SUPPLY_ID = "benchmark-supply"
+
+
+class RoundTripCounter:
+    """Counts statements sent to the database through the engine."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.count += 1
+
+
+def build_record(bidder_count: int) -> AuctionRecord:
+    """Builds an auction record with one bid per benchmark bidder."""
+    bids = [
+        Bid(bidder_id=f"benchmark-bidder-{i}", price=0.5, latency_ms=20)
+        for i in range(bidder_count)
+    ]
+    return AuctionRecord(
+        supply_id=SUPPLY_ID,
+        ip_address="127.0.0.1",
+        country="US",
+        bids=bids,
+        winner_bidder_id=bids[0].bidder_id,
+        winning_price=0.5,
+        tmax=100
+    )
+
+
+async def save_per_bid(repo: BiddingRepository, record: AuctionRecord) -> None:
+    """Legacy path: one flush for the auction and one per bid."""
+    auction = await repo.create_auction(
+        supply_id=record.supply_id,
+        ip_address=record.ip_address,
+        country=record.country,
+        tmax=record.tmax,
+        winner_bidder_id=record.winner_bidder_id,
+        winning_price=record.winning_price
+    )
+    for bid in record.bids:
+        await repo.create_bid(
+            auction_id=auction.id,
+            bidder_id=bid.bidder_id,
+            price=bid.price,
+            latency_ms=bid.latency_ms,
+            timed_out=int(bid.timed_out)
+        )
+
+
+async def save_bulk(repo: BiddingRepository, record: AuctionRecord) -> None:
+    """Bulk path: auction insert plus one multi-row bid insert."""
+    await repo.save_auction_with_bids(record)
+
+
+async def measure(save, bidder_count: int, iterations: int) -> tuple[float, float, float]:
+    """Returns (round-trips per auction, median ms, p99 ms) for a save strategy."""
+    counter = RoundTripCounter()
+    latencies = []
+
+    async with AsyncSessionLocal() as session:
+        session.add(SupplyModel(id=SUPPLY_ID))
+        session.add_all([
+            BidderModel(id=f"benchmark-bidder-{i}", country="US")
+            for i in range(max(BIDDER_COUNTS))
+        ])
+        await session.flush()
+
+        repo = BiddingRepository(session)
+        record = build_record(bidder_count)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", counter)
+        try:
+            for _ in range(iterations):
+                started = time.perf_counter()
+                await save(repo, record)
+                latencies.append((time.perf_counter() - started) * 1000)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", counter)
+            await session.rollback()
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return counter.count / iterations, statistics.median(latencies), p99
+
+
+async def main(iterations: int) -> None:
+    print(f"{'bidders':>8} {'mode':>8} {'round-trips':>12} {'median ms':>10} {'p99 ms':>8}")
+    for bidder_count in BIDDER_COUNTS:
+        for mode, save in (("per-bid", save_per_bid), ("bulk", save_bulk)):
+            round_trips, median_ms, p99_ms = await measure(save, bidder_count, iterations)
+            print(
+                f"{bidder_count:>8} {mode:>8} {round_trips:>12.1f} "
+                f"{median_ms:>10.2f} {p99_ms:>8.2f}"
+            )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
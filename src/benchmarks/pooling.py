@@ -0,0 +1,94 @@
+"""
+Benchmark for database connection handling: NullPool versus pooled engines.
+
+Runs the repository work behind POST /api/v1/bid (eligibility lookup plus
+bulk auction insert, rolled back) and GET /api/v1/stat (full stats
+aggregation) with concurrent clients against the configured databases:
+
+    python -m benchmarks.pooling --concurrency 20 --requests 500
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from domain.bidding import AuctionRecord, Bid
+from infrastructure.db.pool import pool_stats
+from infrastructure.db.session import create_engine_from_settings, settings
+from infrastructure.repositories import BiddingRepository, StatsRepository
+
+
+async def bid_workload(session: AsyncSession) -> None:
+    """Repository calls of one auction, without caches, rolled back."""
+    repository = BiddingRepository(session)
+    bidders = await repository.get_eligible_bidders_for_supply("supply1", "US")
+    await repository.save_auction_with_bids(AuctionRecord(
+        supply_id="supply1",
+        ip_address="127.0.0.1",
+        country="US",
+        bids=[Bid(bidder_id=bidder.id, price=0.5) for bidder in bidders]
+    ))
+    await session.rollback()
+
+
+async def stat_workload(session: AsyncSession) -> None:
+    """Repository calls of one statistics request."""
+    await StatsRepository(session).get_all_stats()
+
+
+async def run(workload, url: str, pooled: bool, concurrency: int, requests: int) -> dict:
+    """Runs workload with concurrent clients and returns latency figures."""
+    engine = create_engine_from_settings(url, pooled=pooled)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    latencies = []
+    remaining = iter(range(requests))
+
+    async def client() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            async with session_factory() as session:
+                await workload(session)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    stats = pool_stats(engine)
+    await engine.dispose()
+
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "median_ms": statistics.median(latencies),
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "max_wait_ms": stats.get("max_checkout_wait_ms", 0.0),
+    }
+
+
+async def main(concurrency: int, requests: int) -> None:
+    print(
+        f"{'endpoint':>8} {'mode':>8} {'req/s':>9} {'median ms':>10} "
+        f"{'p99 ms':>8} {'max wait ms':>12}"
+    )
+    workloads = (
+        ("/bid", bid_workload, settings.async_database_url),
+        ("/stat", stat_workload, settings.async_read_replica_database_url),
+    )
+    for endpoint, workload, url in workloads:
+        for mode, pooled in (("nullpool", False), ("pooled", True)):
+            result = await run(workload, url, pooled, concurrency, requests)
+            print(
+                f"{endpoint:>8} {mode:>8} {result['rps']:>9.1f} "
+                f"{result['median_ms']:>10.2f} {result['p99_ms']:>8.2f} "
+                f"{result['max_wait_ms']:>12.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.requests))
@@ -0,0 +1,136 @@
+"""
+Benchmark for GET /api/v1/stat serialization: dictionaries versus direct-to-bytes.
+
+Encodes synthetic statistics rows, shaped like the rows of the streaming stats
+query, into the response body with both paths and reports latency and peak
+memory allocated by each path (the rows themselves are excluded):
+
+    python -m benchmarks.stats_serialization --supplies 10000 --bidders 50
+
+The dictionary path is the one GET /stat used before: rows grouped into
+per-supply dictionaries, StatsService entities, to_dict, then response_model
+validation and JSON dump as done by FastAPI.
+"""
+import argparse
+import gc
+import json
+import statistics
+import time
+import tracemalloc
+from collections import namedtuple
+from typing import Callable
+
+from pydantic import TypeAdapter
+
+from domain.stats import BIDDER_ROW, COUNTRY_ROW, SUPPLY_ROW, StatsJSONWriter, StatsService
+from schemas.stats import SupplyStats
+
+
+COUNTRIES = ("US", "GB", "DE", "FR", "ES")
+BATCH_SIZE = 5000
+RESPONSE_ADAPTER = TypeAdapter(dict[str, SupplyStats])
+
+StatsRow = namedtuple(
+    "StatsRow",
+    "supply_id kind key country_count wins total_revenue no_bids timeouts"
+)
+
+
+def build_rows(supply_count: int, bidder_count: int) -> list[StatsRow]:
+    """Builds supply, country and bidder rows ordered by supply."""
+    rows = []
+    for s in range(supply_count):
+        supply_id = f"supply-{s:06d}"
+        rows.append(StatsRow(supply_id, SUPPLY_ROW, None, None, None, None, None, None))
+        for c, country in enumerate(COUNTRIES):
+            rows.append(StatsRow(supply_id, COUNTRY_ROW, country, 100 + s % 7 + c, None, None, None, None))
+        for b in range(bidder_count):
+            rows.append(StatsRow(
+                supply_id, BIDDER_ROW, f"bidder-{b:03d}", None,
+                (s + b) % 11, ((s * 31 + b * 17) % 1000) * 0.0137, (s + b) % 5, (s * b) % 3
+            ))
+    return rows
+
+
+def batches(rows: list[StatsRow]):
+    """Splits rows like a server-side cursor fetching BATCH_SIZE rows at a time."""
+    for start in range(0, len(rows), BATCH_SIZE):
+        yield rows[start:start + BATCH_SIZE]
+
+
+def encode_dicts(rows: list[StatsRow]) -> bytes:
+    """Previous path: repository dictionaries, entities, response_model and JSON dump."""
+    raw_stats = {}
+    for batch in batches(rows):
+        for row in batch:
+            supply_stats = raw_stats.get(row.supply_id)
+            if supply_stats is None:
+                supply_stats = raw_stats[row.supply_id] = {
+                    "total_reqs": 0, "reqs_per_country": {}, "bidders": {}
+                }
+            if row.kind == COUNTRY_ROW:
+                supply_stats["total_reqs"] += row.country_count
+                supply_stats["reqs_per_country"][row.key] = row.country_count
+            elif row.kind == BIDDER_ROW:
+                supply_stats["bidders"][row.key] = {
+                    "wins": row.wins,
+                    "total_revenue": float(row.total_revenue),
+                    "no_bids": row.no_bids,
+                    "timeouts": row.timeouts
+                }
+
+    service = StatsService()
+    response = service.format_stats_for_response(service.transform_raw_stats(raw_stats))
+    return RESPONSE_ADAPTER.dump_json(RESPONSE_ADAPTER.validate_python(response))
+
+
+def encode_direct(rows: list[StatsRow]) -> bytes:
+    """Direct path: rows appended to the JSON body as they arrive."""
+    writer = StatsJSONWriter()
+    for batch in batches(rows):
+        writer.write_rows(batch)
+    return writer.finish().body
+
+
+def measure(encode: Callable, rows: list[StatsRow], iterations: int) -> tuple[float, float, float]:
+    """Returns (median ms, p99 ms, peak MiB) for an encoder."""
+    latencies = []
+    for _ in range(iterations):
+        gc.collect()
+        started = time.perf_counter()
+        encode(rows)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        encode(rows)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return statistics.median(latencies), p99, peak / (1024 * 1024)
+
+
+def main(supply_count: int, bidder_count: int, iterations: int) -> None:
+    rows = build_rows(supply_count, bidder_count)
+    if json.loads(encode_dicts(rows)) != json.loads(encode_direct(rows)):
+        raise SystemExit("Encoders produced different statistics")
+
+    print(f"{len(rows)} rows, {supply_count} supplies x {bidder_count} bidders")
+    print(f"{'mode':>8} {'median ms':>10} {'p99 ms':>8} {'peak MiB':>9} {'body KiB':>9}")
+    for mode, encode in (("dicts", encode_dicts), ("direct", encode_direct)):
+        median_ms, p99_ms, peak_mib = measure(encode, rows, iterations)
+        body_kib = len(encode(rows)) / 1024
+        print(f"{mode:>8} {median_ms:>10.1f} {p99_ms:>8.1f} {peak_mib:>9.1f} {body_kib:>9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--supplies", type=int, default=10000)
+    parser.add_argument("--bidders", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+    main(args.supplies, args.bidders, args.iterations)
@@ -1,9 +1,11 @@
 from core.settings import Settings, get_settings
-from core.logging import setup_logging, get_logger
+from core.logging import setup_logging, shutdown_logging, log_queue_stats, get_logger
 
 __all__ = [
     "Settings",
     "get_settings",
     "setup_logging",
+    "shutdown_logging",
+    "log_queue_stats",
     "get_logger",
 ]
@@ -1,7 +1,11 @@
 import sys
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 from core.settings import get_settings
 
@@ -35,22 +39,52 @@ class AuctionFormatter(logging.Formatter):
         return "\n".join(lines)
 
 
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks the calling thread.
+    Records are handed over unformatted, so messages are built by the listener
+    thread; arguments must not be mutated after they are logged. Records
+    arriving while the queue is full are dropped and counted.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: Optional[QueueListener] = None
+
+
 def setup_logging() -> None:
-    """Configures application logging to stdout and file."""
+    """
+    Configures application logging to stdout and file.
+    With the log queue enabled, the handlers run on a background listener thread
+    and the application only enqueues records.
+    """
+    global _listener
+
     settings = get_settings()
+    level = getattr(logging, settings.log_level.upper())
 
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, settings.log_level.upper()))
+    root_logger.setLevel(level)
 
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, settings.log_level.upper()))
+    console_handler.setLevel(level)
 
     log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     formatter = AuctionFormatter(log_format)
     console_handler.setFormatter(formatter)
 
-    root_logger.addHandler(console_handler)
-
     logs_dir = Path("/app/logs")
     logs_dir.mkdir(parents=True, exist_ok=True)
 
@@ -58,13 +92,42 @@ def setup_logging() -> None:
     log_file = logs_dir / log_filename
 
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(getattr(logging, settings.log_level.upper()))
+    file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
 
-    root_logger.addHandler(file_handler)
+    if settings.log_queue_enabled:
+        log_queue = queue.Queue(maxsize=settings.log_queue_size)
+        root_logger.addHandler(DroppingQueueHandler(log_queue))
+        _listener = QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        _listener.start()
+        atexit.register(shutdown_logging)
+    else:
+        root_logger.addHandler(console_handler)
+        root_logger.addHandler(file_handler)
 
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-    logging.getLogger("uvicorn.error").setLevel(getattr(logging, settings.log_level.upper()))
+    logging.getLogger("uvicorn.error").setLevel(level)
+
+
+def shutdown_logging() -> None:
+    """Writes out queued records and stops the listener thread, if running."""
+    global _listener
+
+    if _listener:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def log_queue_stats() -> dict[str, int]:
+    """Returns depth and dropped records of the log queue, or nothing when it is disabled."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, DroppingQueueHandler):
+            return {"depth": handler.queue.qsize(), "dropped": handler.dropped}
+    return {}
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -0,0 +1,287 @@
+"""
+Process-local metrics with Prometheus text exposition.
+Every worker periodically writes a snapshot of its metrics to a shared directory;
+whichever worker serves /metrics merges its live values with the other snapshots.
+"""
+import asyncio
+import bisect
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+
+# Upper bounds in seconds, from sub-millisecond cache hits to multi-second queries
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+SNAPSHOT_PREFIX = "metrics-"
+
+# (name, kind, help, labels, value) samples produced by collectors at snapshot time
+Sample = tuple[str, str, str, dict[str, str], float]
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """Adds to the series of the given label values."""
+        self.values[labelvalues] = self.values.get(labelvalues, 0.0) + amount
+
+    def series(self) -> list[list]:
+        """Returns [label values, value] pairs."""
+        return [[list(labels), value] for labels, value in self.values.items()]
+
+
+class _Timer:
+    """Context manager observing the elapsed time into a histogram."""
+
+    __slots__ = ("histogram", "labelvalues", "started")
+
+    def __init__(self, histogram: "Histogram", labelvalues: tuple[str, ...]):
+        self.histogram = histogram
+        self.labelvalues = labelvalues
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, *self.labelvalues)
+
+
+class Histogram:
+    """Histogram with fixed buckets; counts are kept per bucket and made cumulative on export."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # label values -> [per-bucket counts including +Inf, sum, count]
+        self.values: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Records one observation."""
+        series = self.values.get(labelvalues)
+        if series is None:
+            series = self.values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def time(self, *labelvalues: str) -> _Timer:
+        """Returns a context manager that observes its duration."""
+        return _Timer(self, labelvalues)
+
+    def series(self) -> list[list]:
+        """Returns [label values, [bucket counts, sum, count]] pairs."""
+        return [
+            [list(labels), [list(counts), total, count]]
+            for labels, (counts, total, count) in self.values.items()
+        ]
+
+
+class MetricsRegistry:
+    """Holds the metrics and collectors of one process."""
+
+    def __init__(self):
+        self.metrics: dict[str, Any] = {}
+        self.collectors: list[Callable[[], Iterable[Sample]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Returns the counter with this name, creating it on first use."""
+        if name not in self.metrics:
+            self.metrics[name] = Counter(name, documentation, labelnames)
+        return self.metrics[name]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS
+    ) -> Histogram:
+        """Returns the histogram with this name, creating it on first use."""
+        if name not in self.metrics:
+            self.metrics[name] = Histogram(name, documentation, labelnames, buckets)
+        return self.metrics[name]
+
+    def register_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """Adds a callable producing gauge or counter samples when a snapshot is taken."""
+        self.collectors.append(collector)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns a JSON-serializable view of all metrics and collector samples."""
+        families = {
+            name: {
+                "kind": metric.kind,
+                "help": metric.documentation,
+                "labelnames": list(metric.labelnames),
+                "buckets": list(getattr(metric, "buckets", ())),
+                "series": metric.series(),
+            }
+            for name, metric in self.metrics.items()
+        }
+
+        for collector in self.collectors:
+            for name, kind, documentation, labels, value in collector():
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    continue
+                family = families.setdefault(name, {
+                    "kind": kind,
+                    "help": documentation,
+                    "labelnames": sorted(labels),
+                    "buckets": [],
+                    "series": [],
+                })
+                family["series"].append([[labels[k] for k in family["labelnames"]], value])
+
+        return {"pid": os.getpid(), "time": time.time(), "metrics": families}
+
+
+registry = MetricsRegistry()
+
+# Stages of an auction; the use case times its own stages and the bidding
+# repository times the persist writes within them
+AUCTION_STAGE_SECONDS = registry.histogram(
+    "auction_stage_duration_seconds", "Duration of each stage of an auction", ("stage",)
+)
+
+
+def write_snapshot(directory: str, snapshot: Optional[dict[str, Any]] = None) -> None:
+    """Atomically writes this process's snapshot to the shared directory."""
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    target = path / f"{SNAPSHOT_PREFIX}{os.getpid()}.json"
+    temporary = target.with_name(target.name + ".tmp")
+    temporary.write_text(json.dumps(snapshot or registry.snapshot(), separators=(",", ":")))
+    os.replace(temporary, target)
+
+
+async def run_snapshot_loop(directory: str, interval_seconds: float) -> None:
+    """
+    Writes snapshots periodically until cancelled, then once more.
+    Metrics are read on the event loop, which is the only thread updating them.
+    """
+    try:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await asyncio.to_thread(write_snapshot, directory, registry.snapshot())
+    finally:
+        write_snapshot(directory)
+
+
+def reset_snapshots(directory: str) -> None:
+    """Removes snapshots of earlier runs; called once before workers start."""
+    path = Path(directory)
+    if path.exists():
+        for snapshot in path.glob(f"{SNAPSHOT_PREFIX}*"):
+            snapshot.unlink(missing_ok=True)
+
+
+def render_metrics(
+    directory: Optional[str] = None,
+    gauge_max_age_seconds: float = 30.0,
+    snapshot: Optional[dict[str, Any]] = None
+) -> str:
+    """
+    Renders metrics of all workers in the Prometheus text format.
+    Counters and histograms are summed across workers, including exited ones;
+    gauges carry a pid label and are dropped once a worker stops refreshing them.
+    """
+    snapshots = [snapshot or registry.snapshot()]
+    if directory and Path(directory).exists():
+        own = f"{SNAPSHOT_PREFIX}{os.getpid()}.json"
+        for path in Path(directory).glob(f"{SNAPSHOT_PREFIX}*.json"):
+            if path.name == own:
+                continue
+            try:
+                snapshots.append(json.loads(path.read_text()))
+            except (OSError, ValueError):
+                continue
+
+    now = time.time()
+    merged: dict[str, dict[str, Any]] = {}
+    for snapshot in snapshots:
+        gauges_fresh = now - snapshot["time"] <= gauge_max_age_seconds
+        for name, family in snapshot["metrics"].items():
+            target = merged.setdefault(name, {**family, "series": {}})
+            for labelvalues, value in family["series"]:
+                if family["kind"] == "gauge":
+                    if not gauges_fresh:
+                        continue
+                    key = (*labelvalues, str(snapshot["pid"]))
+                    target["series"][key] = value
+                elif family["kind"] == "histogram":
+                    key = tuple(labelvalues)
+                    counts, total, count = target["series"].get(key, [[0] * len(value[0]), 0.0, 0])
+                    target["series"][key] = [
+                        [a + b for a, b in zip(counts, value[0])], total + value[1], count + value[2]
+                    ]
+                else:
+                    key = tuple(labelvalues)
+                    target["series"][key] = target["series"].get(key, 0.0) + value
+
+    lines = []
+    for name in sorted(merged):
+        family = merged[name]
+        labelnames = family["labelnames"]
+        if family["kind"] == "gauge":
+            labelnames = [*labelnames, "pid"]
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['kind']}")
+
+        for labelvalues, value in sorted(family["series"].items()):
+            labels = list(zip(labelnames, labelvalues))
+            if family["kind"] != "histogram":
+                lines.append(f"{name}{_labels(labels)} {_number(value)}")
+                continue
+
+            counts, total, count = value
+            cumulative = 0
+            for bound, bucket_count in zip([*family["buckets"], math.inf], counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == math.inf else repr(float(bound))
+                lines.append(f"{name}_bucket{_labels([*labels, ('le', le)])} {cumulative}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(total)}")
+            lines.append(f"{name}_count{_labels(labels)} {count}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _labels(labels: list[tuple[str, str]]) -> str:
+    """Formats a label set, escaping values as the exposition format requires."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _escape(value: Any) -> str:
+    """Escapes a label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    """Formats a sample value."""
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -33,6 +33,19 @@ class Settings(BaseSettings):
     read_replica_database_url: str | None = None
     async_read_replica_database_url: str | None = None
 
+    # Connection Pool Configuration (applies to primary and read replica engines)
+    db_pool_enabled: bool = True
+    # Derived from db_max_connections and web_concurrency when not set
+    db_pool_size: int | None = None
+    db_max_overflow: int = 5
+    db_pool_timeout_seconds: float = 5.0
+    db_pool_pre_ping: bool = True
+    db_pool_recycle_seconds: int = 1800
+    db_statement_cache_size: int = 100
+    db_max_connections: int = 100
+    db_reserved_connections: int = 10
+    web_concurrency: int = 1
+
     redis_url: str | None = None
     redis_host: str = "redis"
     redis_port: int = 6379
@@ -45,9 +58,34 @@ class Settings(BaseSettings):
     cors_origins: str = "http://localhost:3000,http://localhost:8000"
 
     log_level: str = "INFO"
+    # Handlers run on a background thread fed by a bounded queue; records are
+    # dropped rather than blocking when it is full
+    log_queue_enabled: bool = True
+    log_queue_size: int = 10000
+    # Share of successful auctions whose per-bid details are logged; failures always are
+    auction_log_sample_rate: float = 0.01
 
     rate_limit_max_requests: int = 3
     rate_limit_window_seconds: int = 60
+    # One of: fixed_window, sliding_window, token_bucket; fixed_window is the
+    # baseline behaviour and the other two are opt-in
+    rate_limit_algorithm: str = "fixed_window"
+    # Extra windows enforced together with the one above, e.g. "5/1,100/3600"
+    rate_limit_extra_windows: str = ""
+    # Local tier: per-worker leases of the primary window's quota; it requires the
+    # fixed_window algorithm and no extra windows
+    rate_limit_local_tier_enabled: bool = False
+    rate_limit_local_max_keys: int = 100000
+    # Largest share of a key's limit one worker may lease at once (accuracy bound)
+    rate_limit_local_lease_fraction: float = 0.1
+    # Smallest lease; with the defaults above (3 requests, 0.1) a lease is 1 token,
+    # so every request goes to Redis unless this is raised
+    rate_limit_local_min_lease: int = 1
+    rate_limit_local_sync_seconds: float = 1.0
+    # Micro-batching: concurrent checks share one Redis pipeline
+    rate_limit_batching_enabled: bool = False
+    rate_limit_batch_window_ms: float = 1.0
+    rate_limit_batch_max_size: int = 64
 
     min_bid_price: float = 0.01
     max_bid_price: float = 1.00
@@ -55,6 +93,115 @@ class Settings(BaseSettings):
 
     bidder_min_latency_ms: int = 10
     bidder_max_latency_ms: int = 100
+    bidder_simulate_latency: bool = False
+
+    # Auction Fan-out Configuration
+    auction_concurrent_fan_out: bool = True
+
+    # Eligibility Cache Configuration
+    eligibility_cache_enabled: bool = True
+    eligibility_cache_max_size: int = 10000
+    eligibility_cache_ttl_seconds: int = 300
+
+    # Supply Registry Configuration
+    supply_registry_enabled: bool = True
+    supply_registry_refresh_seconds: int = 30
+    supply_negative_cache_size: int = 10000
+    supply_negative_cache_ttl_seconds: int = 60
+    # Unknown supplies are answered with 400 (no eligible bidders) without being inserted;
+    # set False to answer them with 404
+    supply_auto_create: bool = True
+
+    # Write-behind Persistence Configuration
+    write_behind_enabled: bool = False
+    write_behind_queue_size: int = 10000
+    write_behind_batch_size: int = 500
+    write_behind_flush_interval_ms: int = 200
+    # Failed batches are retried, then written record by record; records that still
+    # fail are spilled to journal_dir, where the journal loader replays them
+    write_behind_max_retries: int = 3
+    write_behind_retry_backoff_ms: int = 100
+
+    # Auction Journal Configuration
+    journal_enabled: bool = False
+    journal_dir: str = "/app/journal"
+    journal_segment_max_bytes: int = 64 * 1024 * 1024
+    journal_segment_max_age_seconds: int = 60
+    journal_buffer_bytes: int = 256 * 1024
+    journal_flush_interval_ms: int = 100
+    journal_fsync: bool = False
+    journal_stale_segment_seconds: int = 600
+    journal_loader_interval_seconds: int = 5
+    # Segments that fail to decode or violate constraints are moved here
+    journal_quarantine_dir: str = "/app/journal/quarantine"
+
+    # Auction Event Log Configuration
+    # One JSON line per auction with all bids, in per-worker segments under the directory
+    auction_event_log_enabled: bool = False
+    auction_event_log_dir: str = "/app/logs/auctions"
+    auction_event_log_segment_max_bytes: int = 64 * 1024 * 1024
+    auction_event_log_segment_max_age_seconds: int = 300
+    auction_event_log_buffer_bytes: int = 256 * 1024
+    auction_event_log_flush_interval_ms: int = 500
+    # Sealed segments are replaced by .jsonl.gz files
+    auction_event_log_compress: bool = True
+
+    # Auction Partitioning Configuration
+    # auctions and bids are range-partitioned by UTC day of created_at
+    partition_premake_days: int = 7
+    # Days of raw auctions and bids kept; older partitions are removed whole, 0 keeps all
+    partition_retention_days: int = 90
+    # One of: detach (leave expired partitions as standalone tables), drop
+    partition_retention_mode: str = "detach"
+    partition_maintenance_interval_seconds: int = 3600
+
+    # Stats Configuration
+    # One of: rollup (counter tables fed by each worker), redis (hash counters per supply),
+    # raw (aggregate auctions and bids). The redis backend only lists supplies that had
+    # an auction or were backfilled with `manage.py backfill-redis-stats`
+    stats_backend: str = "rollup"
+    stats_rollup_flush_seconds: float = 2.0
+    stats_rebuild_chunk_size: int = 50000
+    stats_rebuild_workers: int = 4
+    # Per-minute buckets, downsampled into hourly buckets after the retention period
+    stats_buckets_enabled: bool = True
+    stats_minute_bucket_retention_hours: int = 48
+    stats_downsample_interval_seconds: int = 300
+
+    # Stats Cache Configuration
+    stats_cache_enabled: bool = True
+    stats_cache_ttl_seconds: float = 2.0
+    # How long past the TTL a result is still served while it is recomputed
+    stats_cache_stale_seconds: float = 30.0
+    stats_cache_max_entries: int = 64
+
+    # Dependency Container Configuration
+    # Implementations as "module:attribute" import paths, called like the defaults:
+    # the bid generator and (possibly async) rate limiter factories once per worker,
+    # the repository factories once per request with its session
+    container_bid_generator: str = "domain.bidding:SimpleBidGenerator"
+    container_rate_limiter: str = "infrastructure.rate_limiter:build_rate_limiter"
+    container_bidding_repository: str = "infrastructure.repositories:BiddingRepository"
+    container_stats_repository: str = "infrastructure.repositories:StatsRepository"
+
+    # Metrics Configuration
+    metrics_enabled: bool = True
+    # Shared by all workers of one host; cleared by entrypoint.sh before they start
+    metrics_dir: str = "/tmp/bidding-metrics"
+    metrics_snapshot_interval_seconds: float = 5.0
+    # Gauges of workers that stopped writing snapshots are dropped after this long
+    metrics_gauge_max_age_seconds: float = 30.0
+
+    # Tracing Configuration
+    # Traced requests get a Server-Timing header; only the sampled share is exported
+    tracing_enabled: bool = False
+    tracing_sample_rate: float = 0.01
+    tracing_exporter: str = "file"  # "file" or "otlp"
+    tracing_dir: str = "/app/logs/traces"
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    tracing_service_name: str = "bidding-api"
+    tracing_queue_size: int = 1000
+    tracing_batch_size: int = 64
 
     def model_post_init(self, __context: Any) -> None:
         if not self.database_url:
@@ -95,6 +242,33 @@ class Settings(BaseSettings):
         """Returns allowed hosts as a list."""
         return [host.strip() for host in self.allowed_hosts.split(",")]
 
+    @property
+    def db_pool_limits(self) -> tuple[int, int]:
+        """
+        Returns (pool_size, max_overflow) for one worker's engine.
+        Keeps the total across all workers under db_max_connections.
+        """
+        per_worker = max(
+            1,
+            (self.db_max_connections - self.db_reserved_connections) // max(1, self.web_concurrency)
+        )
+        if self.db_pool_size is not None:
+            pool_size = min(self.db_pool_size, per_worker)
+        else:
+            pool_size = max(1, per_worker - self.db_max_overflow)
+        max_overflow = max(0, min(self.db_max_overflow, per_worker - pool_size))
+        return pool_size, max_overflow
+
+    @property
+    def rate_limit_extra_windows_list(self) -> list[tuple[int, int]]:
+        """Returns extra rate limit windows as (max_requests, window_seconds) pairs."""
+        windows = []
+        for window in self.rate_limit_extra_windows.split(","):
+            if window.strip():
+                max_requests, window_seconds = window.split("/")
+                windows.append((int(max_requests), int(window_seconds)))
+        return windows
+
 
 @lru_cache
 def get_settings() -> Settings:
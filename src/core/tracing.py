@@ -0,0 +1,173 @@
+"""
+Request tracing with head-based sampling.
+A trace is started per request by the tracing middleware and code marks its stages
+and I/O calls with span(). Every traced request sums durations by timing key for its
+Server-Timing header; only sampled requests keep their spans for export.
+Tasks inherit the trace of the request that created them, so tasks that may outlive
+it are started in detached_context(); spans ending after the request are dropped.
+"""
+import os
+import random
+import time
+from contextvars import Context, ContextVar, copy_context
+from typing import Any, Optional
+
+
+class Span:
+    """Finished span of a sampled trace."""
+
+    __slots__ = ("name", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(
+        self,
+        name: str,
+        span_id: str,
+        parent_id: Optional[str],
+        start_ns: int,
+        end_ns: int,
+        attributes: dict[str, Any],
+        error: Optional[str] = None
+    ):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_ns = start_ns
+        self.end_ns = end_ns
+        self.attributes = attributes
+        self.error = error
+
+
+class Trace:
+    """Spans and per-key timings of one request."""
+
+    __slots__ = ("trace_id", "parent_id", "sampled", "started_ns", "spans", "timings", "finished")
+
+    def __init__(self, trace_id: str, parent_id: Optional[str], sampled: bool):
+        self.trace_id = trace_id
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.started_ns = time.time_ns()
+        self.spans: list[Span] = []
+        # timing key -> total milliseconds
+        self.timings: dict[str, float] = {}
+        # Set once the request is done; the trace may then be read by the exporter
+        self.finished = False
+
+    def server_timing(self) -> str:
+        """Formats the timings, followed by the time elapsed so far, as a Server-Timing value."""
+        entries = [f"{key};dur={ms:.2f}" for key, ms in self.timings.items()]
+        entries.append(f"total;dur={(time.time_ns() - self.started_ns) / 1e6:.2f}")
+        return ", ".join(entries)
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span_id: ContextVar[Optional[str]] = ContextVar("current_span_id", default=None)
+
+
+def new_id(size: int) -> str:
+    """Returns a random hex ID of the given number of bytes."""
+    return os.urandom(size).hex()
+
+
+def start_trace(sample_rate: float, traceparent: Optional[str] = None) -> Trace:
+    """
+    Starts a trace for the current context.
+    A valid W3C traceparent header continues the caller's trace and sampling decision;
+    otherwise the request is sampled with the given probability.
+    """
+    parts = traceparent.split("-") if traceparent else ()
+    if len(parts) == 4 and len(parts[1]) == 32 and len(parts[2]) == 16 and len(parts[3]) == 2:
+        try:
+            trace = Trace(parts[1], parts[2], bool(int(parts[3], 16) & 1))
+        except ValueError:
+            trace = Trace(new_id(16), None, random.random() < sample_rate)
+    else:
+        trace = Trace(new_id(16), None, random.random() < sample_rate)
+
+    _current_trace.set(trace)
+    _current_span_id.set(trace.parent_id)
+    return trace
+
+
+def end_trace() -> None:
+    """Finishes the current trace and detaches it from the current context."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.finished = True
+    _current_trace.set(None)
+    _current_span_id.set(None)
+
+
+def detached_context() -> Context:
+    """Returns a copy of the current context without the trace, for tasks that may outlive it."""
+    context = copy_context()
+    context.run(_current_trace.set, None)
+    context.run(_current_span_id.set, None)
+    return context
+
+
+def current_trace() -> Optional[Trace]:
+    """Returns the trace of the current request, if tracing is enabled."""
+    return _current_trace.get()
+
+
+def is_sampled() -> bool:
+    """Tells whether spans of the current request are kept."""
+    trace = _current_trace.get()
+    return trace is not None and trace.sampled
+
+
+class span:
+    """
+    Context manager timing a block within the current trace.
+    Durations are added to the trace's timings under `timing`, if given;
+    outside a trace it does nothing.
+    """
+
+    __slots__ = ("name", "timing", "attributes", "trace", "span_id", "parent_id", "start_ns", "token")
+
+    def __init__(self, name: str, timing: Optional[str] = None, **attributes: Any):
+        self.name = name
+        self.timing = timing
+        self.attributes = attributes
+
+    def set(self, **attributes: Any) -> None:
+        """Adds attributes known only once the block has run."""
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "span":
+        trace = _current_trace.get()
+        self.trace = trace if trace is not None and not trace.finished else None
+        if self.trace is not None:
+            self.start_ns = time.time_ns()
+            if self.trace.sampled:
+                self.span_id = new_id(8)
+                self.parent_id = _current_span_id.get()
+                self.token = _current_span_id.set(self.span_id)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        trace = self.trace
+        if trace is None:
+            return
+
+        if trace.sampled:
+            _current_span_id.reset(self.token)
+        if trace.finished:
+            return
+
+        end_ns = time.time_ns()
+        if self.timing:
+            trace.timings[self.timing] = (
+                trace.timings.get(self.timing, 0.0) + (end_ns - self.start_ns) / 1e6
+            )
+        if trace.sampled:
+            trace.spans.append(Span(
+                self.name,
+                self.span_id,
+                self.parent_id,
+                self.start_ns,
+                end_ns,
+                self.attributes,
+                exc_type.__name__ if exc_type else None
+            ))
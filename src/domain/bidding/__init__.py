@@ -1,4 +1,12 @@
-from .entities import Supply, Bidder, Bid, AuctionRequest, AuctionResult
+from .entities import (
+    Supply,
+    Bidder,
+    Bid,
+    AuctionRequest,
+    AuctionResult,
+    AuctionRecord,
+    RateLimitDecision,
+)
 from .exceptions import (
     DomainException,
     SupplyNotFoundException,
@@ -6,5 +14,5 @@ from .exceptions import (
     NoBidsReceivedException,
     RateLimitExceededException,
 )
-from .interfaces import IBiddingRepository, IRateLimiter, IBidGenerator
+from .interfaces import IBiddingRepository, IRateLimiter, IBidGenerator, IAuctionWriter
 from .services import AuctionService, SimpleBidGenerator
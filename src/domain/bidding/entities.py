@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 @dataclass
@@ -88,6 +88,20 @@ class AuctionRequest:
         self.country = self.country.upper()
 
 
+@dataclass
+class RateLimitDecision:
+    """Represents the outcome of a rate limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_seconds: float
+
+    def __post_init__(self):
+        if self.remaining < 0:
+            self.remaining = 0
+
+
 @dataclass
 class AuctionResult:
     """Represents the result of an auction execution."""
@@ -97,9 +111,44 @@ class AuctionResult:
     all_bids: list[Bid]
     supply_id: str
     country: str
+    rate_limit: Optional[RateLimitDecision] = None
 
     def __post_init__(self):
         if not self.winner_bidder_id:
             raise ValueError('Winner bidder ID cannot be empty')
         if self.winning_price <= 0:
             raise ValueError('Winning price must be positive')
+
+
+@dataclass
+class AuctionRecord:
+    """Represents a finished auction with all of its bids, ready to be persisted."""
+
+    supply_id: str
+    ip_address: str
+    country: str
+    bids: list[Bid]
+    winner_bidder_id: Optional[str] = None
+    winning_price: Optional[float] = None
+    tmax: Optional[int] = None
+    created_at: datetime = field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
+
+    @classmethod
+    def from_auction(
+        cls,
+        request: AuctionRequest,
+        bids: list[Bid],
+        result: Optional[AuctionResult] = None
+    ) -> "AuctionRecord":
+        """Builds a record from the request and the (possibly failed) auction outcome."""
+        return cls(
+            supply_id=request.supply_id,
+            ip_address=request.ip_address,
+            country=request.country,
+            bids=bids,
+            winner_bidder_id=result.winner_bidder_id if result else None,
+            winning_price=result.winning_price if result else None,
+            tmax=request.tmax
+        )
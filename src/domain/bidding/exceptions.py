@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class DomainException(Exception):
     """Represents base exception for all domain-level errors."""
     pass
@@ -36,10 +39,17 @@ class NoBidsReceivedException(DomainException):
 class RateLimitExceededException(DomainException):
     """Raised when rate limit is exceeded for an IP address."""
 
-    def __init__(self, ip_address: str, limit: int, window_seconds: int):
+    def __init__(
+        self,
+        ip_address: str,
+        limit: int,
+        window_seconds: int,
+        retry_after: Optional[float] = None
+    ):
         self.ip_address = ip_address
         self.limit = limit
         self.window_seconds = window_seconds
+        self.retry_after = retry_after
         super().__init__(
             f"Rate limit exceeded for IP '{ip_address}': "
             f"max {limit} requests per {window_seconds} seconds"
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional
-from .entities import Supply, Bidder, Bid, AuctionResult
+from .entities import Supply, Bidder, Bid, AuctionResult, AuctionRecord, RateLimitDecision
 
 
 class IBiddingRepository(ABC):
@@ -12,8 +12,8 @@ class IBiddingRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_or_create_supply(self, supply_id: str, name: Optional[str] = None) -> Supply:
-        """Gets existing supply or creates a new one."""
+    async def get_or_create_supply(self, supply_id: str, name: Optional[str] = None) -> Optional[Supply]:
+        """Gets existing supply or creates a new one when the policy allows it."""
         pass
 
     @abstractmethod
@@ -38,6 +38,11 @@ class IBiddingRepository(ABC):
         """Saves all bids for an auction."""
         pass
 
+    @abstractmethod
+    async def save_auction_with_bids(self, record: AuctionRecord) -> int:
+        """Saves auction together with all of its bids and returns auction ID."""
+        pass
+
 
 class IRateLimiter(ABC):
     """Defines abstract rate limiter interface."""
@@ -52,6 +57,16 @@ class IRateLimiter(ABC):
         """Checks if request is within rate limit."""
         pass
 
+    @abstractmethod
+    async def check_rate_limit_detailed(
+        self,
+        key: str,
+        max_requests: Optional[int] = None,
+        window_seconds: Optional[int] = None
+    ) -> RateLimitDecision:
+        """Checks rate limit and returns remaining quota and reset time."""
+        pass
+
     @abstractmethod
     async def initialize(self) -> None:
         """Initializes the rate limiter (e.g., connect to Redis)."""
@@ -74,3 +89,22 @@ class IBidGenerator(ABC):
     ) -> Bid:
         """Generates a bid for a bidder."""
         pass
+
+
+class IAuctionWriter(ABC):
+    """Defines abstract writer that persists auction records off the request path."""
+
+    @abstractmethod
+    async def submit(self, record: AuctionRecord) -> None:
+        """Accepts an auction record for persistence."""
+        pass
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Starts background persistence."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Persists everything accepted so far and stops background work."""
+        pass
@@ -1,17 +1,31 @@
+import asyncio
 import random
+import time
 from typing import Optional
 
+from core.logging import get_logger
 from core.settings import get_settings
+from core.tracing import is_sampled, span
 from .entities import Bid, Bidder, AuctionResult
 from .exceptions import NoBidsReceivedException
 from .interfaces import IBidGenerator
 
 
+logger = get_logger(__name__)
+
+
 class AuctionService:
     """Provides domain service for auction business logic."""
 
-    def __init__(self, bid_generator: IBidGenerator):
+    def __init__(
+            self,
+            bid_generator: IBidGenerator,
+            concurrent_fan_out: Optional[bool] = None
+    ):
         self.bid_generator = bid_generator
+        if concurrent_fan_out is None:
+            concurrent_fan_out = get_settings().auction_concurrent_fan_out
+        self.concurrent_fan_out = concurrent_fan_out
 
     async def run_auction(
             self,
@@ -24,10 +38,10 @@ class AuctionService:
         if not eligible_bidders:
             raise NoBidsReceivedException(supply_id)
 
-        all_bids = []
-        for bidder in eligible_bidders:
-            bid = await self.bid_generator.generate_bid(bidder, tmax)
-            all_bids.append(bid)
+        if self.concurrent_fan_out:
+            all_bids = await self._collect_bids_concurrently(eligible_bidders, tmax)
+        else:
+            all_bids = await self._collect_bids_sequentially(eligible_bidders, tmax)
 
         valid_bids = [bid for bid in all_bids if bid.is_valid]
 
@@ -44,6 +58,85 @@ class AuctionService:
             country=country
         )
 
+    async def _collect_bids_sequentially(
+            self,
+            eligible_bidders: list[Bidder],
+            tmax: Optional[int] = None
+    ) -> list[Bid]:
+        """Requests bids one bidder at a time."""
+        generate_bid = self._bid_generator()
+        all_bids = []
+        for bidder in eligible_bidders:
+            bid = await generate_bid(bidder, tmax)
+            all_bids.append(bid)
+        return all_bids
+
+    async def _collect_bids_concurrently(
+            self,
+            eligible_bidders: list[Bidder],
+            tmax: Optional[int] = None
+    ) -> list[Bid]:
+        """
+        Requests bids from all bidders at once and enforces tmax as a hard deadline.
+        Bidders that have not answered by the deadline are recorded as timed out,
+        bidders that failed as no-bids, so one bidder cannot fail the auction.
+        """
+        generate_bid = self._bid_generator()
+        started = time.perf_counter()
+        finished: dict[asyncio.Task, float] = {}
+        tasks = [
+            asyncio.create_task(generate_bid(bidder, tmax))
+            for bidder in eligible_bidders
+        ]
+        for task in tasks:
+            task.add_done_callback(lambda done: finished.setdefault(done, time.perf_counter()))
+        timeout = tmax / 1000 if tmax else None
+
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        all_bids = []
+        for bidder, task in zip(eligible_bidders, tasks):
+            if task in pending:
+                all_bids.append(Bid(
+                    bidder_id=bidder.id,
+                    price=None,
+                    latency_ms=tmax,
+                    timed_out=True
+                ))
+            elif task.exception() is not None:
+                logger.warning(
+                    "Bidder %s failed to bid: %r", bidder.id, task.exception()
+                )
+                all_bids.append(Bid(
+                    bidder_id=bidder.id,
+                    price=None,
+                    latency_ms=int((finished.get(task, time.perf_counter()) - started) * 1000)
+                ))
+            else:
+                all_bids.append(task.result())
+        return all_bids
+
+    def _bid_generator(self):
+        """Returns generate_bid, wrapped in a span per bidder when the request is sampled."""
+        if not is_sampled():
+            return self.bid_generator.generate_bid
+        return self._generate_bid_traced
+
+    async def _generate_bid_traced(self, bidder: Bidder, tmax: Optional[int] = None) -> Bid:
+        """Requests a bid inside a span; bidders cut off at tmax end as CancelledError."""
+        with span("bidder.generate_bid", bidder_id=bidder.id, tmax=tmax) as bid_span:
+            bid = await self.bid_generator.generate_bid(bidder, tmax)
+            bid_span.set(price=bid.price, latency_ms=bid.latency_ms, timed_out=bid.timed_out)
+        return bid
+
 
 class SimpleBidGenerator(IBidGenerator):
     """Implements simple bid generator with business rules."""
@@ -66,6 +159,9 @@ class SimpleBidGenerator(IBidGenerator):
         if tmax:
             latency_ms = random.randint(self.settings.bidder_min_latency_ms, tmax + 50)
 
+            if self.settings.bidder_simulate_latency:
+                await asyncio.sleep(latency_ms / 1000)
+
             if latency_ms > tmax:
                 return Bid(
                     bidder_id=bidder.id,
@@ -1,4 +1,11 @@
-from .entities import BidderStats, SupplyStats, AllSupplyStats
+from .entities import BidderStats, SupplyStats, AllSupplyStats, StatsQuery
+from .encoder import (
+    BIDDER_ROW,
+    COUNTRY_ROW,
+    SUPPLY_ROW,
+    EncodedStats,
+    StatsJSONWriter,
+)
 from .exceptions import StatsException, StatsNotAvailableException
-from .interfaces import IStatsRepository
+from .interfaces import IStatsRepository, IStatsRecorder
 from .services import StatsService
@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from json.encoder import encode_basestring
+from typing import Iterable, Optional, Sequence
+
+from .entities import REVENUE_DECIMALS
+
+
+# Kinds of statistics rows, in the order they are expected per supply.
+# Rows are (supply_id, kind, key, country_count, wins, total_revenue, no_bids, timeouts);
+# a supply row may carry the supply's total in country_count instead of summing countries.
+SUPPLY_ROW, COUNTRY_ROW, BIDDER_ROW = 0, 1, 2
+
+
+@dataclass(frozen=True)
+class EncodedStats:
+    """JSON body of a statistics response with the facts needed for its headers."""
+
+    body: bytes
+    supplies: int
+    last_supply_id: Optional[str]
+
+
+class StatsJSONWriter:
+    """
+    Encodes statistics rows grouped by supply straight into the JSON body of /stat,
+    with the same shape and revenue rounding as SupplyStats.to_dict.
+    Only the current supply is held apart from the output buffer.
+    """
+
+    def __init__(self):
+        """Initializes writer with an empty JSON object."""
+        self._buffer = bytearray(b"{")
+        self._names: dict[str, str] = {}
+        self._supply_id: Optional[str] = None
+        self._total = 0
+        self._supply_total: Optional[int] = None
+        self._countries: list[str] = []
+        self._bidders: list[str] = []
+        self.supplies = 0
+
+    def write_rows(self, rows: Iterable[Sequence]) -> None:
+        """Appends rows ordered by supply; a supply may span several calls."""
+        name = self._name
+        for supply_id, kind, key, country_count, wins, total_revenue, no_bids, timeouts in rows:
+            if supply_id != self._supply_id:
+                self._write_supply()
+                self._supply_id = supply_id
+
+            if kind == COUNTRY_ROW:
+                self._total += country_count
+                self._countries.append(f"{name(key)}:{country_count}")
+            elif kind == BIDDER_ROW:
+                revenue = round(float(total_revenue), REVENUE_DECIMALS)
+                self._bidders.append(
+                    f'{name(key)}:{{"wins":{wins},"total_revenue":{revenue!r},'
+                    f'"no_bids":{no_bids},"timeouts":{timeouts}}}'
+                )
+            elif country_count is not None:
+                self._supply_total = country_count
+
+    def finish(self) -> EncodedStats:
+        """Closes the JSON object and returns the encoded body."""
+        last_supply_id = self._supply_id
+        self._write_supply()
+        self._buffer += b"}"
+        return EncodedStats(
+            body=bytes(self._buffer),
+            supplies=self.supplies,
+            last_supply_id=last_supply_id
+        )
+
+    def _write_supply(self) -> None:
+        """Appends the current supply's object and starts a new one."""
+        if self._supply_id is None:
+            return
+
+        total = self._supply_total if self._supply_total is not None else self._total
+        supply = (
+            f'{"," if self.supplies else ""}{self._name(self._supply_id)}:'
+            f'{{"total_reqs":{total},'
+            f'"reqs_per_country":{{{",".join(self._countries)}}},'
+            f'"bidders":{{{",".join(self._bidders)}}}}}'
+        )
+        self._buffer += supply.encode("utf-8")
+        self.supplies += 1
+
+        self._supply_id = None
+        self._total = 0
+        self._supply_total = None
+        self._countries = []
+        self._bidders = []
+
+    def _name(self, value: str) -> str:
+        """Returns a JSON string literal, cached because countries and bidders repeat."""
+        encoded = self._names.get(value)
+        if encoded is None:
+            encoded = self._names[value] = encode_basestring(value)
+        return encoded
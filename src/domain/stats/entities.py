@@ -1,4 +1,10 @@
 from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+
+# Decimal places of total_revenue in responses
+REVENUE_DECIMALS = 2
 
 
 @dataclass
@@ -39,7 +45,7 @@ class SupplyStats:
             "bidders": {
                 bidder_id: {
                     "wins": stats.wins,
-                    "total_revenue": round(stats.total_revenue, 2),
+                    "total_revenue": round(stats.total_revenue, REVENUE_DECIMALS),
                     "no_bids": stats.no_bids,
                     "timeouts": stats.timeouts,
                 }
@@ -66,3 +72,32 @@ class AllSupplyStats:
             supply_id: stats.to_dict()
             for supply_id, stats in self.supplies.items()
         }
+
+
+@dataclass(frozen=True)
+class StatsQuery:
+    """Describes filters and keyset pagination over supplies for statistics."""
+
+    supply_ids: Optional[tuple[str, ...]] = None
+    country: Optional[str] = None
+    bidder_id: Optional[str] = None
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    after_supply_id: Optional[str] = None
+    limit: Optional[int] = None
+
+    def __post_init__(self):
+        if self.limit is not None and self.limit < 1:
+            raise ValueError('Limit must be positive')
+        if self.since and self.until and self.since >= self.until:
+            raise ValueError('Time range start must be before its end')
+
+    @property
+    def is_unfiltered(self) -> bool:
+        """Checks if the query selects all statistics of all supplies."""
+        return self == StatsQuery()
+
+    @property
+    def is_time_ranged(self) -> bool:
+        """Checks if the query is restricted to a time range."""
+        return self.since is not None or self.until is not None
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Any, AsyncIterator, Dict, Sequence
+
+from domain.bidding.entities import AuctionRecord
+from .entities import StatsQuery
 
 
 class IStatsRepository(ABC):
@@ -14,3 +17,37 @@ class IStatsRepository(ABC):
     async def get_supply_stats(self, supply_id: str) -> dict[str, Any]:
         """Retrieves statistics for a specific supply."""
         pass
+
+    @abstractmethod
+    async def query_stats(self, query: StatsQuery) -> dict[str, Any]:
+        """Retrieves statistics for one page of supplies matching the filters."""
+        pass
+
+    @abstractmethod
+    def stream_stats(self, query: StatsQuery) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Yields (supply_id, statistics) one supply at a time."""
+        pass
+
+    @abstractmethod
+    def stream_stats_rows(self, query: StatsQuery) -> AsyncIterator[Sequence[Sequence]]:
+        """Yields batches of statistics rows ordered by supply, in the StatsJSONWriter row format."""
+        pass
+
+
+class IStatsRecorder(ABC):
+    """Defines abstract interface for maintaining statistics as auctions complete."""
+
+    @abstractmethod
+    async def record_auction(self, record: AuctionRecord) -> None:
+        """Records counters for a completed auction."""
+        pass
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Starts background work such as periodic flushes."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stops background work and persists pending counters."""
+        pass
@@ -0,0 +1,3 @@
+from .eligibility_cache import EligibilityCache, get_eligibility_cache
+from .supply_registry import SupplyRegistry, get_supply_registry
+from .stats_cache import StatsResultCache, get_stats_cache
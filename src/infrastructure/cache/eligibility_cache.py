@@ -0,0 +1,134 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import get_settings
+from domain.bidding import Bidder
+from infrastructure.db.models.bidding import BidderModel, supply_bidder_association
+
+
+class EligibilityCache:
+    """
+    In-process LRU cache with TTL for eligible bidders.
+    Keyed by (supply_id, country) and holds domain Bidder entities.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        """Initializes empty cache with size and TTL bounds."""
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list[Bidder]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, supply_id: str, country: str) -> Optional[list[Bidder]]:
+        """Returns cached bidders or None if missing or expired."""
+        key = (supply_id, country)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, bidders = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return list(bidders)
+
+    def set(self, supply_id: str, country: str, bidders: list[Bidder]) -> None:
+        """Stores bidders for the key, evicting least recently used entries."""
+        key = (supply_id, country)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, list(bidders))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(
+        self,
+        supply_id: Optional[str] = None,
+        country: Optional[str] = None
+    ) -> None:
+        """Drops entries matching the given supply and/or country."""
+        if supply_id is None and country is None:
+            self.clear()
+            return
+
+        stale_keys = [
+            key for key in self._entries
+            if (supply_id is None or key[0] == supply_id)
+            and (country is None or key[1] == country)
+        ]
+        for key in stale_keys:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drops all entries."""
+        self._entries.clear()
+
+    async def warm_up(self, session: AsyncSession) -> int:
+        """
+        Preloads eligible bidders for the (supply, country) pairs that have any,
+        up to max_size pairs. Rows are read grouped by pair, so reading stops
+        as soon as the cache would start evicting what it just loaded.
+        """
+        result = await session.stream(
+            select(supply_bidder_association.c.supply_id, BidderModel)
+            .join(BidderModel, BidderModel.id == supply_bidder_association.c.bidder_id)
+            .order_by(supply_bidder_association.c.supply_id, BidderModel.country)
+        )
+
+        eligible: dict[tuple[str, str], list[Bidder]] = {}
+        async for supply_id, bidder in result:
+            key = (supply_id, bidder.country)
+            if key not in eligible and len(eligible) >= self.max_size:
+                break
+            eligible.setdefault(key, []).append(
+                Bidder(id=bidder.id, country=bidder.country, name=bidder.name)
+            )
+        await result.close()
+
+        for (supply_id, country), bidders in eligible.items():
+            self.set(supply_id, country, bidders)
+
+        return len(eligible)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Returns hit/miss counters and current size."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+_eligibility_cache: Optional[EligibilityCache] = None
+
+
+def get_eligibility_cache() -> Optional[EligibilityCache]:
+    """Returns singleton eligibility cache, or None when caching is disabled."""
+    global _eligibility_cache
+
+    settings = get_settings()
+    if not settings.eligibility_cache_enabled:
+        return None
+
+    if not _eligibility_cache:
+        _eligibility_cache = EligibilityCache(
+            max_size=settings.eligibility_cache_max_size,
+            ttl_seconds=settings.eligibility_cache_ttl_seconds
+        )
+
+    return _eligibility_cache
@@ -0,0 +1,138 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from core.logging import get_logger
+from core.settings import get_settings
+from core.tracing import detached_context
+
+
+logger = get_logger(__name__)
+
+
+class StatsResultCache:
+    """
+    In-process single-flight cache for computed statistics.
+    Fresh entries are served directly. Entries past the TTL but within the stale
+    window are served while one background task recomputes them; anything older
+    waits for the recomputation. At most one load per key runs at a time and
+    concurrent callers share its result.
+    """
+
+    def __init__(self, ttl_seconds: float, stale_seconds: float, max_entries: int):
+        """Initializes empty cache with freshness and size bounds."""
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._loads: dict[Hashable, asyncio.Task] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_errors = 0
+
+    async def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, float]:
+        """Returns (value, age in seconds) for the key, loading it when needed."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            loaded_at, value = entry
+            age = time.monotonic() - loaded_at
+            if age < self.ttl_seconds:
+                self.hits += 1
+                return value, age
+            if age < self.ttl_seconds + self.stale_seconds:
+                self.stale_hits += 1
+                self._load(key, loader, detached=True)
+                return value, age
+
+        self.misses += 1
+        # Shielded so that a disconnecting client does not cancel the shared load;
+        # the age comes from the load since its entry may be evicted by then
+        value, loaded_at = await asyncio.shield(self._load(key, loader))
+        return value, time.monotonic() - loaded_at
+
+    def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        detached: bool = False
+    ) -> asyncio.Task:
+        """
+        Returns the in-flight load for the key, starting one if none is running.
+        Detached loads are background refreshes and are not traced as part of the
+        request that triggered them.
+        """
+        task = self._loads.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._run_loader(key, loader),
+                context=detached_context() if detached else None
+            )
+            # Background refreshes have no awaiter; the failure is already logged
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._loads[key] = task
+        return task
+
+    async def _run_loader(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, float]:
+        """Runs the loader, stores its result and returns it with its load time."""
+        self.loads += 1
+        try:
+            value = await loader()
+        except Exception as e:
+            self.load_errors += 1
+            logger.error(f"Stats cache load failed: {str(e)}")
+            raise
+        finally:
+            del self._loads[key]
+
+        loaded_at = time.monotonic()
+        self._entries[key] = (loaded_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value, loaded_at
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Returns cache counters."""
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._loads),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "load_errors": self.load_errors,
+        }
+
+
+_stats_cache: Optional[StatsResultCache] = None
+
+
+def get_stats_cache() -> Optional[StatsResultCache]:
+    """Returns singleton stats result cache, or None when caching is disabled."""
+    global _stats_cache
+
+    settings = get_settings()
+    if not settings.stats_cache_enabled:
+        return None
+
+    if not _stats_cache:
+        _stats_cache = StatsResultCache(
+            ttl_seconds=settings.stats_cache_ttl_seconds,
+            stale_seconds=settings.stats_cache_stale_seconds,
+            max_entries=settings.stats_cache_max_entries
+        )
+
+    return _stats_cache
@@ -0,0 +1,135 @@
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.logging import get_logger
+from core.settings import get_settings
+from infrastructure.db.models.bidding import SupplyModel
+
+
+logger = get_logger(__name__)
+
+
+class SupplyRegistry:
+    """
+    In-memory set of known supply IDs with a bounded negative cache.
+    Known supplies are answered without touching the database.
+    """
+
+    # Overlap applied to the refresh watermark so rows committed late are not missed
+    REFRESH_OVERLAP = timedelta(seconds=60)
+
+    def __init__(self, negative_cache_size: int, negative_ttl_seconds: int):
+        """Initializes empty registry with negative cache bounds."""
+        self.negative_cache_size = negative_cache_size
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._known: set[str] = set()
+        self._missing: OrderedDict[str, float] = OrderedDict()
+        self._watermark: Optional[datetime] = None
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    def is_known(self, supply_id: str) -> bool:
+        """Checks if supply is registered as existing."""
+        if supply_id in self._known:
+            self.hits += 1
+            return True
+        return False
+
+    def is_known_missing(self, supply_id: str) -> bool:
+        """Checks if supply was recently looked up and not found."""
+        expires_at = self._missing.get(supply_id)
+
+        if expires_at is None:
+            self.misses += 1
+            return False
+
+        if expires_at <= time.monotonic():
+            del self._missing[supply_id]
+            self.misses += 1
+            return False
+
+        self.negative_hits += 1
+        return True
+
+    def add(self, supply_id: str) -> None:
+        """Registers supply as existing."""
+        self._known.add(supply_id)
+        self._missing.pop(supply_id, None)
+
+    def mark_missing(self, supply_id: str) -> None:
+        """Remembers that supply does not exist, evicting oldest entries."""
+        self._missing[supply_id] = time.monotonic() + self.negative_ttl_seconds
+        self._missing.move_to_end(supply_id)
+
+        while len(self._missing) > self.negative_cache_size:
+            self._missing.popitem(last=False)
+
+    async def refresh(self, session: AsyncSession) -> int:
+        """Loads supplies created since the last refresh (all on first call)."""
+        query = select(SupplyModel.id, SupplyModel.created_at)
+        if self._watermark is not None:
+            query = query.where(
+                SupplyModel.created_at >= self._watermark - self.REFRESH_OVERLAP
+            )
+
+        result = await session.execute(query)
+        rows = result.all()
+
+        for supply_id, created_at in rows:
+            self.add(supply_id)
+            if created_at and (self._watermark is None or created_at > self._watermark):
+                self._watermark = created_at
+
+        return len(rows)
+
+    async def run_refresh_loop(
+        self,
+        session_factory: async_sessionmaker,
+        interval_seconds: int
+    ) -> None:
+        """Refreshes the registry periodically until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                async with session_factory() as session:
+                    await self.refresh(session)
+            except Exception as e:
+                logger.warning(f"Supply registry refresh failed: {str(e)}")
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Returns registry sizes and lookup counters."""
+        return {
+            "known": len(self._known),
+            "missing": len(self._missing),
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+        }
+
+
+_supply_registry: Optional[SupplyRegistry] = None
+
+
+def get_supply_registry() -> Optional[SupplyRegistry]:
+    """Returns singleton supply registry, or None when the registry is disabled."""
+    global _supply_registry
+
+    settings = get_settings()
+    if not settings.supply_registry_enabled:
+        return None
+
+    if not _supply_registry:
+        _supply_registry = SupplyRegistry(
+            negative_cache_size=settings.supply_negative_cache_size,
+            negative_ttl_seconds=settings.supply_negative_cache_ttl_seconds
+        )
+
+    return _supply_registry
@@ -1,4 +1,5 @@
 from .base import Base
+from .pool import pool_stats
 from .session import (
     get_db,
     init_db,
@@ -12,4 +13,5 @@ __all__ = [
     "init_db",
     "close_db",
     "engine",
+    "pool_stats",
 ]
@@ -5,3 +5,10 @@ from infrastructure.db.models.bidding import (
     BidModel,
     supply_bidder_association
 )
+from infrastructure.db.models.journal import JournalSegmentModel
+from infrastructure.db.models.stats import (
+    SupplyCountryStatsModel,
+    SupplyBidderStatsModel,
+    CountryBucketStatsModel,
+    BidderBucketStatsModel,
+)
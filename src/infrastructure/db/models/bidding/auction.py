@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -7,20 +7,33 @@ from infrastructure.db.base import Base
 
 class AuctionModel(Base):
     __tablename__ = 'auctions'
+    # Daily partitions are created and expired by AuctionPartitionManager
+    __table_args__ = (
+        # Covers request counts grouped by (supply_id, country)
+        Index(
+            'ix_auctions_supply_id_country', 'supply_id', 'country',
+            postgresql_include=['winner_bidder_id']
+        ),
+        Index('ix_auctions_created_at_brin', 'created_at', postgresql_using='brin'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     supply_id = Column(
         String,
         ForeignKey('supplies.id'),
-        nullable=False,
-        index=True
+        nullable=False
     )
     ip_address = Column(String, nullable=False)
     country = Column(String(2), nullable=False)
     winner_bidder_id = Column(String, ForeignKey('bidders.id'), nullable=True)
     winning_price = Column(Float, nullable=True)
     tmax = Column(Integer, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now()
+    )
 
     supply = relationship("SupplyModel", back_populates="auctions")
     winner = relationship("BidderModel", foreign_keys=[winner_bidder_id])
@@ -1,4 +1,13 @@
-from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey
+from sqlalchemy import (
+    Column,
+    Integer,
+    Float,
+    String,
+    DateTime,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -7,17 +16,34 @@ from infrastructure.db.base import Base
 
 class BidModel(Base):
     __tablename__ = 'bids'
+    # Bids share their auction's created_at, so both land in partitions of the same day
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ['auction_id', 'created_at'],
+            ['auctions.id', 'auctions.created_at'],
+            name='bids_auction_fkey'
+        ),
+        # Covers the join to auctions and every column the bidder aggregates read
+        Index(
+            'ix_bids_auction_id_created_at', 'auction_id', 'created_at',
+            postgresql_include=['bidder_id', 'price', 'timed_out']
+        ),
+        Index('ix_bids_created_at_brin', 'created_at', postgresql_using='brin'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    auction_id = Column(Integer, ForeignKey(
-        'auctions.id'
-    ), nullable=False, index=True)
+    auction_id = Column(Integer, nullable=False)
     bidder_id = Column(String, ForeignKey('bidders.id'),
                        nullable=False, index=True)
     price = Column(Float, nullable=True)
     latency_ms = Column(Integer, nullable=True)
     timed_out = Column(Integer, default=0)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now()
+    )
 
     auction = relationship("AuctionModel", back_populates="bids")
     bidder = relationship("BidderModel", back_populates="bids")
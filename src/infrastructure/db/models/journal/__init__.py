@@ -0,0 +1 @@
+from .segment import JournalSegmentModel
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Integer, DateTime
+from sqlalchemy.sql import func
+
+from infrastructure.db.base import Base
+
+
+class JournalSegmentModel(Base):
+    __tablename__ = 'journal_segments'
+
+    name = Column(String, primary_key=True)
+    records = Column(Integer, nullable=False)
+    loaded_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<JournalSegment(name={self.name}, records={self.records})>"
@@ -0,0 +1,4 @@
+from .supply_country import SupplyCountryStatsModel
+from .supply_bidder import SupplyBidderStatsModel
+from .country_bucket import CountryBucketStatsModel
+from .bidder_bucket import BidderBucketStatsModel
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, BigInteger, Integer, Float, DateTime
+
+from infrastructure.db.base import Base
+
+
+class BidderBucketStatsModel(Base):
+    __tablename__ = 'stats_bucket_bidder'
+
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    resolution_seconds = Column(Integer, primary_key=True)
+    supply_id = Column(String, primary_key=True)
+    bidder_id = Column(String, primary_key=True)
+    wins = Column(BigInteger, nullable=False, default=0)
+    total_revenue = Column(Float, nullable=False, default=0.0)
+    no_bids = Column(BigInteger, nullable=False, default=0)
+    timeouts = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<BidderBucketStats(bucket_start={self.bucket_start}, "
+            f"supply_id={self.supply_id}, bidder_id={self.bidder_id})>"
+        )
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, BigInteger, Integer, DateTime
+
+from infrastructure.db.base import Base
+
+
+class CountryBucketStatsModel(Base):
+    __tablename__ = 'stats_bucket_country'
+
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    resolution_seconds = Column(Integer, primary_key=True)
+    supply_id = Column(String, primary_key=True)
+    country = Column(String(2), primary_key=True)
+    requests = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<CountryBucketStats(bucket_start={self.bucket_start}, "
+            f"supply_id={self.supply_id}, country={self.country})>"
+        )
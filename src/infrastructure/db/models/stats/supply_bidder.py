@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, BigInteger, Float
+
+from infrastructure.db.base import Base
+
+
+class SupplyBidderStatsModel(Base):
+    __tablename__ = 'stats_supply_bidder'
+
+    supply_id = Column(String, primary_key=True)
+    bidder_id = Column(String, primary_key=True, index=True)
+    wins = Column(BigInteger, nullable=False, default=0)
+    total_revenue = Column(Float, nullable=False, default=0.0)
+    no_bids = Column(BigInteger, nullable=False, default=0)
+    timeouts = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<SupplyBidderStats(supply_id={self.supply_id}, "
+            f"bidder_id={self.bidder_id}, wins={self.wins})>"
+        )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, BigInteger
+
+from infrastructure.db.base import Base
+
+
+class SupplyCountryStatsModel(Base):
+    __tablename__ = 'stats_supply_country'
+
+    supply_id = Column(String, primary_key=True)
+    country = Column(String(2), primary_key=True)
+    requests = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<SupplyCountryStats(supply_id={self.supply_id}, "
+            f"country={self.country}, requests={self.requests})>"
+        )
@@ -0,0 +1,55 @@
+"""Instrumented connection pool and pool metrics."""
+import time
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long checkouts wait for a connection.
+    The wait includes opening a new connection when the pool grows.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except Exception:
+            self.checkout_timeouts += 1
+            raise
+        finally:
+            wait_ms = (time.perf_counter() - started) * 1000
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+
+def pool_stats(engine: AsyncEngine) -> dict[str, float]:
+    """Returns checkout wait and saturation metrics for an engine's pool."""
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedQueuePool):
+        return {"pooled": 0}
+
+    capacity = pool.size() + pool._max_overflow
+    checked_out = pool.checkedout()
+    return {
+        "pooled": 1,
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": checked_out,
+        "idle": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+        "checkouts": pool.checkouts,
+        "checkout_timeouts": pool.checkout_timeouts,
+        "avg_checkout_wait_ms": round(pool.total_wait_ms / pool.checkouts, 3) if pool.checkouts else 0.0,
+        "max_checkout_wait_ms": round(pool.max_wait_ms, 3),
+    }
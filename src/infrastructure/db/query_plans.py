@@ -0,0 +1,230 @@
+"""EXPLAIN-based checks that stats queries keep using their indexes."""
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy import Select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from domain.stats import StatsQuery
+from infrastructure.repositories import StatsRepository
+
+
+SEED_PREFIX = "plan-check"
+
+SEED_STATEMENTS = (
+    """
+    INSERT INTO supplies (id) SELECT :prefix || '-supply-' || g FROM generate_series(1, :supplies) g
+    """,
+    """
+    INSERT INTO bidders (id, country)
+    SELECT :prefix || '-bidder-' || g, 'US' FROM generate_series(1, :bidders) g
+    """,
+    # In created_at order like live traffic, so BRIN ranges stay tight
+    """
+    INSERT INTO auctions (supply_id, ip_address, country, winner_bidder_id, winning_price, tmax, created_at)
+    SELECT
+        :prefix || '-supply-' || (1 + (g::bigint * 7919) % :supplies),
+        '10.0.0.1',
+        (ARRAY['US', 'GB', 'DE', 'FR', 'ES', 'IT', 'NL', 'PL', 'SE', 'CA'])[1 + g % 10],
+        :prefix || '-bidder-' || (1 + g % :bidders),
+        0.5,
+        100,
+        now() - make_interval(secs => (:auctions - g) * CAST(:span_seconds AS float8) / :auctions)
+    FROM generate_series(1, :auctions) g
+    """,
+    """
+    INSERT INTO bids (auction_id, bidder_id, price, latency_ms, timed_out, created_at)
+    SELECT
+        a.id,
+        :prefix || '-bidder-' || (1 + (a.id + k) % :bidders),
+        CASE WHEN k = 0 THEN 0.5 END,
+        20,
+        0,
+        a.created_at
+    FROM auctions a, generate_series(0, 2) k
+    WHERE a.supply_id LIKE :prefix || '-%'
+    ORDER BY a.created_at
+    """,
+    """
+    INSERT INTO stats_supply_country (supply_id, country, requests)
+    SELECT supply_id, country, count(*) FROM auctions
+    WHERE supply_id LIKE :prefix || '-%' GROUP BY supply_id, country
+    """,
+    """
+    INSERT INTO stats_supply_bidder (supply_id, bidder_id, wins, total_revenue, no_bids, timeouts)
+    SELECT a.supply_id, b.bidder_id, count(*), 0, 0, 0 FROM bids b
+    JOIN auctions a ON a.id = b.auction_id AND a.created_at = b.created_at
+    WHERE a.supply_id LIKE :prefix || '-%' GROUP BY a.supply_id, b.bidder_id
+    """,
+    """
+    INSERT INTO stats_bucket_country (bucket_start, resolution_seconds, supply_id, country, requests)
+    SELECT date_trunc('minute', created_at, 'UTC'), 60, supply_id, country, count(*) FROM auctions
+    WHERE supply_id LIKE :prefix || '-%' GROUP BY 1, supply_id, country
+    """,
+    """
+    INSERT INTO stats_bucket_bidder
+        (bucket_start, resolution_seconds, supply_id, bidder_id, wins, total_revenue, no_bids, timeouts)
+    SELECT date_trunc('minute', a.created_at, 'UTC'), 60, a.supply_id, b.bidder_id, count(*), 0, 0, 0
+    FROM bids b JOIN auctions a ON a.id = b.auction_id AND a.created_at = b.created_at
+    WHERE a.supply_id LIKE :prefix || '-%' GROUP BY 1, a.supply_id, b.bidder_id
+    """,
+)
+
+ANALYZED_TABLES = (
+    "supplies", "bidders", "auctions", "bids",
+    "stats_supply_country", "stats_supply_bidder", "stats_bucket_country", "stats_bucket_bidder",
+)
+
+
+@dataclass
+class PlanCheck:
+    """Outcome of explaining one query."""
+    name: str
+    seq_scans: list[str] = field(default_factory=list)
+    indexes: list[str] = field(default_factory=list)
+    cost: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Returns whether the plan avoids sequential scans of large tables."""
+        return not self.seq_scans
+
+
+class QueryPlanChecker:
+    """
+    Explains every stats repository query against a seeded dataset and reports
+    sequential scans of tables larger than a threshold.
+    Seed rows and refreshed planner statistics are rolled back afterwards.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        seed_auctions: int,
+        seed_supplies: int = 500,
+        seed_bidders: int = 50,
+        seed_span_hours: int = 72,
+        min_table_rows: int = 10000
+    ):
+        """Initializes checker with dataset size and the smallest table a seq scan may fail on."""
+        self.session_factory = session_factory
+        self.seed_auctions = seed_auctions
+        self.seed_supplies = seed_supplies
+        self.seed_bidders = seed_bidders
+        self.seed_span = timedelta(hours=seed_span_hours)
+        self.min_table_rows = min_table_rows
+
+    async def run(self) -> list[PlanCheck]:
+        """Seeds the dataset when configured, explains all queries and rolls back."""
+        async with self.session_factory() as session:
+            try:
+                if self.seed_auctions > 0:
+                    await self._seed(session)
+                for table in ANALYZED_TABLES:
+                    await session.execute(text(f"ANALYZE {table}"))
+
+                supply_id, bidder_id, auction_ids = await self._sample(session)
+                return [
+                    await self._check(session, name, statement)
+                    for name, statement in self.queries(supply_id, bidder_id, auction_ids)
+                ]
+            finally:
+                await session.rollback()
+
+    def queries(
+        self,
+        supply_id: str,
+        bidder_id: str,
+        auction_ids: tuple[int, int]
+    ) -> list[tuple[str, Select]]:
+        """Returns the selective repository queries whose plans must stay index-driven."""
+        now = datetime.now(timezone.utc)
+        last_hour = {"since": now - timedelta(hours=1), "until": now}
+        supply = [supply_id]
+        repo = StatsRepository
+
+        return [
+            ("supply page after cursor", repo.supply_page_query(
+                StatsQuery(after_supply_id=supply_id, limit=100)
+            )),
+            ("rollup request counts for a supply", repo.rollup_request_counts_query(supply)),
+            ("rollup bidder stats for a supply", repo.rollup_bidder_stats_query(supply)),
+            ("rollup bidder stats for a bidder", repo.rollup_bidder_stats_query(None, bidder_id)),
+            ("bucket request counts for the last hour", repo.bucket_request_counts_query(
+                None, StatsQuery(**last_hour)
+            )),
+            ("bucket bidder stats for the last hour", repo.bucket_bidder_stats_query(
+                None, StatsQuery(**last_hour)
+            )),
+            ("raw request counts for a supply", repo.request_counts_query(supply)),
+            ("raw request counts for a supply and country", repo.request_counts_query(
+                supply, query=StatsQuery(country="US")
+            )),
+            ("raw request counts for the last hour", repo.request_counts_query(
+                query=StatsQuery(**last_hour)
+            )),
+            ("raw bidder stats for a supply", repo.bidder_stats_query(supply)),
+            ("raw bidder stats for the last hour", repo.bidder_stats_query(
+                query=StatsQuery(**last_hour)
+            )),
+            ("raw bidder stats for a bidder in the last hour", repo.bidder_stats_query(
+                query=StatsQuery(bidder_id=bidder_id, **last_hour)
+            )),
+            ("rebuild chunk request counts", repo.request_counts_query(auction_ids=auction_ids)),
+            ("rebuild chunk bidder stats", repo.bidder_stats_query(auction_ids=auction_ids)),
+        ]
+
+    async def _seed(self, session: AsyncSession) -> None:
+        """Inserts synthetic supplies, bidders, auctions, bids and rollups."""
+        params = {
+            "prefix": SEED_PREFIX,
+            "supplies": self.seed_supplies,
+            "bidders": self.seed_bidders,
+            "auctions": self.seed_auctions,
+            "span_seconds": self.seed_span.total_seconds(),
+        }
+        for statement in SEED_STATEMENTS:
+            await session.execute(text(statement), params)
+
+    async def _sample(self, session: AsyncSession) -> tuple[str, str, tuple[int, int]]:
+        """Picks a supply, a bidder and a small auction ID range to filter on."""
+        supply_id = await session.scalar(text("SELECT max(supply_id) FROM stats_supply_country"))
+        bidder_id = await session.scalar(text("SELECT max(bidder_id) FROM stats_supply_bidder"))
+        max_id = await session.scalar(text("SELECT coalesce(max(id), 0) FROM auctions"))
+        first_id = max(0, max_id - max(1, self.seed_auctions // 100))
+        return supply_id or "", bidder_id or "", (first_id, max_id)
+
+    async def _check(self, session: AsyncSession, name: str, statement: Select) -> PlanCheck:
+        """Explains one query and collects its sequential scans of large tables."""
+        compiled = statement.compile(
+            dialect=session.bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+        plan = await session.scalar(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+        result = PlanCheck(name=name, cost=plan[0]["Plan"]["Total Cost"])
+
+        for node in self._nodes(plan[0]["Plan"]):
+            if "Index Name" in node:
+                result.indexes.append(node["Index Name"])
+            if node["Node Type"] != "Seq Scan":
+                continue
+            rows = await self._table_rows(session, node["Relation Name"])
+            if rows >= self.min_table_rows:
+                result.seq_scans.append(f"{node['Relation Name']} ({rows} rows)")
+        return result
+
+    @staticmethod
+    def _nodes(node: dict[str, Any]):
+        """Yields a plan node and all of its descendants."""
+        yield node
+        for child in node.get("Plans", []):
+            yield from QueryPlanChecker._nodes(child)
+
+    @staticmethod
+    async def _table_rows(session: AsyncSession, relation: str) -> int:
+        """Returns the planner's row estimate for a table or partition."""
+        rows: Optional[float] = await session.scalar(
+            text("SELECT reltuples FROM pg_class WHERE relname = :relation"),
+            {"relation": relation}
+        )
+        return max(0, int(rows or 0))
@@ -1,6 +1,7 @@
 """Database session and initialization with migrations."""
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     create_async_engine,
     async_sessionmaker
@@ -11,24 +12,51 @@ from alembic import command
 
 from core.settings import get_settings
 from infrastructure.db.base import Base
+from infrastructure.db.pool import InstrumentedQueuePool
 
 
 settings = get_settings()
 
+
+def create_engine_from_settings(url: str, pooled: bool | None = None) -> AsyncEngine:
+    """
+    Creates async engine with a connection pool sized for one worker,
+    or without pooling when pooling is disabled.
+    """
+    if pooled is None:
+        pooled = settings.db_pool_enabled
+
+    if not pooled:
+        return create_async_engine(
+            url,
+            echo=settings.debug,
+            poolclass=NullPool,
+            future=True
+        )
+
+    pool_size, max_overflow = settings.db_pool_limits
+    return create_async_engine(
+        url,
+        echo=settings.debug,
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        connect_args={
+            "prepared_statement_cache_size": settings.db_statement_cache_size
+        },
+        future=True
+    )
+
+
 # Primary database engine (read/write)
-engine = create_async_engine(
-    settings.async_database_url,
-    echo=settings.debug,
-    poolclass=NullPool,
-    future=True
-)
+engine = create_engine_from_settings(settings.async_database_url)
 
 # Read replica engine (read-only)
-read_replica_engine = create_async_engine(
-    settings.async_read_replica_database_url,
-    echo=settings.debug,
-    poolclass=NullPool,
-    future=True
+read_replica_engine = create_engine_from_settings(
+    settings.async_read_replica_database_url
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -127,6 +155,13 @@ async def init_db() -> None:
             bidder,
             supply,
         )
+        from infrastructure.db.models.journal import segment  # noqa: F401
+        from infrastructure.db.models.stats import (  # noqa: F401
+            bidder_bucket,
+            country_bucket,
+            supply_bidder,
+            supply_country,
+        )
         print("✓ Models imported successfully")
     except Exception as e:
         print(f"✗ Error importing models: {e}")
@@ -142,6 +177,20 @@ async def init_db() -> None:
             await conn.run_sync(Base.metadata.create_all)
         print("✓ Tables created directly")
 
+    try:
+        from infrastructure.persistence import AuctionPartitionManager
+
+        created, expired = await AuctionPartitionManager(
+            session_factory=AsyncSessionLocal,
+            premake_days=settings.partition_premake_days,
+            retention_days=settings.partition_retention_days,
+            retention_mode=settings.partition_retention_mode
+        ).run_once()
+        print(f"✓ Auction partitions ready ({len(created)} created, {len(expired)} expired)")
+    except Exception as e:
+        print(f"✗ Partition maintenance error: {e}")
+        raise
+
     try:
         await load_fixtures()
         print("✓ Default fixtures loaded")
@@ -0,0 +1,10 @@
+from .write_behind_queue import WriteBehindQueue, get_write_behind_queue
+from .journal import AuctionJournal, get_auction_journal
+from .journal_loader import JournalLoader
+from .auction_events import AuctionEventLog, BID_FIELDS, get_auction_event_log
+from .auction_writer import get_auction_writer
+from .stats_rollup import StatsRollupAccumulator, get_stats_rollup_accumulator
+from .stats_rollup_rebuilder import StatsRollupRebuilder
+from .stats_buckets import StatsBucketDownsampler
+from .stats_recorder import get_stats_recorder
+from .auction_partitions import AuctionPartitionManager
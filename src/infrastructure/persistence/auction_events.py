@@ -0,0 +1,71 @@
+import json
+from typing import Optional
+
+from core.settings import get_settings
+from domain.bidding import AuctionRecord
+from .journal import AuctionJournal
+from .segments import SegmentWriter
+
+
+# Order of the values in each element of an event's "bids" array
+BID_FIELDS = ("bidder_id", "price", "latency_ms", "timed_out")
+
+
+def encode_event(record: AuctionRecord) -> bytes:
+    """
+    Serializes an auction and all of its bids into one compact JSON line.
+    Bids are arrays in BID_FIELDS order, which keeps lines short and cheap to encode.
+    """
+    return json.dumps(
+        {
+            "ts": record.created_at.isoformat(),
+            "supply_id": record.supply_id,
+            "country": record.country,
+            "ip": record.ip_address,
+            "tmax": record.tmax,
+            "winner": record.winner_bidder_id,
+            "price": record.winning_price,
+            "bids": [
+                [bid.bidder_id, bid.price, bid.latency_ms, bid.timed_out]
+                for bid in record.bids
+            ],
+        },
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+class AuctionEventLog(AuctionJournal):
+    """
+    Structured auction log for analytics: one JSON line per auction.
+    Lines are buffered and written off the event loop to per-worker segments
+    that rotate by size and age, so several workers can share a directory.
+    """
+
+    encode = staticmethod(encode_event)
+
+
+_auction_event_log: Optional[AuctionEventLog] = None
+
+
+def get_auction_event_log() -> Optional[AuctionEventLog]:
+    """Returns singleton auction event log, or None when it is disabled."""
+    global _auction_event_log
+
+    settings = get_settings()
+    if not settings.auction_event_log_enabled:
+        return None
+
+    if not _auction_event_log:
+        _auction_event_log = AuctionEventLog(
+            writer=SegmentWriter(
+                directory=settings.auction_event_log_dir,
+                prefix="auction-events",
+                max_bytes=settings.auction_event_log_segment_max_bytes,
+                max_age_seconds=settings.auction_event_log_segment_max_age_seconds,
+                compress=settings.auction_event_log_compress
+            ),
+            buffer_bytes=settings.auction_event_log_buffer_bytes,
+            flush_interval_ms=settings.auction_event_log_flush_interval_ms
+        )
+
+    return _auction_event_log
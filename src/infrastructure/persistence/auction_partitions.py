@@ -0,0 +1,147 @@
+import asyncio
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Referenced table first, so bids partitions always have their auctions partition
+PARTITIONED_TABLES = ("auctions", "bids")
+BIDS_AUCTION_FKEY = "bids_auction_fkey"
+
+# Arbitrary application-wide key so only one worker changes partitions at a time
+PARTITION_LOCK_ID = 7_316_005
+
+
+def partition_name(table: str, day: date) -> str:
+    """Returns the name of a table's partition for one UTC day."""
+    return f"{table}_p{day:%Y%m%d}"
+
+
+class AuctionPartitionManager:
+    """
+    Maintains the daily range partitions of auctions and bids.
+    Creates partitions ahead of time and detaches or drops whole expired days
+    instead of deleting rows, under an advisory lock so every worker may schedule it.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        premake_days: int,
+        retention_days: int,
+        retention_mode: str = "detach",
+        lock_timeout_ms: int = 5000
+    ):
+        """Initializes manager with partition lookahead and retention policy."""
+        if retention_mode not in ("detach", "drop"):
+            raise ValueError(f"Unknown partition retention mode: {retention_mode}")
+        self.session_factory = session_factory
+        self.premake_days = premake_days
+        self.retention_days = retention_days
+        self.retention_mode = retention_mode
+        self.lock_timeout_ms = lock_timeout_ms
+
+    async def run_once(self) -> tuple[list[str], list[str]]:
+        """Creates missing partitions, expires old ones and returns (created, expired) names."""
+        today = datetime.now(timezone.utc).date()
+
+        async with self.session_factory() as session:
+            locked = await session.scalar(
+                text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
+                {"lock_id": PARTITION_LOCK_ID}
+            )
+            if not locked:
+                return [], []
+
+            # Partition DDL locks the parent table, so give up rather than queue inserts behind it
+            await session.execute(text(f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}"))
+
+            created = await self._create_partitions(session, today)
+            expired = []
+            if self.retention_days > 0:
+                expired = await self._expire_partitions(
+                    session, today - timedelta(days=self.retention_days)
+                )
+
+            await session.commit()
+            return created, expired
+
+    async def run_forever(self, interval_seconds: int) -> None:
+        """Maintains partitions periodically until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                created, expired = await self.run_once()
+                if created or expired:
+                    logger.info(
+                        f"Created partitions {created}, expired partitions {expired} "
+                        f"({self.retention_mode})"
+                    )
+            except Exception as e:
+                logger.warning(f"Auction partition maintenance failed: {str(e)}")
+
+    async def _create_partitions(self, session, today: date) -> list[str]:
+        """Creates the default partitions and one partition per day up to the lookahead."""
+        created = []
+        for table in PARTITIONED_TABLES:
+            existing = await self._partition_days(session, table)
+            await session.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+            ))
+            for offset in range(self.premake_days + 1):
+                day = today + timedelta(days=offset)
+                if day in existing:
+                    continue
+                await session.execute(text(
+                    f"CREATE TABLE {partition_name(table, day)} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{day.isoformat()} 00:00:00+00') "
+                    f"TO ('{(day + timedelta(days=1)).isoformat()} 00:00:00+00')"
+                ))
+                created.append(partition_name(table, day))
+        return created
+
+    async def _expire_partitions(self, session, cutoff: date) -> list[str]:
+        """Detaches or drops partitions whose whole day is before the cutoff."""
+        expired = []
+        # Bids first: an auctions partition cannot leave while bids still reference it
+        for table in reversed(PARTITIONED_TABLES):
+            for day in sorted(await self._partition_days(session, table)):
+                if day >= cutoff:
+                    break
+                name = partition_name(table, day)
+                await session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+                if self.retention_mode == "drop":
+                    await session.execute(text(f"DROP TABLE {name}"))
+                elif table == "bids":
+                    # The detached table keeps a copy of the foreign key to auctions
+                    await session.execute(text(
+                        f"ALTER TABLE {name} DROP CONSTRAINT IF EXISTS {BIDS_AUCTION_FKEY}"
+                    ))
+                expired.append(name)
+        return expired
+
+    @staticmethod
+    async def _partition_days(session, table: str) -> set[date]:
+        """Returns the days covered by a table's attached daily partitions."""
+        rows = await session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": table}
+        )
+        pattern = re.compile(rf"^{table}_p(\d{{8}})$")
+        days = set()
+        for (name,) in rows:
+            match = pattern.match(name)
+            if match:
+                days.add(datetime.strptime(match.group(1), "%Y%m%d").date())
+        return days
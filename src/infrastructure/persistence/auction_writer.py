@@ -0,0 +1,17 @@
+from typing import Optional
+
+from core.settings import get_settings
+from domain.bidding import IAuctionWriter
+from .journal import get_auction_journal
+from .write_behind_queue import get_write_behind_queue
+
+
+def get_auction_writer() -> Optional[IAuctionWriter]:
+    """
+    Returns the configured off-request auction writer.
+    The journal takes precedence over the write-behind queue; None means
+    auctions are written synchronously by the repository.
+    """
+    if get_settings().journal_enabled:
+        return get_auction_journal()
+    return get_write_behind_queue()
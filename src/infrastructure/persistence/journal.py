@@ -0,0 +1,143 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import Optional
+
+from core.logging import get_logger
+from core.settings import get_settings
+from domain.bidding import AuctionRecord, Bid, IAuctionWriter
+from .segments import SegmentWriter
+
+
+logger = get_logger(__name__)
+
+
+def encode_record(record: AuctionRecord) -> bytes:
+    """Serializes auction record into one compact JSON line."""
+    return json.dumps(
+        {
+            "supply_id": record.supply_id,
+            "ip": record.ip_address,
+            "country": record.country,
+            "tmax": record.tmax,
+            "winner": record.winner_bidder_id,
+            "price": record.winning_price,
+            "created_at": record.created_at.isoformat(),
+            "bids": [
+                [bid.bidder_id, bid.price, bid.latency_ms, int(bid.timed_out)]
+                for bid in record.bids
+            ],
+        },
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+def decode_record(line: bytes) -> AuctionRecord:
+    """Parses a JSON line produced by encode_record."""
+    data = json.loads(line)
+    return AuctionRecord(
+        supply_id=data["supply_id"],
+        ip_address=data["ip"],
+        country=data["country"],
+        tmax=data["tmax"],
+        winner_bidder_id=data["winner"],
+        winning_price=data["price"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        bids=[
+            Bid(
+                bidder_id=bidder_id,
+                price=price,
+                latency_ms=latency_ms,
+                timed_out=bool(timed_out)
+            )
+            for bidder_id, price, latency_ms, timed_out in data["bids"]
+        ]
+    )
+
+
+class AuctionJournal(IAuctionWriter):
+    """
+    Appends auction records to local JSONL segments instead of the database.
+    Sealed segments are bulk-loaded into Postgres by the journal loader process.
+    """
+
+    encode = staticmethod(encode_record)
+
+    def __init__(
+        self,
+        writer: SegmentWriter,
+        buffer_bytes: int,
+        flush_interval_ms: int
+    ):
+        """Initializes journal on top of a segment writer."""
+        self.writer = writer
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval_ms / 1000
+        self._task: Optional[asyncio.Task] = None
+        self.records = 0
+
+    async def submit(self, record: AuctionRecord) -> None:
+        """Buffers record and writes the buffer once it is large enough."""
+        self.writer.append(self.encode(record))
+        self.records += 1
+        if self.writer.buffered_bytes >= self.buffer_bytes:
+            await self.writer.flush()
+
+    async def start(self) -> None:
+        """Starts periodic flushing and segment rotation."""
+        if not self._task:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stops background work, flushes the buffer and seals the segment."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self.writer.close()
+
+    async def _run(self) -> None:
+        """Flushes and rotates until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.writer.flush()
+                await self.writer.rotate_if_due()
+            except Exception as e:
+                logger.error(f"{type(self).__name__} flush failed: {str(e)}", exc_info=True)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Returns journal counters."""
+        return {
+            "records": self.records,
+            "buffered_bytes": self.writer.buffered_bytes,
+            "sealed_segments": self.writer.sealed_segments,
+        }
+
+
+_auction_journal: Optional[AuctionJournal] = None
+
+
+def get_auction_journal() -> Optional[AuctionJournal]:
+    """Returns singleton auction journal, or None when the journal is disabled."""
+    global _auction_journal
+
+    settings = get_settings()
+    if not settings.journal_enabled:
+        return None
+
+    if not _auction_journal:
+        _auction_journal = AuctionJournal(
+            writer=SegmentWriter(
+                directory=settings.journal_dir,
+                prefix="auctions",
+                max_bytes=settings.journal_segment_max_bytes,
+                max_age_seconds=settings.journal_segment_max_age_seconds,
+                fsync=settings.journal_fsync
+            ),
+            buffer_bytes=settings.journal_buffer_bytes,
+            flush_interval_ms=settings.journal_flush_interval_ms
+        )
+
+    return _auction_journal
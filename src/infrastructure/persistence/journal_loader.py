@@ -0,0 +1,192 @@
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+import asyncpg
+from sqlalchemy import select, text
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.logging import get_logger
+from domain.bidding import AuctionRecord
+from infrastructure.db.models.journal import JournalSegmentModel
+from .journal import decode_record
+from .segments import OPEN_SUFFIX, SEALED_SUFFIX, seal_segment
+
+
+AUCTION_COLUMNS = [
+    "id", "supply_id", "ip_address", "country",
+    "winner_bidder_id", "winning_price", "tmax", "created_at",
+]
+BID_COLUMNS = [
+    "auction_id", "bidder_id", "price", "latency_ms", "timed_out", "created_at",
+]
+
+# Errors caused by a segment's content rather than by the database being unavailable;
+# retrying such a segment fails the same way
+BAD_SEGMENT_ERRORS = (
+    ValueError,
+    KeyError,
+    TypeError,
+    IntegrityError,
+    DataError,
+    asyncpg.exceptions.IntegrityConstraintViolationError,
+    asyncpg.exceptions.DataError,
+)
+
+
+logger = get_logger(__name__)
+
+
+class JournalLoader:
+    """
+    Bulk-loads sealed journal segments into the auctions and bids tables.
+    Each segment is copied in one transaction together with its checkpoint row
+    in journal_segments, so a segment is never loaded twice even if the loader
+    crashes between committing and removing the file. Segments that cannot be
+    decoded or violate constraints are moved to a quarantine directory.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        session_factory: async_sessionmaker,
+        stale_segment_seconds: int,
+        quarantine_dir: Optional[str] = None
+    ):
+        """Initializes loader for a journal directory."""
+        self.directory = Path(directory)
+        self.session_factory = session_factory
+        self.stale_segment_seconds = stale_segment_seconds
+        self.quarantine_dir = (
+            Path(quarantine_dir) if quarantine_dir else self.directory / "quarantine"
+        )
+        self.quarantined_segments = 0
+
+    def sealed_segments(self) -> list[Path]:
+        """
+        Returns sealed segments in creation order.
+        Open segments untouched for longer than the stale threshold were left
+        behind by a crashed worker and are sealed here.
+        """
+        if not self.directory.exists():
+            return []
+
+        now = time.time()
+        for path in self.directory.glob(f"*{OPEN_SUFFIX}"):
+            if now - path.stat().st_mtime >= self.stale_segment_seconds:
+                seal_segment(path)
+
+        return sorted(self.directory.glob(f"*{SEALED_SUFFIX}"))
+
+    @staticmethod
+    def read_segment(path: Path) -> list[AuctionRecord]:
+        """Reads records from a segment, skipping a torn trailing line."""
+        records = []
+        with open(path, "rb") as segment:
+            for line in segment:
+                if not line.endswith(b"\n"):
+                    break
+                records.append(decode_record(line))
+        return records
+
+    async def load_segment(self, path: Path) -> int:
+        """Copies one segment into Postgres and checkpoints it; returns loaded records."""
+        records = self.read_segment(path)
+
+        async with self.session_factory() as session:
+            async with session.begin():
+                already_loaded = await session.scalar(
+                    select(JournalSegmentModel.name)
+                    .where(JournalSegmentModel.name == path.name)
+                )
+                if already_loaded:
+                    records = []
+                else:
+                    if records:
+                        await self._copy_records(session, records)
+                    session.add(
+                        JournalSegmentModel(name=path.name, records=len(records))
+                    )
+
+        path.unlink()
+        return len(records)
+
+    @staticmethod
+    async def _copy_records(session, records: list[AuctionRecord]) -> None:
+        """Reserves auction IDs and COPYs auctions and bids on the session's connection."""
+        result = await session.execute(
+            text(
+                "SELECT nextval(pg_get_serial_sequence('auctions', 'id')) "
+                "FROM generate_series(1, :count)"
+            ),
+            {"count": len(records)}
+        )
+        auction_ids = list(result.scalars().all())
+
+        auction_rows = []
+        bid_rows = []
+        for auction_id, record in zip(auction_ids, records):
+            auction_rows.append((
+                auction_id, record.supply_id, record.ip_address, record.country,
+                record.winner_bidder_id, record.winning_price, record.tmax,
+                record.created_at,
+            ))
+            bid_rows.extend(
+                (
+                    auction_id, bid.bidder_id, bid.price, bid.latency_ms,
+                    int(bid.timed_out), record.created_at,
+                )
+                for bid in record.bids
+            )
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        await driver_connection.copy_records_to_table(
+            "auctions", records=auction_rows, columns=AUCTION_COLUMNS
+        )
+        if bid_rows:
+            await driver_connection.copy_records_to_table(
+                "bids", records=bid_rows, columns=BID_COLUMNS
+            )
+
+    def quarantine(self, path: Path, error: Exception) -> Path:
+        """Moves a segment that cannot be loaded out of the load path."""
+        self.quarantine_dir.mkdir(parents=True, exist_ok=True)
+        target = self.quarantine_dir / path.name
+        os.replace(path, target)
+        self.quarantined_segments += 1
+        logger.error(
+            f"Quarantined journal segment {path.name} to {self.quarantine_dir}: "
+            f"{type(error).__name__}: {str(error)}"
+        )
+        return target
+
+    async def run_once(self) -> int:
+        """
+        Loads every sealed segment; returns total loaded records.
+        Bad segments are quarantined and skipped; other errors, such as the
+        database being unreachable, propagate and the segment is retried later.
+        """
+        total = 0
+        for path in self.sealed_segments():
+            try:
+                total += await self.load_segment(path)
+            except BAD_SEGMENT_ERRORS as e:
+                self.quarantine(path, e)
+        return total
+
+    async def run_forever(self, interval_seconds: int) -> None:
+        """Loads sealed segments in a loop until cancelled."""
+        while True:
+            try:
+                loaded = await self.run_once()
+                if loaded:
+                    logger.info(f"Loaded {loaded} auctions from journal")
+            except Exception as e:
+                logger.error(f"Journal load failed, retrying: {str(e)}", exc_info=True)
+            await asyncio.sleep(interval_seconds)
@@ -0,0 +1,141 @@
+import asyncio
+import gzip
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional, BinaryIO
+
+
+OPEN_SUFFIX = ".jsonl.open"
+SEALED_SUFFIX = ".jsonl"
+COMPRESSED_SUFFIX = ".jsonl.gz"
+
+
+class SegmentWriter:
+    """
+    Buffered append-only writer for JSONL segment files.
+    Each process writes its own segments, named after its PID, so multiple
+    workers can share a directory. Segments are written with an `.open` suffix
+    and sealed by an atomic rename once they reach the size or age limit;
+    sealed segments are optionally replaced by a gzip copy.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str,
+        max_bytes: int,
+        max_age_seconds: int,
+        fsync: bool = False,
+        compress: bool = False
+    ):
+        """Initializes writer; the first segment is opened lazily."""
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.fsync = fsync
+        self.compress = compress
+
+        self._buffer: list[bytes] = []
+        self._buffered_bytes = 0
+        self._lock = asyncio.Lock()
+        self._file: Optional[BinaryIO] = None
+        self._path: Optional[Path] = None
+        self._opened_at = 0.0
+        self._size = 0
+        self._sequence = 0
+
+        self.sealed_segments = 0
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Returns number of bytes waiting to be written."""
+        return self._buffered_bytes
+
+    def append(self, line: bytes) -> None:
+        """Buffers a single line; the trailing newline is added here."""
+        self._buffer.append(line + b"\n")
+        self._buffered_bytes += len(line) + 1
+
+    async def flush(self) -> None:
+        """Writes buffered lines to the current segment without blocking the event loop."""
+        async with self._lock:
+            if not self._buffer:
+                return
+            data = b"".join(self._buffer)
+            self._buffer = []
+            self._buffered_bytes = 0
+            await asyncio.to_thread(self._write, data)
+
+    async def rotate_if_due(self) -> None:
+        """Seals the current segment if it reached the size or age limit."""
+        async with self._lock:
+            if self._file is None:
+                return
+            too_big = self._size >= self.max_bytes
+            too_old = time.monotonic() - self._opened_at >= self.max_age_seconds
+            if too_big or too_old:
+                await asyncio.to_thread(self._seal)
+
+    async def close(self) -> None:
+        """Flushes pending lines and seals the current segment."""
+        await self.flush()
+        async with self._lock:
+            if self._file is not None:
+                await asyncio.to_thread(self._seal)
+
+    def _write(self, data: bytes) -> None:
+        """Appends data to the current segment, opening a new one if needed."""
+        if self._file is None:
+            self._open()
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._size += len(data)
+
+    def _open(self) -> None:
+        """Opens a new segment file for this process."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._sequence += 1
+        name = (
+            f"{self.prefix}-{time.strftime('%Y%m%d%H%M%S')}"
+            f"-{os.getpid()}-{self._sequence:06d}"
+        )
+        self._path = self.directory / f"{name}{OPEN_SUFFIX}"
+        self._file = open(self._path, "ab")
+        self._opened_at = time.monotonic()
+        self._size = 0
+
+    def _seal(self) -> None:
+        """Closes the current segment and renames it to its sealed name."""
+        self._file.close()
+        sealed_path = seal_segment(self._path)
+        if self.compress:
+            compress_segment(sealed_path)
+        self._file = None
+        self._path = None
+        self.sealed_segments += 1
+
+
+def seal_segment(path: Path) -> Path:
+    """Renames an open segment to its sealed name and returns the new path."""
+    sealed_path = path.with_name(path.name[:-len(OPEN_SUFFIX)] + SEALED_SUFFIX)
+    os.replace(path, sealed_path)
+    return sealed_path
+
+
+def compress_segment(path: Path) -> Path:
+    """
+    Replaces a sealed segment with a gzip copy and returns its path.
+    The copy is written under a temporary name, so readers never see a partial file.
+    """
+    compressed_path = path.with_name(path.name[:-len(SEALED_SUFFIX)] + COMPRESSED_SUFFIX)
+    temporary_path = compressed_path.with_name(compressed_path.name + ".tmp")
+    with open(path, "rb") as source, gzip.open(temporary_path, "wb", compresslevel=6) as target:
+        shutil.copyfileobj(source, target, 1024 * 1024)
+    os.replace(temporary_path, compressed_path)
+    os.remove(path)
+    return compressed_path
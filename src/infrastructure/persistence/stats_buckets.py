@@ -0,0 +1,110 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, literal, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.logging import get_logger
+from infrastructure.db.models.stats import (
+    BidderBucketStatsModel,
+    CountryBucketStatsModel,
+)
+
+
+logger = get_logger(__name__)
+
+MINUTE_BUCKET = 60
+HOUR_BUCKET = 3600
+BIDDER_METRICS = ("wins", "total_revenue", "no_bids", "timeouts")
+
+# Arbitrary application-wide key so only one worker downsamples at a time
+DOWNSAMPLE_LOCK_ID = 7_316_004
+
+
+def bucket_start(moment: datetime, resolution_seconds: int) -> datetime:
+    """Returns the UTC start of the bucket containing the moment."""
+    epoch = int(moment.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % resolution_seconds, tz=timezone.utc)
+
+
+class StatsBucketDownsampler:
+    """
+    Folds minute buckets older than the retention window into hour buckets.
+    Each run moves whole hours in one transaction guarded by an advisory lock,
+    so every worker may schedule it and at most one does the work.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, minute_retention_hours: int):
+        """Initializes downsampler with session factory and minute bucket retention."""
+        self.session_factory = session_factory
+        self.minute_retention = timedelta(hours=minute_retention_hours)
+
+    async def run_once(self) -> int:
+        """Downsamples expired minute buckets and returns the number of rows removed."""
+        cutoff = bucket_start(
+            datetime.now(timezone.utc) - self.minute_retention, HOUR_BUCKET
+        )
+
+        async with self.session_factory() as session:
+            locked = await session.scalar(
+                text("SELECT pg_try_advisory_xact_lock(:lock_id)"),
+                {"lock_id": DOWNSAMPLE_LOCK_ID}
+            )
+            if not locked:
+                return 0
+
+            removed = 0
+            for model, key_columns, value_columns in (
+                (CountryBucketStatsModel, ("supply_id", "country"), ("requests",)),
+                (BidderBucketStatsModel, ("supply_id", "bidder_id"), BIDDER_METRICS),
+            ):
+                removed += await self._downsample(
+                    session, model, key_columns, value_columns, cutoff
+                )
+
+            await session.commit()
+            return removed
+
+    async def run_forever(self, interval_seconds: int) -> None:
+        """Downsamples periodically until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                removed = await self.run_once()
+                if removed:
+                    logger.info(f"Downsampled {removed} minute stats buckets")
+            except Exception as e:
+                logger.warning(f"Stats bucket downsampling failed: {str(e)}")
+
+    @staticmethod
+    async def _downsample(session, model, key_columns, value_columns, cutoff: datetime) -> int:
+        """Adds minute rows before the cutoff to their hour rows and deletes them."""
+        table = model.__table__
+        hour = func.date_trunc('hour', table.c.bucket_start, 'UTC')
+        is_expired_minute = (
+            (table.c.resolution_seconds == MINUTE_BUCKET)
+            & (table.c.bucket_start < cutoff)
+        )
+
+        hourly = select(
+            hour,
+            literal(HOUR_BUCKET),
+            *(table.c[column] for column in key_columns),
+            *(func.sum(table.c[column]) for column in value_columns)
+        ).where(is_expired_minute).group_by(
+            hour, *(table.c[column] for column in key_columns)
+        )
+
+        columns = ("bucket_start", "resolution_seconds", *key_columns, *value_columns)
+        statement = insert(model).from_select(columns, hourly)
+        await session.execute(statement.on_conflict_do_update(
+            index_elements=["bucket_start", "resolution_seconds", *key_columns],
+            set_={
+                column: table.c[column] + statement.excluded[column]
+                for column in value_columns
+            }
+        ))
+
+        result = await session.execute(table.delete().where(is_expired_minute))
+        return result.rowcount
@@ -0,0 +1,19 @@
+from typing import Optional
+
+from core.settings import get_settings
+from domain.stats import IStatsRecorder
+from infrastructure.repositories import get_redis_stats_repository
+from .stats_rollup import get_stats_rollup_accumulator
+
+
+def get_stats_recorder() -> Optional[IStatsRecorder]:
+    """
+    Returns the recorder that keeps the configured stats backend up to date.
+    None means stats are aggregated from raw auctions and bids on read.
+    """
+    backend = get_settings().stats_backend
+    if backend == "rollup":
+        return get_stats_rollup_accumulator()
+    if backend == "redis":
+        return get_redis_stats_repository()
+    return None
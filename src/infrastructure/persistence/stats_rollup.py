@@ -0,0 +1,243 @@
+import asyncio
+import time
+from typing import Hashable, Optional
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.logging import get_logger
+from core.settings import get_settings
+from domain.bidding import AuctionRecord, Bid
+from domain.stats import BidderStats, IStatsRecorder
+from infrastructure.db.models.stats import (
+    BidderBucketStatsModel,
+    CountryBucketStatsModel,
+    SupplyBidderStatsModel,
+    SupplyCountryStatsModel,
+)
+from infrastructure.db.session import AsyncSessionLocal
+from .stats_buckets import BIDDER_METRICS, MINUTE_BUCKET, bucket_start
+
+
+logger = get_logger(__name__)
+
+COUNTRY_KEY = ("supply_id", "country")
+BIDDER_KEY = ("supply_id", "bidder_id")
+BUCKET_KEY = ("bucket_start", "resolution_seconds")
+
+
+class StatsRollupAccumulator(IStatsRecorder):
+    """
+    Accumulates per-(supply, country) and per-(supply, bidder) deltas in memory,
+    all-time and per minute bucket, and adds them to the rollup tables with
+    batched UPSERTs on an interval.
+    Deltas from a failed flush are merged back and retried on the next one.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        flush_interval_seconds: float,
+        buckets_enabled: bool = True
+    ):
+        """Initializes accumulator with session factory and flush interval."""
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval_seconds
+        self.buckets_enabled = buckets_enabled
+        self._countries: dict[tuple, int] = {}
+        self._bidders: dict[tuple, BidderStats] = {}
+        self._country_buckets: dict[tuple, int] = {}
+        self._bidder_buckets: dict[tuple, BidderStats] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.recorded_auctions = 0
+        self.flushes = 0
+        self.flushed_rows = 0
+        self.failed_flushes = 0
+        self.last_flush_ms = 0.0
+
+    async def record_auction(self, record: AuctionRecord) -> None:
+        """Adds auction and bid counters to the pending deltas."""
+        bucket = None
+        if self.buckets_enabled:
+            bucket = (bucket_start(record.created_at, MINUTE_BUCKET), MINUTE_BUCKET)
+
+        self._add_requests(self._countries, (record.supply_id, record.country), 1)
+        if bucket:
+            self._add_requests(
+                self._country_buckets, (*bucket, record.supply_id, record.country), 1
+            )
+
+        for bid in record.bids:
+            delta = self._bid_delta(bid, record.winner_bidder_id)
+            self._add_bidder_stats(self._bidders, (record.supply_id, bid.bidder_id), delta)
+            if bucket:
+                self._add_bidder_stats(
+                    self._bidder_buckets, (*bucket, record.supply_id, bid.bidder_id), delta
+                )
+
+        self.recorded_auctions += 1
+
+    async def start(self) -> None:
+        """Starts the periodic flush task."""
+        if not self._task:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stops the flush task and flushes the remaining deltas."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        if self._flush_task:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flushes deltas every interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            # Shielded so that shutdown does not abort a half-written flush
+            self._flush_task = asyncio.create_task(self.flush())
+            await asyncio.shield(self._flush_task)
+            self._flush_task = None
+
+    async def flush(self) -> None:
+        """Writes pending deltas to the rollup tables in one transaction."""
+        countries, self._countries = self._countries, {}
+        bidders, self._bidders = self._bidders, {}
+        country_buckets, self._country_buckets = self._country_buckets, {}
+        bidder_buckets, self._bidder_buckets = self._bidder_buckets, {}
+        if not countries and not bidders:
+            return
+
+        started = time.perf_counter()
+        try:
+            async with self.session_factory() as session:
+                for model, key_columns, pending in (
+                    (SupplyCountryStatsModel, COUNTRY_KEY, countries),
+                    (SupplyBidderStatsModel, BIDDER_KEY, bidders),
+                    (CountryBucketStatsModel, BUCKET_KEY + COUNTRY_KEY, country_buckets),
+                    (BidderBucketStatsModel, BUCKET_KEY + BIDDER_KEY, bidder_buckets),
+                ):
+                    if pending:
+                        await session.execute(
+                            self._upsert(model, key_columns),
+                            self._rows(key_columns, pending)
+                        )
+                await session.commit()
+            self.flushed_rows += (
+                len(countries) + len(bidders) + len(country_buckets) + len(bidder_buckets)
+            )
+        except Exception as e:
+            self.failed_flushes += 1
+            for key, requests in countries.items():
+                self._add_requests(self._countries, key, requests)
+            for key, requests in country_buckets.items():
+                self._add_requests(self._country_buckets, key, requests)
+            for key, delta in bidders.items():
+                self._add_bidder_stats(self._bidders, key, delta)
+            for key, delta in bidder_buckets.items():
+                self._add_bidder_stats(self._bidder_buckets, key, delta)
+            logger.error(f"Stats rollup flush failed: {str(e)}", exc_info=True)
+        finally:
+            self.last_flush_ms = (time.perf_counter() - started) * 1000
+            self.flushes += 1
+
+    @staticmethod
+    def _bid_delta(bid: Bid, winner_bidder_id: Optional[str]) -> BidderStats:
+        """Returns the counters one bid contributes to its bidder."""
+        is_winner = bid.bidder_id == winner_bidder_id
+        return BidderStats(
+            wins=int(is_winner),
+            total_revenue=(bid.price or 0.0) if is_winner else 0.0,
+            no_bids=int(bid.is_no_bid),
+            timeouts=int(bid.timed_out)
+        )
+
+    @staticmethod
+    def _add_requests(pending: dict[tuple, int], key: Hashable, requests: int) -> None:
+        """Adds request count to a pending delta."""
+        pending[key] = pending.get(key, 0) + requests
+
+    @staticmethod
+    def _add_bidder_stats(
+        pending: dict[tuple, BidderStats],
+        key: Hashable,
+        delta: BidderStats
+    ) -> None:
+        """Adds bidder counters to a pending delta."""
+        totals = pending.get(key)
+        if totals is None:
+            pending[key] = BidderStats(**vars(delta))
+            return
+        totals.wins += delta.wins
+        totals.total_revenue += delta.total_revenue
+        totals.no_bids += delta.no_bids
+        totals.timeouts += delta.timeouts
+
+    @staticmethod
+    def _rows(key_columns: tuple[str, ...], pending: dict) -> list[dict]:
+        """
+        Converts pending deltas into UPSERT parameters.
+        Sorted keys give every worker the same lock order.
+        """
+        rows = []
+        for key, delta in sorted(pending.items()):
+            row = dict(zip(key_columns, key))
+            if isinstance(delta, BidderStats):
+                row.update(vars(delta))
+            else:
+                row["requests"] = delta
+            rows.append(row)
+        return rows
+
+    @staticmethod
+    def _upsert(model, key_columns: tuple[str, ...]):
+        """Builds UPSERT adding deltas to the model's counter columns."""
+        statement = insert(model)
+        table = model.__table__
+        value_columns = BIDDER_METRICS if "bidder_id" in key_columns else ("requests",)
+        return statement.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={
+                column: table.c[column] + statement.excluded[column]
+                for column in value_columns
+            }
+        )
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Returns pending delta counts and flush counters."""
+        return {
+            "pending_rows": (
+                len(self._countries) + len(self._bidders)
+                + len(self._country_buckets) + len(self._bidder_buckets)
+            ),
+            "recorded_auctions": self.recorded_auctions,
+            "flushes": self.flushes,
+            "flushed_rows": self.flushed_rows,
+            "failed_flushes": self.failed_flushes,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+        }
+
+
+_stats_rollup: Optional[StatsRollupAccumulator] = None
+
+
+def get_stats_rollup_accumulator() -> StatsRollupAccumulator:
+    """Returns singleton stats rollup accumulator."""
+    global _stats_rollup
+
+    settings = get_settings()
+    if not _stats_rollup:
+        _stats_rollup = StatsRollupAccumulator(
+            session_factory=AsyncSessionLocal,
+            flush_interval_seconds=settings.stats_rollup_flush_seconds,
+            buckets_enabled=settings.stats_buckets_enabled
+        )
+
+    return _stats_rollup
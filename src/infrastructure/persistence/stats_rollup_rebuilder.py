@@ -0,0 +1,156 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import case, func, insert, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from domain.stats import BidderStats
+from infrastructure.db.models.bidding import AuctionModel
+from infrastructure.db.models.stats import (
+    BidderBucketStatsModel,
+    CountryBucketStatsModel,
+    SupplyBidderStatsModel,
+    SupplyCountryStatsModel,
+)
+from infrastructure.repositories import StatsRepository
+from .stats_buckets import HOUR_BUCKET, MINUTE_BUCKET, bucket_start
+
+
+class StatsRollupRebuilder:
+    """
+    Recomputes the rollup and bucket tables from raw auctions and bids.
+    The auction ID space is split into chunks that are aggregated concurrently
+    on separate connections, merged in memory and swapped in with one transaction.
+    Auctions inside the minute bucket retention get minute buckets, older ones hour buckets.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        chunk_size: int,
+        workers: int,
+        minute_retention_hours: int
+    ):
+        """Initializes rebuilder with chunking and concurrency bounds."""
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.minute_retention = timedelta(hours=minute_retention_hours)
+        self._countries: dict[tuple, int] = {}
+        self._bidders: dict[tuple, BidderStats] = {}
+        self._country_buckets: dict[tuple, int] = {}
+        self._bidder_buckets: dict[tuple, BidderStats] = {}
+
+    async def rebuild(self) -> tuple[int, int]:
+        """Rebuilds all rollups and returns (country rows, bidder rows) of the all-time tables."""
+        self._countries, self._bidders = {}, {}
+        self._country_buckets, self._bidder_buckets = {}, {}
+        cutoff = bucket_start(
+            datetime.now(timezone.utc) - self.minute_retention, HOUR_BUCKET
+        )
+
+        async with self.session_factory() as session:
+            min_id, max_id = (await session.execute(
+                select(func.min(AuctionModel.id), func.max(AuctionModel.id))
+            )).one()
+
+        if min_id is not None:
+            semaphore = asyncio.Semaphore(self.workers)
+            await asyncio.gather(*(
+                self._aggregate_chunk(
+                    semaphore, start, min(start + self.chunk_size - 1, max_id), cutoff
+                )
+                for start in range(min_id, max_id + 1, self.chunk_size)
+            ))
+
+        await self._replace_rollups()
+        return len(self._countries), len(self._bidders)
+
+    async def _aggregate_chunk(
+        self,
+        semaphore: asyncio.Semaphore,
+        first_id: int,
+        last_id: int,
+        cutoff: datetime
+    ) -> None:
+        """Aggregates one auction ID range and merges it into the totals."""
+        is_recent = AuctionModel.created_at >= cutoff
+        bucket = case(
+            (is_recent, func.date_trunc('minute', AuctionModel.created_at, 'UTC')),
+            else_=func.date_trunc('hour', AuctionModel.created_at, 'UTC')
+        ).label('bucket_start')
+        resolution = case(
+            (is_recent, MINUTE_BUCKET), else_=HOUR_BUCKET
+        ).label('resolution_seconds')
+
+        auction_ids = (first_id, last_id)
+        request_counts = StatsRepository.request_counts_query(auction_ids=auction_ids)
+        bidder_stats = StatsRepository.bidder_stats_query(auction_ids=auction_ids)
+
+        async with semaphore, self.session_factory() as session:
+            request_rows = (await session.execute(
+                request_counts.add_columns(bucket, resolution).group_by(bucket, resolution)
+            )).all()
+            bidder_rows = (await session.execute(
+                bidder_stats.add_columns(bucket, resolution).group_by(bucket, resolution)
+            )).all()
+
+        for row in request_rows:
+            self._add_requests(self._countries, (row.supply_id, row.country), row.country_count)
+            self._add_requests(
+                self._country_buckets,
+                (row.bucket_start, row.resolution_seconds, row.supply_id, row.country),
+                row.country_count
+            )
+
+        for row in bidder_rows:
+            for pending, key in (
+                (self._bidders, (row.supply_id, row.bidder_id)),
+                (self._bidder_buckets, (row.bucket_start, row.resolution_seconds, row.supply_id, row.bidder_id)),
+            ):
+                totals = pending.setdefault(key, BidderStats())
+                totals.wins += row.wins
+                totals.total_revenue += float(row.total_revenue)
+                totals.no_bids += row.no_bids
+                totals.timeouts += row.timeouts
+
+    @staticmethod
+    def _add_requests(pending: dict[tuple, int], key: tuple, requests: int) -> None:
+        """Adds request count to a running total."""
+        pending[key] = pending.get(key, 0) + requests
+
+    async def _replace_rollups(self) -> None:
+        """Swaps rollup contents for the rebuilt totals in one transaction."""
+        targets = (
+            (SupplyCountryStatsModel, ("supply_id", "country"), self._countries),
+            (SupplyBidderStatsModel, ("supply_id", "bidder_id"), self._bidders),
+            (
+                CountryBucketStatsModel,
+                ("bucket_start", "resolution_seconds", "supply_id", "country"),
+                self._country_buckets
+            ),
+            (
+                BidderBucketStatsModel,
+                ("bucket_start", "resolution_seconds", "supply_id", "bidder_id"),
+                self._bidder_buckets
+            ),
+        )
+
+        async with self.session_factory() as session:
+            # TRUNCATE holds an exclusive lock, so worker flushes wait for the swap
+            await session.execute(text(
+                "TRUNCATE " + ", ".join(model.__tablename__ for model, _, _ in targets)
+            ))
+            for model, key_columns, totals in targets:
+                if not totals:
+                    continue
+                rows = []
+                for key, value in totals.items():
+                    row = dict(zip(key_columns, key))
+                    if isinstance(value, BidderStats):
+                        row.update(vars(value))
+                    else:
+                        row["requests"] = value
+                    rows.append(row)
+                await session.execute(insert(model), rows)
+            await session.commit()
@@ -0,0 +1,250 @@
+import asyncio
+import time
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.logging import get_logger
+from core.settings import get_settings
+from domain.bidding import AuctionRecord, IAuctionWriter
+from infrastructure.db.session import AsyncSessionLocal
+from infrastructure.repositories import BiddingRepository
+from .journal import encode_record
+from .segments import SegmentWriter
+
+
+logger = get_logger(__name__)
+
+
+class WriteBehindQueue(IAuctionWriter):
+    """
+    Bounded in-process queue that persists auction records in batches.
+    A background task drains the queue when a batch fills up or the flush interval passes.
+    Submitting to a full queue waits for free space, which pushes back on callers.
+
+    A failing batch is retried with backoff, then written record by record so that
+    one bad row only fails itself. Records that still fail are spilled to a sealed
+    journal segment in `spill_dir`, where the journal loader picks them up.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        max_size: int,
+        batch_size: int,
+        flush_interval_ms: int,
+        max_retries: int = 3,
+        retry_backoff_ms: int = 100,
+        spill_dir: Optional[str] = None
+    ):
+        """Initializes queue with size, batch, interval and retry bounds."""
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff_ms / 1000
+        self.spill_dir = spill_dir
+        # One writer for the queue's lifetime, so every spill gets the next segment
+        # sequence number instead of reusing a name the journal loader has checkpointed
+        self._spill_writer = (
+            SegmentWriter(spill_dir, prefix="write-behind", max_bytes=0, max_age_seconds=0)
+            if spill_dir else None
+        )
+        self._queue: asyncio.Queue[AuctionRecord] = asyncio.Queue(maxsize=max_size)
+        self._batch: list[AuctionRecord] = []
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.flushes = 0
+        self.flushed_records = 0
+        self.failed_records = 0
+        self.retried_batches = 0
+        self.isolated_batches = 0
+        self.spilled_records = 0
+        self.backpressure_waits = 0
+        self.last_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+    async def submit(self, record: AuctionRecord) -> None:
+        """Enqueues record, waiting for free space when the queue is full."""
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self.backpressure_waits += 1
+            await self._queue.put(record)
+
+    async def start(self) -> None:
+        """Starts the background drain task."""
+        if not self._task:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stops the drain task and flushes every record still in memory."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        if self._flush_task:
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+
+        while not self._queue.empty():
+            self._batch.append(self._queue.get_nowait())
+
+        for start in range(0, len(self._batch), self.batch_size):
+            await self._flush(self._batch[start:start + self.batch_size])
+        self._batch = []
+
+    async def _run(self) -> None:
+        """Drains the queue in batches until cancelled."""
+        while True:
+            await self._collect_batch()
+            batch, self._batch = self._batch, []
+            # Shielded so that shutdown does not abort a half-written batch
+            self._flush_task = asyncio.create_task(self._flush(batch))
+            await asyncio.shield(self._flush_task)
+            self._flush_task = None
+
+    async def _collect_batch(self) -> None:
+        """Waits for a full batch or for the flush interval after the first record."""
+        self._batch.append(await self._queue.get())
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(self._batch) < self.batch_size:
+            try:
+                self._batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                self._batch.append(
+                    await asyncio.wait_for(self._queue.get(), remaining)
+                )
+            except asyncio.TimeoutError:
+                break
+
+    async def _flush(self, batch: list[AuctionRecord]) -> None:
+        """Writes a batch of records to the primary database, retrying and isolating failures."""
+        if not batch:
+            return
+
+        started = time.perf_counter()
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    await self._save_batch(batch)
+                    self.flushed_records += len(batch)
+                    return
+                except Exception as e:
+                    logger.warning(
+                        f"Write-behind flush of {len(batch)} auctions failed "
+                        f"(attempt {attempt + 1}): {str(e)}"
+                    )
+                if attempt < self.max_retries:
+                    self.retried_batches += 1
+                    await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+
+            self.isolated_batches += 1
+            failed = await self._save_each(batch)
+            self.flushed_records += len(batch) - len(failed)
+            if failed:
+                await self._spill(failed)
+        finally:
+            self.last_flush_ms = (time.perf_counter() - started) * 1000
+            self.total_flush_ms += self.last_flush_ms
+            self.flushes += 1
+
+    async def _save_batch(self, batch: list[AuctionRecord]) -> None:
+        """Saves the whole batch in one transaction."""
+        async with self.session_factory() as session:
+            repository = BiddingRepository(session)
+            await repository.save_auctions_with_bids(batch)
+            await session.commit()
+
+    async def _save_each(self, batch: list[AuctionRecord]) -> list[AuctionRecord]:
+        """Saves records one savepoint at a time; returns the records that failed."""
+        failed = []
+        try:
+            async with self.session_factory() as session:
+                repository = BiddingRepository(session)
+                for record in batch:
+                    try:
+                        async with session.begin_nested():
+                            await repository.save_auction_with_bids(record)
+                    except Exception as e:
+                        failed.append(record)
+                        logger.error(
+                            f"Write-behind insert failed for supply={record.supply_id}: {str(e)}"
+                        )
+                await session.commit()
+        except Exception as e:
+            logger.error(
+                f"Write-behind record-by-record flush failed: {str(e)}", exc_info=True
+            )
+            return batch
+        return failed
+
+    async def _spill(self, records: list[AuctionRecord]) -> None:
+        """Writes records that could not be inserted to a sealed journal segment."""
+        if self._spill_writer is None:
+            self.failed_records += len(records)
+            logger.error(f"Dropped {len(records)} auctions that could not be written")
+            return
+
+        for record in records:
+            self._spill_writer.append(encode_record(record))
+        try:
+            await self._spill_writer.close()
+            self.spilled_records += len(records)
+            logger.warning(f"Spilled {len(records)} auctions to {self.spill_dir}")
+        except Exception as e:
+            self.failed_records += len(records)
+            logger.error(
+                f"Spilling {len(records)} auctions failed: {str(e)}", exc_info=True
+            )
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Returns queue depth and flush counters."""
+        return {
+            "depth": self._queue.qsize() + len(self._batch),
+            "max_size": self._queue.maxsize,
+            "flushes": self.flushes,
+            "flushed_records": self.flushed_records,
+            "failed_records": self.failed_records,
+            "retried_batches": self.retried_batches,
+            "isolated_batches": self.isolated_batches,
+            "spilled_records": self.spilled_records,
+            "backpressure_waits": self.backpressure_waits,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+            "avg_flush_ms": round(self.total_flush_ms / self.flushes, 3) if self.flushes else 0.0,
+        }
+
+
+_write_behind_queue: Optional[WriteBehindQueue] = None
+
+
+def get_write_behind_queue() -> Optional[WriteBehindQueue]:
+    """Returns singleton write-behind queue, or None when write-behind is disabled."""
+    global _write_behind_queue
+
+    settings = get_settings()
+    if not settings.write_behind_enabled:
+        return None
+
+    if not _write_behind_queue:
+        _write_behind_queue = WriteBehindQueue(
+            session_factory=AsyncSessionLocal,
+            max_size=settings.write_behind_queue_size,
+            batch_size=settings.write_behind_batch_size,
+            flush_interval_ms=settings.write_behind_flush_interval_ms,
+            max_retries=settings.write_behind_max_retries,
+            retry_backoff_ms=settings.write_behind_retry_backoff_ms,
+            spill_dir=settings.journal_dir
+        )
+
+    return _write_behind_queue
@@ -1 +1,4 @@
 from .redis_rate_limiter import RedisRateLimiter
+from .two_tier_rate_limiter import TwoTierRateLimiter
+from .batching_rate_limiter import BatchingRateLimiter
+from .factory import build_rate_limiter, get_rate_limiter, close_rate_limiter
@@ -0,0 +1,146 @@
+import asyncio
+from collections import Counter
+from typing import Optional
+
+from core.logging import get_logger
+from core.tracing import span
+from domain.bidding import RateLimitDecision
+from .redis_rate_limiter import RedisRateLimiter
+
+
+logger = get_logger(__name__)
+
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class BatchingRateLimiter:
+    """
+    Coalesces concurrent rate limit checks into pipelined Redis calls.
+    Checks arriving within `window_ms` of the first pending one, or until
+    `max_batch_size` are pending, are sent as one pipeline of limiter scripts
+    and each caller's future is resolved with its own result.
+    """
+
+    def __init__(
+        self,
+        redis_limiter: RedisRateLimiter,
+        window_ms: float,
+        max_batch_size: int
+    ):
+        """Initializes batching layer on top of a Redis limiter."""
+        self.redis_limiter = redis_limiter
+        self.window = window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self._pending: list[tuple[list[str], list[int], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+        self.batches = 0
+        self.checks = 0
+        self.batch_size_histogram: Counter[str] = Counter()
+
+    async def initialize(self) -> None:
+        """Connects the underlying Redis limiter."""
+        await self.redis_limiter.initialize()
+
+    async def check_rate_limit(
+            self,
+            key: str,
+            max_requests: Optional[int] = None,
+            window_seconds: Optional[int] = None
+    ) -> bool:
+        """Checks if request is within rate limit for given key."""
+        decision = await self.check_rate_limit_detailed(
+            key, max_requests, window_seconds
+        )
+        return decision.allowed
+
+    async def check_rate_limit_detailed(
+            self,
+            key: str,
+            max_requests: Optional[int] = None,
+            window_seconds: Optional[int] = None
+    ) -> RateLimitDecision:
+        """Queues the check for the next pipelined batch and waits for its result."""
+        keys, args = self.redis_limiter.script_arguments(
+            key, max_requests, window_seconds
+        )
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((keys, args, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+
+        # The pipeline runs in its own task; the request's span covers batching and the round-trip
+        with span("redis.rate_limit_batch", timing="redis"):
+            result = await future
+        return self.redis_limiter.parse_result(result)
+
+    def _flush(self) -> None:
+        """Sends pending checks as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._execute(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _execute(
+        self,
+        batch: list[tuple[list[str], list[int], asyncio.Future]]
+    ) -> None:
+        """Runs a batch through one Redis pipeline and resolves its futures."""
+        self._record_batch(len(batch))
+        try:
+            async with self.redis_limiter.redis.pipeline(transaction=False) as pipe:
+                for keys, args, _ in batch:
+                    await self.redis_limiter.script(keys=keys, args=args, client=pipe)
+                results = await pipe.execute(raise_on_error=False)
+        except Exception as e:
+            logger.warning(f"Batched rate limit check failed: {str(e)}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def _record_batch(self, size: int) -> None:
+        """Counts batch in the batch size histogram."""
+        self.batches += 1
+        self.checks += size
+        bucket = next(
+            (str(bound) for bound in BATCH_SIZE_BUCKETS if size <= bound),
+            "+Inf"
+        )
+        self.batch_size_histogram[bucket] += 1
+
+    @property
+    def stats(self) -> dict:
+        """Returns batch counters and the batch size distribution."""
+        return {
+            "batches": self.batches,
+            "checks": self.checks,
+            "avg_batch_size": round(self.checks / self.batches, 2) if self.batches else 0.0,
+            "batch_size_histogram": dict(self.batch_size_histogram),
+        }
+
+    async def close(self) -> None:
+        """Flushes pending checks and closes Redis."""
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.redis_limiter.close()
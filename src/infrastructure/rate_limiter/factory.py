@@ -0,0 +1,65 @@
+from typing import Optional
+
+from core.settings import get_settings
+from domain.bidding import IRateLimiter
+from .batching_rate_limiter import BatchingRateLimiter
+from .redis_rate_limiter import RedisRateLimiter
+from .two_tier_rate_limiter import TwoTierRateLimiter
+
+
+_rate_limiter: Optional[IRateLimiter] = None
+
+
+async def build_rate_limiter() -> IRateLimiter:
+    """
+    Builds and initializes a rate limiter from settings.
+    The local lease tier and micro-batching are alternatives; the local tier wins
+    when both are enabled. The local tier only enforces a single fixed window.
+    """
+    settings = get_settings()
+    if settings.rate_limit_local_tier_enabled and (
+        settings.rate_limit_algorithm != "fixed_window"
+        or settings.rate_limit_extra_windows_list
+    ):
+        raise ValueError(
+            "The local rate limit tier requires RATE_LIMIT_ALGORITHM=fixed_window "
+            "and no RATE_LIMIT_EXTRA_WINDOWS"
+        )
+    rate_limiter = RedisRateLimiter()
+
+    if settings.rate_limit_local_tier_enabled:
+        rate_limiter = TwoTierRateLimiter(
+            redis_limiter=rate_limiter,
+            max_keys=settings.rate_limit_local_max_keys,
+            lease_fraction=settings.rate_limit_local_lease_fraction,
+            sync_seconds=settings.rate_limit_local_sync_seconds,
+            min_lease=settings.rate_limit_local_min_lease
+        )
+    elif settings.rate_limit_batching_enabled:
+        rate_limiter = BatchingRateLimiter(
+            redis_limiter=rate_limiter,
+            window_ms=settings.rate_limit_batch_window_ms,
+            max_batch_size=settings.rate_limit_batch_max_size
+        )
+
+    await rate_limiter.initialize()
+    return rate_limiter
+
+
+async def get_rate_limiter() -> IRateLimiter:
+    """Returns singleton rate limiter instance built from settings."""
+    global _rate_limiter
+
+    if not _rate_limiter:
+        _rate_limiter = await build_rate_limiter()
+
+    return _rate_limiter
+
+
+async def close_rate_limiter() -> None:
+    """Closes singleton rate limiter if it was created."""
+    global _rate_limiter
+
+    if _rate_limiter:
+        await _rate_limiter.close()
+        _rate_limiter = None
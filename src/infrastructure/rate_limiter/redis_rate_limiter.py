@@ -3,25 +3,180 @@ from typing import Optional
 import redis.asyncio as aioredis
 
 from core.settings import get_settings
+from core.tracing import span
+from domain.bidding import RateLimitDecision
+
+
+# All scripts take one key per window in KEYS and the windows in ARGV as
+# limit_1, window_1, limit_2, window_2, ... The keys share the base key as
+# their hash tag, so every key of a check lives in one Redis Cluster slot.
+# A request is admitted only if every window admits it, and only then is it
+# counted in every window. Scripts return {allowed, limit, remaining, reset_ms}
+# for the most constrained window.
+
+FIXED_WINDOW_SCRIPT = """
+local allowed = 1
+local best_limit, best_remaining, best_reset = 0, nil, 0
+local windows = {}
+
+for i = 1, #KEYS do
+    local limit = tonumber(ARGV[2 * i - 1])
+    local window = tonumber(ARGV[2 * i])
+    local current = tonumber(redis.call('GET', KEYS[i]) or '0')
+    local ttl = redis.call('PTTL', KEYS[i])
+    if ttl < 0 then ttl = window * 1000 end
+
+    local remaining = limit - current - 1
+    if remaining < 0 then allowed = 0 end
+    if best_remaining == nil or remaining < best_remaining then
+        best_limit, best_remaining, best_reset = limit, remaining, ttl
+    end
+    windows[i] = window
+end
+
+if allowed == 1 then
+    for i = 1, #KEYS do
+        if redis.call('INCR', KEYS[i]) == 1 then
+            redis.call('EXPIRE', KEYS[i], windows[i])
+        end
+    end
+end
+
+return {allowed, best_limit, best_remaining, best_reset}
+"""
+
+# Each window's key is a hash holding the current bucket number and the counts
+# of that bucket and the one before it.
+SLIDING_WINDOW_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local allowed = 1
+local best_limit, best_remaining, best_reset = 0, nil, 0
+local counts = {}
+
+for i = 1, #KEYS do
+    local limit = tonumber(ARGV[2 * i - 1])
+    local window = tonumber(ARGV[2 * i])
+    local bucket = math.floor(now / window)
+    local state = redis.call('HMGET', KEYS[i], 'bucket', 'current', 'previous')
+    local stored = tonumber(state[1])
+    local current, previous = 0, 0
+    if stored == bucket then
+        current, previous = tonumber(state[2]), tonumber(state[3])
+    elseif stored == bucket - 1 then
+        previous = tonumber(state[2])
+    end
+    local elapsed = now - bucket * window
+    local estimated = previous * (window - elapsed) / window + current
+
+    local remaining = math.floor(limit - estimated - 1)
+    if estimated + 1 > limit then allowed = 0 end
+    if best_remaining == nil or remaining < best_remaining then
+        best_limit, best_remaining = limit, remaining
+        best_reset = math.ceil((window - elapsed) * 1000)
+    end
+    counts[i] = {bucket, current, previous, window}
+end
+
+if allowed == 1 then
+    for i = 1, #KEYS do
+        redis.call(
+            'HSET', KEYS[i], 'bucket', counts[i][1],
+            'current', counts[i][2] + 1, 'previous', counts[i][3]
+        )
+        redis.call('EXPIRE', KEYS[i], counts[i][4] * 2)
+    end
+end
+
+return {allowed, best_limit, best_remaining, best_reset}
+"""
+
+TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local allowed = 1
+local best_limit, best_remaining, best_reset = 0, nil, 0
+local buckets = {}
+
+for i = 1, #KEYS do
+    local capacity = tonumber(ARGV[2 * i - 1])
+    local window = tonumber(ARGV[2 * i])
+    local rate = capacity / window
+    local state = redis.call('HMGET', KEYS[i], 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+    local reset
+    if tokens < 1 then
+        allowed = 0
+        reset = (1 - tokens) / rate
+    else
+        reset = (capacity - tokens + 1) / rate
+    end
+    local remaining = math.floor(tokens - 1)
+    if best_remaining == nil or remaining < best_remaining then
+        best_limit, best_remaining = capacity, remaining
+        best_reset = math.ceil(reset * 1000)
+    end
+    buckets[i] = {tokens, window}
+end
+
+if allowed == 1 then
+    for i = 1, #KEYS do
+        redis.call('HSET', KEYS[i], 'tokens', buckets[i][1] - 1, 'ts', now)
+        redis.call('EXPIRE', KEYS[i], buckets[i][2] * 2)
+    end
+end
+
+return {allowed, best_limit, best_remaining, best_reset}
+"""
+
+SCRIPTS = {
+    "fixed_window": FIXED_WINDOW_SCRIPT,
+    "sliding_window": SLIDING_WINDOW_SCRIPT,
+    "token_bucket": TOKEN_BUCKET_SCRIPT,
+}
+
+KEY_SUFFIXES = {
+    "fixed_window": "fw",
+    "sliding_window": "sw",
+    "token_bucket": "tb",
+}
 
 
 class RedisRateLimiter:
     """
-    Redis-based rate limiter using simple counter with expiration.
+    Redis-based rate limiter.
+    Each check runs one Lua script that evaluates and updates every configured
+    window atomically, so concurrent workers cannot over-admit requests.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        algorithm: Optional[str] = None,
+        extra_windows: Optional[list[tuple[int, int]]] = None
+    ):
         """Initializes rate limiter with settings."""
         self.redis: Optional[aioredis.Redis] = None
         self.settings = get_settings()
+        self.algorithm = algorithm or self.settings.rate_limit_algorithm
+        if self.algorithm not in SCRIPTS:
+            raise ValueError(f"Unknown rate limit algorithm: '{self.algorithm}'")
+        self.extra_windows = (
+            extra_windows if extra_windows is not None
+            else self.settings.rate_limit_extra_windows_list
+        )
+        self.script = None
 
     async def initialize(self) -> None:
-        """Establishes connection to Redis server."""
+        """Establishes connection to Redis server and registers the limiter script."""
         self.redis = await aioredis.from_url(
             self.settings.redis_url,
             encoding="utf-8",
             decode_responses=True
         )
+        self.script = self.redis.register_script(SCRIPTS[self.algorithm])
 
     async def check_rate_limit(
             self,
@@ -30,38 +185,58 @@ class RedisRateLimiter:
             window_seconds: Optional[int] = None
     ) -> bool:
         """Checks if request is within rate limit for given key."""
-        max_requests = max_requests or self.settings.rate_limit_max_requests
-        window_seconds = window_seconds or self.settings.rate_limit_window_seconds
-
-        rate_limit_key = f"rate_limit:{key}"
-
-        current = await self.redis.get(rate_limit_key)
-
-        if not current:
-            await self.redis.setex(rate_limit_key, window_seconds, 1)
-            return True
-
-        if int(current) >= max_requests:
-            return False
+        decision = await self.check_rate_limit_detailed(
+            key, max_requests, window_seconds
+        )
+        return decision.allowed
 
-        await self.redis.incr(rate_limit_key)
-        return True
+    async def check_rate_limit_detailed(
+            self,
+            key: str,
+            max_requests: Optional[int] = None,
+            window_seconds: Optional[int] = None
+    ) -> RateLimitDecision:
+        """Checks rate limit in one atomic round-trip and returns the decision."""
+        keys, args = self.script_arguments(key, max_requests, window_seconds)
+        with span("redis.rate_limit", timing="redis", algorithm=self.algorithm):
+            result = await self.script(keys=keys, args=args)
+        return self.parse_result(result)
+
+    def script_arguments(
+            self,
+            key: str,
+            max_requests: Optional[int] = None,
+            window_seconds: Optional[int] = None
+    ) -> tuple[list[str], list[int]]:
+        """
+        Builds one script key per window and the window arguments for the primary
+        and extra windows. The base key is the hash tag of every window key.
+        """
+        windows = [(
+            max_requests or self.settings.rate_limit_max_requests,
+            window_seconds or self.settings.rate_limit_window_seconds
+        )] + self.extra_windows
+
+        suffix = KEY_SUFFIXES[self.algorithm]
+        keys, args = [], []
+        for limit, window in windows:
+            keys.append(f"rate_limit:{{{key}}}:{suffix}:{window}")
+            args.extend((limit, window))
+
+        return keys, args
+
+    @staticmethod
+    def parse_result(result: list) -> RateLimitDecision:
+        """Converts script reply into a rate limit decision."""
+        allowed, limit, remaining, reset_ms = (int(value) for value in result)
+        return RateLimitDecision(
+            allowed=bool(allowed),
+            limit=limit,
+            remaining=remaining,
+            reset_seconds=reset_ms / 1000
+        )
 
     async def close(self) -> None:
         """Closes Redis connection."""
         if self.redis:
             await self.redis.close()
-
-
-_rate_limiter: Optional[RedisRateLimiter] = None
-
-
-async def get_rate_limiter() -> RedisRateLimiter:
-    """Returns singleton rate limiter instance."""
-    global _rate_limiter
-
-    if not _rate_limiter:
-        _rate_limiter = RedisRateLimiter()
-        await _rate_limiter.initialize()
-
-    return _rate_limiter
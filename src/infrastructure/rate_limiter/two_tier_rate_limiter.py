@@ -0,0 +1,250 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from core.logging import get_logger
+from core.tracing import span
+from domain.bidding import RateLimitDecision
+from .redis_rate_limiter import RedisRateLimiter
+
+
+logger = get_logger(__name__)
+
+
+# KEYS[1] is the lease counter of one fixed window; ARGV is limit, window, requested.
+# Grants up to `requested` tokens that are still unused in the window.
+LEASE_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local used = tonumber(redis.call('GET', KEYS[1]) or '0')
+local granted = math.max(0, math.min(requested, limit - used))
+if granted > 0 then
+    redis.call('INCRBY', KEYS[1], granted)
+    redis.call('EXPIRE', KEYS[1], window)
+end
+return {granted, limit - used - granted}
+"""
+
+# Gives back unused tokens of a window that is still current.
+RELEASE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('DECRBY', KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+
+@dataclass
+class LocalLease:
+    """Tokens of one key's current window held by this worker."""
+
+    window: int
+    window_id: int = -1
+    tokens: int = 0
+    redis_remaining: int = 0
+    leased_at: float = 0.0
+    last_used: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class TwoTierRateLimiter:
+    """
+    Rate limiter with a per-worker local tier in front of Redis.
+    Each worker leases a slice of a key's quota for the current fixed window and
+    admits requests locally until the slice runs out; only then is Redis consulted.
+    Unused tokens of idle or evicted keys are returned to Redis periodically.
+    A worker never holds more than `lease_fraction` of a key's limit, which bounds
+    how much quota can be stranded in other workers, but never less than
+    `min_lease` tokens: small limits would otherwise lease one token at a time and
+    pay a Redis call per request. The tier only implements the fixed-window algorithm
+    on the primary window; build_rate_limiter rejects any other configuration.
+    """
+
+    def __init__(
+        self,
+        redis_limiter: RedisRateLimiter,
+        max_keys: int,
+        lease_fraction: float,
+        sync_seconds: float,
+        min_lease: int = 1
+    ):
+        """Initializes local tier on top of a Redis limiter."""
+        self.redis_limiter = redis_limiter
+        self.settings = redis_limiter.settings
+        self.max_keys = max_keys
+        self.lease_fraction = lease_fraction
+        self.sync_seconds = sync_seconds
+        self.min_lease = max(1, min_lease)
+        self._leases: OrderedDict[str, LocalLease] = OrderedDict()
+        self._releases: list[tuple[str, int]] = []
+        self._sync_task: Optional[asyncio.Task] = None
+        self._lease_script = None
+        self._release_script = None
+
+        self.local_hits = 0
+        self.redis_calls = 0
+
+    async def initialize(self) -> None:
+        """Connects the Redis tier and starts the sync task."""
+        await self.redis_limiter.initialize()
+        redis = self.redis_limiter.redis
+        self._lease_script = redis.register_script(LEASE_SCRIPT)
+        self._release_script = redis.register_script(RELEASE_SCRIPT)
+        self._sync_task = asyncio.create_task(self._run_sync())
+
+    async def check_rate_limit(
+            self,
+            key: str,
+            max_requests: Optional[int] = None,
+            window_seconds: Optional[int] = None
+    ) -> bool:
+        """Checks if request is within rate limit for given key."""
+        decision = await self.check_rate_limit_detailed(
+            key, max_requests, window_seconds
+        )
+        return decision.allowed
+
+    async def check_rate_limit_detailed(
+            self,
+            key: str,
+            max_requests: Optional[int] = None,
+            window_seconds: Optional[int] = None
+    ) -> RateLimitDecision:
+        """Admits from the local lease, leasing more from Redis when it runs out."""
+        limit = max_requests or self.settings.rate_limit_max_requests
+        window = window_seconds or self.settings.rate_limit_window_seconds
+        now = time.time()
+        window_id = int(now // window)
+        reset_seconds = (window_id + 1) * window - now
+
+        lease = self._get_lease(key, window)
+        async with lease.lock:
+            if lease.window_id != window_id:
+                self._queue_release(key, lease)
+                lease.window_id = window_id
+                lease.redis_remaining = limit
+
+            # An exhausted window is re-checked after a sync interval, since
+            # other workers may have returned unused tokens in the meantime
+            recheck_due = time.monotonic() - lease.leased_at >= self.sync_seconds
+            leased = lease.tokens == 0 and (lease.redis_remaining > 0 or recheck_due)
+            if leased:
+                await self._lease(key, lease, limit)
+
+            lease.last_used = time.monotonic()
+            if lease.tokens == 0:
+                return RateLimitDecision(
+                    allowed=False,
+                    limit=limit,
+                    remaining=0,
+                    reset_seconds=reset_seconds
+                )
+
+            lease.tokens -= 1
+            if not leased:
+                self.local_hits += 1
+            return RateLimitDecision(
+                allowed=True,
+                limit=limit,
+                remaining=lease.tokens + lease.redis_remaining,
+                reset_seconds=reset_seconds
+            )
+
+    def _get_lease(self, key: str, window: int) -> LocalLease:
+        """Returns local lease for key, evicting least recently used keys."""
+        lease = self._leases.get(key)
+        if lease is None or lease.window != window:
+            if lease is not None:
+                self._queue_release(key, lease)
+            lease = LocalLease(window=window)
+            self._leases[key] = lease
+            while len(self._leases) > self.max_keys:
+                evicted_key, evicted = self._leases.popitem(last=False)
+                self._queue_release(evicted_key, evicted)
+        self._leases.move_to_end(key)
+        return lease
+
+    async def _lease(
+        self,
+        key: str,
+        lease: LocalLease,
+        limit: int
+    ) -> None:
+        """Leases a slice of the key's quota for the current window from Redis."""
+        requested = max(self.min_lease, math.floor(limit * self.lease_fraction))
+        self.redis_calls += 1
+        with span("redis.rate_limit_lease", timing="redis", requested=requested):
+            granted, remaining = await self._lease_script(
+                keys=[self._lease_key(key, lease.window, lease.window_id)],
+                args=[limit, lease.window, requested]
+            )
+        lease.tokens = int(granted)
+        lease.redis_remaining = int(remaining)
+        lease.leased_at = time.monotonic()
+
+    def _queue_release(self, key: str, lease: LocalLease) -> None:
+        """Schedules unused tokens of a lease to be returned to Redis."""
+        if lease.tokens > 0:
+            self._releases.append(
+                (self._lease_key(key, lease.window, lease.window_id), lease.tokens)
+            )
+            lease.tokens = 0
+
+    async def sync(self) -> None:
+        """Returns unused tokens of idle and evicted leases to Redis in one pipeline."""
+        idle_before = time.monotonic() - self.sync_seconds
+        idle_keys = [
+            key for key, lease in self._leases.items()
+            if lease.last_used <= idle_before and not lease.lock.locked()
+        ]
+        for key in idle_keys:
+            self._queue_release(key, self._leases.pop(key))
+
+        releases, self._releases = self._releases, []
+        if not releases:
+            return
+
+        async with self.redis_limiter.redis.pipeline(transaction=False) as pipe:
+            for lease_key, tokens in releases:
+                await self._release_script(keys=[lease_key], args=[tokens], client=pipe)
+            await pipe.execute()
+
+    async def _run_sync(self) -> None:
+        """Syncs leases periodically until cancelled."""
+        while True:
+            await asyncio.sleep(self.sync_seconds)
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.warning(f"Rate limit lease sync failed: {str(e)}")
+
+    @staticmethod
+    def _lease_key(key: str, window: int, window_id: int) -> str:
+        """Returns Redis key of a lease counter."""
+        return f"rate_limit:{key}:lease:{window}:{window_id}"
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Returns local tier counters."""
+        return {
+            "keys": len(self._leases),
+            "local_hits": self.local_hits,
+            "redis_calls": self.redis_calls,
+        }
+
+    async def close(self) -> None:
+        """Stops syncing, returns every unused token and closes Redis."""
+        if self._sync_task:
+            self._sync_task.cancel()
+            await asyncio.gather(self._sync_task, return_exceptions=True)
+        for key, lease in self._leases.items():
+            self._queue_release(key, lease)
+        self._leases.clear()
+        try:
+            await self.sync()
+        finally:
+            await self.redis_limiter.close()
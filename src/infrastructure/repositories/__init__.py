@@ -1,2 +1,3 @@
 from .sqlalchemy_bidding_repo import BiddingRepository
 from .sqlalchemy_stats_repo import StatsRepository
+from .redis_stats_repo import RedisStatsRepository, get_redis_stats_repository
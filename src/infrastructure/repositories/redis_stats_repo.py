@@ -0,0 +1,219 @@
+from typing import Any, AsyncIterator, Optional, Sequence
+
+import redis.asyncio as aioredis
+
+from core.logging import get_logger
+from core.settings import get_settings
+from core.tracing import span
+from domain.bidding import AuctionRecord
+from domain.stats import (
+    BIDDER_ROW,
+    COUNTRY_ROW,
+    SUPPLY_ROW,
+    IStatsRecorder,
+    IStatsRepository,
+    StatsNotAvailableException,
+    StatsQuery,
+)
+
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "stats:supply:"
+BIDDER_METRICS = ("wins", "total_revenue", "no_bids", "timeouts")
+
+
+class RedisStatsRepository(IStatsRepository, IStatsRecorder):
+    """
+    Keeps real-time statistics as one Redis hash per supply.
+    Fields are total_reqs, country:<code> and bidder:<id>:<metric>; every
+    auction updates them with a single pipelined batch of increments.
+    A hash exists only once its supply has had an auction or been backfilled, so
+    unlike the SQL repository, supplies without auctions are not listed.
+    """
+
+    def __init__(self, scan_count: int = 1000):
+        """Initializes repository with settings."""
+        self.redis: Optional[aioredis.Redis] = None
+        self.settings = get_settings()
+        self.scan_count = scan_count
+
+    async def start(self) -> None:
+        """Establishes connection to Redis server."""
+        if not self.redis:
+            self.redis = await aioredis.from_url(
+                self.settings.redis_url,
+                encoding="utf-8",
+                decode_responses=True
+            )
+
+    async def close(self) -> None:
+        """Closes Redis connection."""
+        if self.redis:
+            await self.redis.close()
+            self.redis = None
+
+    async def record_auction(self, record: AuctionRecord) -> None:
+        """Increments supply counters for an auction in one pipeline round-trip."""
+        key = f"{KEY_PREFIX}{record.supply_id}"
+        pipeline = self.redis.pipeline(transaction=False)
+        pipeline.hincrby(key, "total_reqs", 1)
+        pipeline.hincrby(key, f"country:{record.country}", 1)
+
+        for bid in record.bids:
+            field = f"bidder:{bid.bidder_id}"
+            is_winner = bid.bidder_id == record.winner_bidder_id
+            # Always touched so that bidders without wins still appear
+            pipeline.hincrby(key, f"{field}:wins", int(is_winner))
+            if is_winner and bid.price:
+                pipeline.hincrbyfloat(key, f"{field}:total_revenue", bid.price)
+            if bid.timed_out:
+                pipeline.hincrby(key, f"{field}:timeouts", 1)
+            elif bid.price is None:
+                pipeline.hincrby(key, f"{field}:no_bids", 1)
+
+        try:
+            with span(
+                "redis.record_auction", timing="redis",
+                supply_id=record.supply_id, country=record.country, bidders=len(record.bids)
+            ):
+                await pipeline.execute()
+        except Exception as e:
+            # Counters can be repaired by a backfill; the auction itself must not fail
+            logger.error(f"Redis stats update failed for supply={record.supply_id}: {str(e)}")
+
+    async def get_all_stats(self) -> dict[str, Any]:
+        """Retrieves statistics for all supplies with SCAN and pipelined HGETALL."""
+        stats = {}
+        async for batch in self._scan_stats():
+            stats.update(batch)
+        return stats
+
+    async def _scan_stats(self) -> AsyncIterator[list[tuple[str, dict[str, Any]]]]:
+        """Yields (supply_id, statistics) pairs one SCAN page at a time, in no particular order."""
+        cursor = 0
+        while True:
+            # Spans must not stay open across yields, so each page gets its own
+            with span("redis.scan_stats", timing="redis") as page:
+                cursor, keys = await self.redis.scan(
+                    cursor, match=f"{KEY_PREFIX}*", count=self.scan_count
+                )
+                batch = []
+                if keys:
+                    pipeline = self.redis.pipeline(transaction=False)
+                    for key in keys:
+                        pipeline.hgetall(key)
+                    batch = [
+                        (key[len(KEY_PREFIX):], self.parse_fields(fields))
+                        for key, fields in zip(keys, await pipeline.execute())
+                    ]
+                page.set(supplies=len(batch))
+            if batch:
+                yield batch
+            if cursor == 0:
+                return
+
+    async def get_supply_stats(self, supply_id: str) -> dict[str, Any]:
+        """Retrieves statistics for specific supply."""
+        with span("redis.get_supply_stats", timing="redis", supply_id=supply_id):
+            fields = await self.redis.hgetall(f"{KEY_PREFIX}{supply_id}")
+        return self.parse_fields(fields)
+
+    async def query_stats(self, query: StatsQuery) -> dict[str, Any]:
+        """Filtered and paginated statistics are served by the SQL repository."""
+        raise StatsNotAvailableException(
+            "Filtered statistics are not available from Redis counters"
+        )
+
+    async def stream_stats(
+        self,
+        query: StatsQuery
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Yields all supplies one SCAN page at a time.
+        Supplies come in hash order rather than by ID; only unfiltered queries are
+        served from Redis.
+        """
+        if not query.is_unfiltered:
+            raise StatsNotAvailableException(
+                "Filtered statistics are not available from Redis counters"
+            )
+
+        async for batch in self._scan_stats():
+            for supply_id, supply_stats in batch:
+                yield supply_id, supply_stats
+
+    async def stream_stats_rows(self, query: StatsQuery) -> AsyncIterator[Sequence[tuple]]:
+        """
+        Yields all supplies as one batch of statistics rows.
+        Supply rows carry total_reqs, which is counted separately from countries.
+        """
+        if not query.is_unfiltered:
+            raise StatsNotAvailableException(
+                "Filtered statistics are not available from Redis counters"
+            )
+
+        rows = []
+        stats = await self.get_all_stats()
+        for supply_id, supply_stats in stats.items():
+            rows.append((supply_id, SUPPLY_ROW, None, supply_stats["total_reqs"], None, None, None, None))
+            for country, count in supply_stats["reqs_per_country"].items():
+                rows.append((supply_id, COUNTRY_ROW, country, count, None, None, None, None))
+            for bidder_id, bidder in supply_stats["bidders"].items():
+                rows.append((
+                    supply_id, BIDDER_ROW, bidder_id, None,
+                    bidder["wins"], bidder["total_revenue"], bidder["no_bids"], bidder["timeouts"]
+                ))
+        yield rows
+
+    async def replace_supply_stats(self, supply_id: str, stats: dict[str, Any]) -> None:
+        """Overwrites one supply's counters atomically with precomputed statistics."""
+        fields = {"total_reqs": stats["total_reqs"]}
+        for country, count in stats["reqs_per_country"].items():
+            fields[f"country:{country}"] = count
+        for bidder_id, bidder_stats in stats["bidders"].items():
+            for metric in BIDDER_METRICS:
+                fields[f"bidder:{bidder_id}:{metric}"] = bidder_stats[metric]
+
+        key = f"{KEY_PREFIX}{supply_id}"
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.delete(key)
+        pipeline.hset(key, mapping=fields)
+        await pipeline.execute()
+
+    @staticmethod
+    def parse_fields(fields: dict[str, str]) -> dict[str, Any]:
+        """Converts a supply hash into the repository stats dictionary."""
+        stats = {
+            "total_reqs": int(fields.get("total_reqs", 0)),
+            "reqs_per_country": {},
+            "bidders": {}
+        }
+
+        for field, value in fields.items():
+            if field.startswith("country:"):
+                stats["reqs_per_country"][field[len("country:"):]] = int(value)
+            elif field.startswith("bidder:"):
+                bidder_id, metric = field[len("bidder:"):].rsplit(":", 1)
+                bidder_stats = stats["bidders"].setdefault(bidder_id, {
+                    "wins": 0,
+                    "total_revenue": 0.0,
+                    "no_bids": 0,
+                    "timeouts": 0
+                })
+                bidder_stats[metric] = float(value) if metric == "total_revenue" else int(value)
+
+        return stats
+
+
+_redis_stats_repository: Optional[RedisStatsRepository] = None
+
+
+def get_redis_stats_repository() -> RedisStatsRepository:
+    """Returns singleton Redis stats repository."""
+    global _redis_stats_repository
+
+    if not _redis_stats_repository:
+        _redis_stats_repository = RedisStatsRepository()
+
+    return _redis_stats_repository
@@ -1,9 +1,14 @@
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from core.metrics import AUCTION_STAGE_SECONDS
+from core.tracing import span
+from domain.bidding import AuctionRecord, Bidder, Supply
+from infrastructure.cache import EligibilityCache, SupplyRegistry
 from infrastructure.db.models.bidding import (
     AuctionModel,
     BidModel,
@@ -19,9 +24,20 @@ class BiddingRepository:
     Handles supplies, bidders, auctions, and bids.
     """
 
-    def __init__(self, session: AsyncSession):
-        """Initializes repository with database session."""
+    def __init__(
+        self,
+        session: AsyncSession,
+        eligibility_cache: Optional[EligibilityCache] = None,
+        supply_registry: Optional[SupplyRegistry] = None,
+        auto_create_supplies: bool = True
+    ):
+        """Initializes repository with database session and optional caches."""
         self.session = session
+        self.eligibility_cache = eligibility_cache
+        self.supply_registry = supply_registry
+        self.auto_create_supplies = auto_create_supplies
+        # Unknown supplies answered as new ones; they have no bidders
+        self._new_supplies: set[str] = set()
 
     async def get_supply_by_id(self, supply_id: str) -> Optional[SupplyModel]:
         """Retrieves supply by ID with preloaded bidders."""
@@ -47,12 +63,41 @@ class BiddingRepository:
         self,
         supply_id: str,
         name: Optional[str] = None
-    ) -> SupplyModel:
-        """Gets existing supply or creates new one if not found."""
-        supply = await self.get_supply_by_id(supply_id)
-        if not supply:
-            supply = await self.create_supply(supply_id, name)
-        return supply
+    ) -> Optional[Supply]:
+        """
+        Gets existing supply; unknown supplies are answered as new ones when
+        auto-creation is enabled and as None otherwise.
+        A new supply has no bidders yet, so its auction always ends with no eligible
+        bidders and an insert would be rolled back; it is therefore not inserted but
+        negative-cached like a missing one. Known supplies are answered without a query.
+        """
+        if self.supply_registry:
+            if self.supply_registry.is_known(supply_id):
+                return Supply(id=supply_id)
+            if self.supply_registry.is_known_missing(supply_id):
+                return self._new_supply(supply_id, name)
+
+        with span("db.get_supply", timing="primary", supply_id=supply_id):
+            result = await self.session.execute(
+                select(SupplyModel).where(SupplyModel.id == supply_id)
+            )
+            supply = result.scalar_one_or_none()
+
+        if supply:
+            if self.supply_registry:
+                self.supply_registry.add(supply.id)
+            return Supply(id=supply.id, name=supply.name)
+
+        if self.supply_registry:
+            self.supply_registry.mark_missing(supply_id)
+        return self._new_supply(supply_id, name)
+
+    def _new_supply(self, supply_id: str, name: Optional[str]) -> Optional[Supply]:
+        """Answers an unknown supply as a new, uninserted one if auto-creation is enabled."""
+        if not self.auto_create_supplies:
+            return None
+        self._new_supplies.add(supply_id)
+        return Supply(id=supply_id, name=name)
 
     async def get_bidder_by_id(self, bidder_id: str) -> Optional[BidderModel]:
         """Retrieves bidder by ID."""
@@ -71,25 +116,47 @@ class BiddingRepository:
         bidder = BidderModel(id=bidder_id, country=country, name=name)
         self.session.add(bidder)
         await self.session.flush()
+        if self.eligibility_cache:
+            self.eligibility_cache.invalidate(country=bidder.country)
         return bidder
 
     async def get_eligible_bidders_for_supply(
         self,
         supply_id: str,
         country: str
-    ) -> list[BidderModel]:
+    ) -> list[Bidder]:
         """Retrieves bidders eligible for supply filtered by country."""
-        result = await self.session.execute(
-            select(BidderModel)
-            .join(supply_bidder_association)
-            .where(
-                and_(
-                    supply_bidder_association.c.supply_id == supply_id,
-                    BidderModel.country == country
+        if supply_id in self._new_supplies:
+            return []
+
+        if self.eligibility_cache:
+            cached = self.eligibility_cache.get(supply_id, country)
+            if cached is not None:
+                return cached
+
+        with span(
+            "db.get_eligible_bidders", timing="primary", supply_id=supply_id, country=country
+        ) as query:
+            result = await self.session.execute(
+                select(BidderModel)
+                .join(supply_bidder_association)
+                .where(
+                    and_(
+                        supply_bidder_association.c.supply_id == supply_id,
+                        BidderModel.country == country
+                    )
                 )
             )
-        )
-        return list(result.scalars().all())
+            bidders = [
+                Bidder(id=bidder.id, country=bidder.country, name=bidder.name)
+                for bidder in result.scalars().all()
+            ]
+            query.set(bidders=len(bidders))
+
+        if self.eligibility_cache:
+            self.eligibility_cache.set(supply_id, country, bidders)
+
+        return bidders
 
     async def create_auction(
         self,
@@ -159,17 +226,103 @@ class BiddingRepository:
         return auction.id
 
     async def save_bids(self, auction_id: int, bids: list) -> None:
-        for bid in bids:
-            bidder_id = getattr(
-                bid, "bidder_id", None) or getattr(bid, "id", None)
-            price = getattr(bid, "price", None)
-            latency_ms = getattr(bid, "latency_ms", None)
-            timed_out = getattr(bid, "timed_out", 0)
-
-            await self.create_bid(
-                auction_id=auction_id,
-                bidder_id=bidder_id,
-                price=price,
-                latency_ms=latency_ms,
-                timed_out=int(bool(timed_out)),
+        """Saves all bids for an auction with a single multi-row insert."""
+        if not bids:
+            return
+        await self.session.execute(
+            insert(BidModel), self.build_bid_rows(auction_id, bids)
+        )
+
+    async def save_auction_with_bids(self, record: AuctionRecord) -> int:
+        """
+        Saves auction and all of its bids in two statements:
+        INSERT ... RETURNING id for the auction, then one multi-row INSERT for bids.
+        """
+        with AUCTION_STAGE_SECONDS.time("auction_persist"), span(
+            "db.insert_auction", timing="primary",
+            supply_id=record.supply_id, country=record.country
+        ):
+            result = await self.session.execute(
+                insert(AuctionModel)
+                .values(
+                    supply_id=record.supply_id,
+                    ip_address=record.ip_address,
+                    country=record.country,
+                    tmax=record.tmax,
+                    winner_bidder_id=record.winner_bidder_id,
+                    winning_price=record.winning_price,
+                    created_at=record.created_at
+                )
+                .returning(AuctionModel.id)
             )
+            auction_id = result.scalar_one()
+
+        if record.bids:
+            with AUCTION_STAGE_SECONDS.time("bid_persist"), span(
+                "db.insert_bids", timing="primary",
+                supply_id=record.supply_id, bidders=len(record.bids)
+            ):
+                await self.session.execute(
+                    insert(BidModel),
+                    self.build_bid_rows(auction_id, record.bids, record.created_at)
+                )
+
+        return auction_id
+
+    async def save_auctions_with_bids(self, records: list[AuctionRecord]) -> list[int]:
+        """
+        Saves a batch of auctions and their bids in two statements:
+        one multi-row auction insert returning IDs in order, then one bid insert.
+        """
+        if not records:
+            return []
+
+        result = await self.session.execute(
+            insert(AuctionModel).returning(
+                AuctionModel.id, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    "supply_id": record.supply_id,
+                    "ip_address": record.ip_address,
+                    "country": record.country,
+                    "tmax": record.tmax,
+                    "winner_bidder_id": record.winner_bidder_id,
+                    "winning_price": record.winning_price,
+                    "created_at": record.created_at,
+                }
+                for record in records
+            ]
+        )
+        auction_ids = list(result.scalars().all())
+
+        bid_rows = []
+        for auction_id, record in zip(auction_ids, records):
+            bid_rows.extend(
+                self.build_bid_rows(auction_id, record.bids, record.created_at)
+            )
+        if bid_rows:
+            await self.session.execute(insert(BidModel), bid_rows)
+
+        return auction_ids
+
+    @staticmethod
+    def build_bid_rows(
+        auction_id: int,
+        bids: list,
+        created_at: Optional[datetime] = None
+    ) -> list[dict]:
+        """Converts bids into row dictionaries for bulk inserts."""
+        rows = []
+        for bid in bids:
+            row = {
+                "auction_id": auction_id,
+                "bidder_id": getattr(bid, "bidder_id", None) or getattr(bid, "id", None),
+                "price": getattr(bid, "price", None),
+                "latency_ms": getattr(bid, "latency_ms", None),
+                "timed_out": int(bool(getattr(bid, "timed_out", 0))),
+            }
+            if created_at is not None:
+                row["created_at"] = created_at
+            rows.append(row)
+        return rows
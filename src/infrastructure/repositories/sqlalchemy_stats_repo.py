@@ -1,110 +1,467 @@
-from typing import Any
+from typing import Any, AsyncIterator, Optional, Sequence, Union
 
-from sqlalchemy import select, func, and_, case
+from sqlalchemy import (
+    BigInteger,
+    Row,
+    Float,
+    Select,
+    String,
+    and_,
+    cast,
+    func,
+    literal,
+    null,
+    select,
+    union_all,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.settings import get_settings
+from core.tracing import span
+from domain.stats import (
+    BIDDER_ROW,
+    COUNTRY_ROW,
+    SUPPLY_ROW,
+    IStatsRepository,
+    StatsQuery,
+)
 from infrastructure.db.models.bidding import (
     AuctionModel,
     BidModel,
     SupplyModel,
 )
+from infrastructure.db.models.stats import (
+    BidderBucketStatsModel,
+    CountryBucketStatsModel,
+    SupplyBidderStatsModel,
+    SupplyCountryStatsModel,
+)
 
+# Supply IDs restricting a query: an explicit list or a subquery of IDs
+SupplyFilter = Optional[Union[list[str], Select]]
 
-class StatsRepository:
+
+class StatsRepository(IStatsRepository):
     """
     Repository for statistics and analytics queries.
-    Aggregates auction and bidding data for reporting.
+    Reads the rollup tables (all-time or time buckets), or aggregates raw
+    auction and bidding data.
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        use_rollups: Optional[bool] = None,
+        use_buckets: Optional[bool] = None
+    ):
         """Initializes repository with database session."""
+        settings = get_settings()
         self.session = session
+        self.use_rollups = (
+            use_rollups if use_rollups is not None
+            else settings.stats_backend == "rollup"
+        )
+        self.use_buckets = (
+            use_buckets if use_buckets is not None
+            else settings.stats_buckets_enabled
+        )
 
     async def get_all_stats(self) -> dict[str, Any]:
-        """Retrieves comprehensive statistics for all supplies."""
-        supply_result = await self.session.execute(
-            select(SupplyModel.id)
+        """
+        Retrieves comprehensive statistics for all supplies.
+        Runs three set-based queries inside one REPEATABLE READ snapshot,
+        independent of the number of supplies (and, with rollups, of auctions).
+        """
+        return await self.query_stats(StatsQuery())
+
+    async def get_supply_stats(self, supply_id: str) -> dict[str, Any]:
+        """Retrieves statistics for specific supply."""
+        await self._begin_snapshot()
+
+        stats = {supply_id: self._empty_supply_stats()}
+        await self._fill_stats(stats, [supply_id], StatsQuery())
+        return stats[supply_id]
+
+    async def get_bidder_stats_for_supply(
+        self,
+        supply_id: str
+    ) -> dict[str, dict[str, Any]]:
+        """Retrieves bidder statistics for specific supply."""
+        result = await self.session.execute(
+            self._bidder_query([supply_id], StatsQuery())
         )
-        supply_ids = [row[0] for row in supply_result.all()]
+        return {
+            row.bidder_id: self._bidder_stats_from_row(row)
+            for row in result.all()
+        }
+
+    async def query_stats(self, query: StatsQuery) -> dict[str, Any]:
+        """
+        Retrieves statistics for one page of supplies matching the filters.
+        Aggregates are restricted to the page, so cost follows the page size.
+        """
+        with span("db.query_stats", timing="replica", query=str(query)) as query_span:
+            await self._begin_snapshot()
 
-        stats = {}
-        for supply_id in supply_ids:
-            stats[supply_id] = await self.get_supply_stats(supply_id)
+            supply_result = await self.session.execute(self.supply_page_query(query))
+            stats = {
+                supply_id: self._empty_supply_stats()
+                for supply_id in supply_result.scalars().all()
+            }
 
+            if stats:
+                restricted = (
+                    query.limit is not None
+                    or query.supply_ids is not None
+                    or query.after_supply_id is not None
+                )
+                await self._fill_stats(stats, list(stats) if restricted else None, query)
+            query_span.set(supplies=len(stats))
         return stats
 
-    async def get_supply_stats(self, supply_id: str) -> dict[str, Any]:
-        """Retrieves statistics for specific supply."""
-        auction_stats_query = select(
-            func.count(AuctionModel.id).label('total_reqs'),
-            AuctionModel.country,
-            func.count(AuctionModel.country).label('country_count')
-        ).where(
-            AuctionModel.supply_id == supply_id
-        ).group_by(
-            AuctionModel.country
-        )
+    async def stream_stats(
+        self,
+        query: StatsQuery
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """
+        Yields (supply_id, statistics) one supply at a time.
+        Reads a single UNION ALL query ordered by supply through a server-side
+        cursor, so only the current supply is held in memory.
+        """
+        supply_id, supply_stats = None, None
+        async for rows in self.stream_stats_rows(query):
+            for row in rows:
+                if row.supply_id != supply_id:
+                    if supply_id is not None:
+                        yield supply_id, supply_stats
+                    supply_id, supply_stats = row.supply_id, self._empty_supply_stats()
 
-        auction_result = await self.session.execute(auction_stats_query)
-        auction_rows = auction_result.all()
+                if row.kind == COUNTRY_ROW:
+                    supply_stats["total_reqs"] += row.country_count
+                    supply_stats["reqs_per_country"][row.key] = row.country_count
+                elif row.kind == BIDDER_ROW:
+                    supply_stats["bidders"][row.key] = self._bidder_stats_from_row(row)
 
-        total_reqs = sum(row.country_count for row in auction_rows)
-        reqs_per_country = {
-            row.country: row.country_count for row in auction_rows}
+        if supply_id is not None:
+            yield supply_id, supply_stats
 
-        bidder_stats = await self.get_bidder_stats_for_supply(supply_id)
+    async def stream_stats_rows(
+        self,
+        query: StatsQuery,
+        batch_size: int = 5000
+    ) -> AsyncIterator[Sequence[Row]]:
+        """
+        Yields batches of supply, country and bidder rows ordered by supply.
+        Rows come from one UNION ALL query through a server-side cursor, so callers
+        can encode them without building per-supply dictionaries.
+        """
+        with span("db.stream_stats", timing="replica", query=str(query)):
+            await self._begin_snapshot()
 
-        return {
-            "total_reqs": total_reqs,
-            "reqs_per_country": reqs_per_country,
-            "bidders": bidder_stats
-        }
+            result = await self.session.stream(
+                self.stream_query(query),
+                execution_options={"yield_per": batch_size}
+            )
 
-    async def get_bidder_stats_for_supply(
+        # Spans must not stay open across yields, so each batch fetch gets its own
+        partitions = result.partitions()
+        while True:
+            with span("db.fetch_stats_rows", timing="replica"):
+                rows = await anext(partitions, None)
+            if rows is None:
+                return
+            yield rows
+
+    def stream_query(self, query: StatsQuery) -> Select:
+        """Builds one query returning supply, country and bidder rows grouped by supply."""
+        page = self.supply_page_query(query).subquery()
+        supplies = select(page.c.id)
+
+        request_counts = self._request_query(supplies, query).subquery()
+        bidder_stats = self._bidder_query(supplies, query).subquery()
+        no_count = cast(null(), BigInteger)
+
+        rows = union_all(
+            select(
+                page.c.id.label('supply_id'),
+                literal(SUPPLY_ROW).label('kind'),
+                cast(null(), String).label('key'),
+                no_count.label('country_count'),
+                no_count.label('wins'),
+                cast(null(), Float).label('total_revenue'),
+                no_count.label('no_bids'),
+                no_count.label('timeouts')
+            ),
+            select(
+                request_counts.c.supply_id,
+                literal(COUNTRY_ROW),
+                request_counts.c.country,
+                request_counts.c.country_count,
+                no_count,
+                cast(null(), Float),
+                no_count,
+                no_count
+            ),
+            select(
+                bidder_stats.c.supply_id,
+                literal(BIDDER_ROW),
+                bidder_stats.c.bidder_id,
+                no_count,
+                bidder_stats.c.wins,
+                bidder_stats.c.total_revenue,
+                bidder_stats.c.no_bids,
+                bidder_stats.c.timeouts
+            )
+        ).subquery()
+
+        return select(rows).order_by(rows.c.supply_id, rows.c.kind)
+
+    @staticmethod
+    def supply_page_query(query: StatsQuery) -> Select:
+        """Builds ordered supply IDs after the keyset cursor, limited to one page."""
+        supplies = select(SupplyModel.id).order_by(SupplyModel.id)
+        if query.supply_ids is not None:
+            supplies = supplies.where(SupplyModel.id.in_(query.supply_ids))
+        if query.after_supply_id is not None:
+            supplies = supplies.where(SupplyModel.id > query.after_supply_id)
+        if query.limit is not None:
+            supplies = supplies.limit(query.limit)
+        return supplies
+
+    async def _begin_snapshot(self) -> None:
+        """Starts a REPEATABLE READ transaction so all queries see one snapshot."""
+        if not self.session.in_transaction():
+            await self.session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"}
+            )
+
+    async def _fill_stats(
         self,
-        supply_id: str
-    ) -> dict[str, dict[str, Any]]:
-        """Retrieves bidder statistics for specific supply."""
+        stats: dict[str, dict[str, Any]],
+        supply_ids: SupplyFilter,
+        query: StatsQuery
+    ) -> None:
+        """Adds request and bidder aggregates to per-supply stats dictionaries."""
+        request_result = await self.session.execute(
+            self._request_query(supply_ids, query)
+        )
+        for row in request_result.all():
+            supply_stats = stats.setdefault(row.supply_id, self._empty_supply_stats())
+            supply_stats["total_reqs"] += row.country_count
+            supply_stats["reqs_per_country"][row.country] = row.country_count
+
+        bidder_result = await self.session.execute(
+            self._bidder_query(supply_ids, query)
+        )
+        for row in bidder_result.all():
+            supply_stats = stats.setdefault(row.supply_id, self._empty_supply_stats())
+            supply_stats["bidders"][row.bidder_id] = self._bidder_stats_from_row(row)
+
+    def _source(self, query: StatsQuery) -> str:
+        """
+        Picks the cheapest table set able to answer the query.
+        Rollups have no country dimension for bidders, so country filters read raw rows.
+        """
+        if not self.use_rollups or query.country is not None:
+            return "raw"
+        if query.is_time_ranged:
+            return "buckets" if self.use_buckets else "raw"
+        return "rollup"
+
+    def _request_query(self, supply_ids: SupplyFilter, query: StatsQuery) -> Select:
+        """Returns request counts query for the chosen source and filters."""
+        source = self._source(query)
+        if source == "rollup":
+            return self.rollup_request_counts_query(supply_ids)
+        if source == "buckets":
+            return self.bucket_request_counts_query(supply_ids, query)
+        return self.request_counts_query(supply_ids, query=query)
+
+    def _bidder_query(self, supply_ids: SupplyFilter, query: StatsQuery) -> Select:
+        """Returns bidder aggregates query for the chosen source and filters."""
+        source = self._source(query)
+        if source == "rollup":
+            return self.rollup_bidder_stats_query(supply_ids, query.bidder_id)
+        if source == "buckets":
+            return self.bucket_bidder_stats_query(supply_ids, query)
+        return self.bidder_stats_query(supply_ids, query=query)
+
+    @staticmethod
+    def bucket_request_counts_query(supply_ids: SupplyFilter, query: StatsQuery) -> Select:
+        """Builds request counts summed over the time buckets starting inside the range."""
+        buckets = CountryBucketStatsModel
+        counts = select(
+            buckets.supply_id,
+            buckets.country,
+            cast(func.sum(buckets.requests), BigInteger).label('country_count')
+        ).group_by(
+            buckets.supply_id,
+            buckets.country
+        )
+        if supply_ids is not None:
+            counts = counts.where(buckets.supply_id.in_(supply_ids))
+        return StatsRepository._filter_buckets(counts, buckets, query)
+
+    @staticmethod
+    def bucket_bidder_stats_query(supply_ids: SupplyFilter, query: StatsQuery) -> Select:
+        """Builds bidder aggregates summed over the time buckets starting inside the range."""
+        buckets = BidderBucketStatsModel
+        aggregates = select(
+            buckets.supply_id,
+            buckets.bidder_id,
+            cast(func.sum(buckets.wins), BigInteger).label('wins'),
+            func.sum(buckets.total_revenue).label('total_revenue'),
+            cast(func.sum(buckets.no_bids), BigInteger).label('no_bids'),
+            cast(func.sum(buckets.timeouts), BigInteger).label('timeouts')
+        ).group_by(
+            buckets.supply_id,
+            buckets.bidder_id
+        )
+        if supply_ids is not None:
+            aggregates = aggregates.where(buckets.supply_id.in_(supply_ids))
+        if query.bidder_id is not None:
+            aggregates = aggregates.where(buckets.bidder_id == query.bidder_id)
+        return StatsRepository._filter_buckets(aggregates, buckets, query)
+
+    @staticmethod
+    def _filter_buckets(statement: Select, buckets, query: StatsQuery) -> Select:
+        """Keeps buckets of any resolution whose start lies in the half-open range."""
+        if query.since is not None:
+            statement = statement.where(buckets.bucket_start >= query.since)
+        if query.until is not None:
+            statement = statement.where(buckets.bucket_start < query.until)
+        return statement
+
+    @staticmethod
+    def rollup_request_counts_query(supply_ids: SupplyFilter = None) -> Select:
+        """Builds request counts read from the supply-country rollup."""
+        query = select(
+            SupplyCountryStatsModel.supply_id,
+            SupplyCountryStatsModel.country,
+            SupplyCountryStatsModel.requests.label('country_count')
+        )
+        if supply_ids is not None:
+            query = query.where(SupplyCountryStatsModel.supply_id.in_(supply_ids))
+        return query
+
+    @staticmethod
+    def rollup_bidder_stats_query(
+        supply_ids: SupplyFilter = None,
+        bidder_id: Optional[str] = None
+    ) -> Select:
+        """Builds bidder aggregates read from the supply-bidder rollup."""
         query = select(
+            SupplyBidderStatsModel.supply_id,
+            SupplyBidderStatsModel.bidder_id,
+            SupplyBidderStatsModel.wins,
+            SupplyBidderStatsModel.total_revenue,
+            SupplyBidderStatsModel.no_bids,
+            SupplyBidderStatsModel.timeouts
+        )
+        if supply_ids is not None:
+            query = query.where(SupplyBidderStatsModel.supply_id.in_(supply_ids))
+        if bidder_id is not None:
+            query = query.where(SupplyBidderStatsModel.bidder_id == bidder_id)
+        return query
+
+    @staticmethod
+    def request_counts_query(
+        supply_ids: SupplyFilter = None,
+        auction_ids: Optional[tuple[int, int]] = None,
+        query: Optional[StatsQuery] = None
+    ) -> Select:
+        """Builds auction counts grouped by supply and country, optionally for an ID range."""
+        counts = select(
+            AuctionModel.supply_id,
+            AuctionModel.country,
+            func.count().label('country_count')
+        ).group_by(
+            AuctionModel.supply_id,
+            AuctionModel.country
+        )
+        if supply_ids is not None:
+            counts = counts.where(AuctionModel.supply_id.in_(supply_ids))
+        if auction_ids is not None:
+            counts = counts.where(AuctionModel.id.between(*auction_ids))
+        if query is not None:
+            counts = StatsRepository._filter_auctions(counts, query)
+        return counts
+
+    @staticmethod
+    def bidder_stats_query(
+        supply_ids: SupplyFilter = None,
+        auction_ids: Optional[tuple[int, int]] = None,
+        query: Optional[StatsQuery] = None
+    ) -> Select:
+        """Builds bid aggregates grouped by supply and bidder, optionally for an auction ID range."""
+        is_winner = AuctionModel.winner_bidder_id == BidModel.bidder_id
+        aggregates = select(
+            AuctionModel.supply_id,
             BidModel.bidder_id,
-            func.sum(
-                case((AuctionModel.winner_bidder_id ==
-                     BidModel.bidder_id, 1), else_=0)
-            ).label('wins'),
+            func.count().filter(is_winner).label('wins'),
             func.coalesce(
-                func.sum(
-                    case((AuctionModel.winner_bidder_id ==
-                         BidModel.bidder_id, BidModel.price), else_=0)
-                ),
-                0
+                func.sum(BidModel.price).filter(is_winner), 0
             ).label('total_revenue'),
-            func.sum(
-                case((and_(BidModel.price.is_(None),
-                     BidModel.timed_out == 0), 1), else_=0)
+            func.count().filter(
+                and_(BidModel.price.is_(None), BidModel.timed_out == 0)
             ).label('no_bids'),
-            func.sum(
-                case((BidModel.timed_out == 1, 1), else_=0)
-            ).label('timeouts')
+            func.count().filter(BidModel.timed_out == 1).label('timeouts')
         ).join(
-            AuctionModel, BidModel.auction_id == AuctionModel.id
-        ).where(
-            AuctionModel.supply_id == supply_id
+            # Bids share their auction's created_at, the partition key of both tables
+            AuctionModel,
+            and_(
+                BidModel.auction_id == AuctionModel.id,
+                BidModel.created_at == AuctionModel.created_at
+            )
         ).group_by(
+            AuctionModel.supply_id,
             BidModel.bidder_id
         )
+        if supply_ids is not None:
+            aggregates = aggregates.where(AuctionModel.supply_id.in_(supply_ids))
+        if auction_ids is not None:
+            # Both sides, so each table is read through its own index
+            aggregates = aggregates.where(
+                AuctionModel.id.between(*auction_ids),
+                BidModel.auction_id.between(*auction_ids)
+            )
+        if query is not None:
+            aggregates = StatsRepository._filter_auctions(aggregates, query)
+            # Repeated on bids because the planner does not carry ranges across the join
+            if query.since is not None:
+                aggregates = aggregates.where(BidModel.created_at >= query.since)
+            if query.until is not None:
+                aggregates = aggregates.where(BidModel.created_at < query.until)
+            if query.bidder_id is not None:
+                aggregates = aggregates.where(BidModel.bidder_id == query.bidder_id)
+        return aggregates
 
-        result = await self.session.execute(query)
-        rows = result.all()
-
-        bidder_stats = {}
-        for row in rows:
-            stat_dict = {
-                "wins": row.wins,
-                "total_revenue": float(row.total_revenue),
-                "no_bids": row.no_bids,
-                "timeouts": row.timeouts
-            }
+    @staticmethod
+    def _filter_auctions(statement: Select, query: StatsQuery) -> Select:
+        """Applies country and half-open time range filters on auctions."""
+        if query.country is not None:
+            statement = statement.where(AuctionModel.country == query.country)
+        if query.since is not None:
+            statement = statement.where(AuctionModel.created_at >= query.since)
+        if query.until is not None:
+            statement = statement.where(AuctionModel.created_at < query.until)
+        return statement
 
-            bidder_stats[row.bidder_id] = stat_dict
+    @staticmethod
+    def _empty_supply_stats() -> dict[str, Any]:
+        """Returns stats dictionary for a supply without auctions."""
+        return {
+            "total_reqs": 0,
+            "reqs_per_country": {},
+            "bidders": {}
+        }
 
-        return bidder_stats
+    @staticmethod
+    def _bidder_stats_from_row(row) -> dict[str, Any]:
+        """Converts aggregate row into bidder stats dictionary."""
+        return {
+            "wins": row.wins,
+            "total_revenue": float(row.total_revenue),
+            "no_bids": row.no_bids,
+            "timeouts": row.timeouts
+        }
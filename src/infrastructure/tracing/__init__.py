@@ -0,0 +1,7 @@
+from .exporters import (
+    FileTraceExporter,
+    OTLPTraceExporter,
+    TraceExporter,
+    encode_otlp,
+    get_trace_exporter,
+)
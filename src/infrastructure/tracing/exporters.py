@@ -0,0 +1,214 @@
+import json
+import os
+import queue
+import threading
+import urllib.request
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional
+
+from core.logging import get_logger
+from core.settings import get_settings
+from core.tracing import Trace
+
+
+logger = get_logger(__name__)
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL, SPAN_KIND_SERVER = 1, 2
+STATUS_CODE_ERROR = 2
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    """Encodes one attribute as an OTLP key/value."""
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
+
+
+def encode_otlp(traces: list[Trace], service_name: str) -> bytes:
+    """
+    Encodes traces as an OTLP/HTTP JSON export request.
+    The span whose parent is outside this service is the request's server span.
+    """
+    spans = []
+    for trace in traces:
+        for span in trace.spans:
+            encoded = {
+                "traceId": trace.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": SPAN_KIND_SERVER if span.parent_id == trace.parent_id else SPAN_KIND_INTERNAL,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [
+                    _attribute(key, value)
+                    for key, value in span.attributes.items()
+                    if value is not None
+                ],
+            }
+            if span.parent_id:
+                encoded["parentSpanId"] = span.parent_id
+            if span.error:
+                encoded["status"] = {"code": STATUS_CODE_ERROR, "message": span.error}
+            spans.append(encoded)
+
+    return json.dumps(
+        {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    _attribute("service.name", service_name),
+                    _attribute("process.pid", os.getpid()),
+                ]},
+                "scopeSpans": [{"scope": {"name": "bidding-api"}, "spans": spans}],
+            }]
+        },
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+class TraceExporter(ABC):
+    """
+    Exports sampled traces in batches from a background thread, so requests only
+    enqueue them. Traces arriving while the queue is full are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        queue_size: int = 1000,
+        batch_size: int = 64,
+        flush_interval_seconds: float = 1.0
+    ):
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+
+        self.exported = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def export(self, trace: Trace) -> None:
+        """Queues a finished trace without blocking."""
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self) -> None:
+        """Starts the export thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=type(self).__name__, daemon=True
+            )
+            self._thread.start()
+
+    def close(self) -> None:
+        """Exports queued traces and stops the thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Collects traces into batches until the stop marker arrives."""
+        stopping = False
+        while not stopping:
+            batch = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval_seconds)
+                while item is not None:
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    item = self._queue.get_nowait()
+                stopping = item is None
+            except queue.Empty:
+                pass
+
+            if batch:
+                try:
+                    self.write(encode_otlp(batch, self.service_name))
+                    self.exported += len(batch)
+                except Exception as e:
+                    self.failed += len(batch)
+                    logger.warning(f"{type(self).__name__} export failed: {str(e)}")
+
+    @abstractmethod
+    def write(self, payload: bytes) -> None:
+        """Delivers one encoded batch."""
+        pass
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Returns export counters and queue depth."""
+        return {
+            "depth": self._queue.qsize(),
+            "exported": self.exported,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+class FileTraceExporter(TraceExporter):
+    """Appends export requests as JSON lines to a per-process file, replayable into a collector."""
+
+    def __init__(self, directory: str, service_name: str, **kwargs):
+        super().__init__(service_name, **kwargs)
+        self.path = Path(directory) / f"traces-{os.getpid()}.jsonl"
+
+    def write(self, payload: bytes) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as file:
+            file.write(payload + b"\n")
+
+
+class OTLPTraceExporter(TraceExporter):
+    """Posts export requests to an OTLP/HTTP collector endpoint."""
+
+    def __init__(self, endpoint: str, service_name: str, timeout_seconds: float = 5.0, **kwargs):
+        super().__init__(service_name, **kwargs)
+        self.endpoint = endpoint
+        self.timeout_seconds = timeout_seconds
+
+    def write(self, payload: bytes) -> None:
+        request = urllib.request.Request(
+            self.endpoint,
+            data=payload,
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+            response.read()
+
+
+_trace_exporter: Optional[TraceExporter] = None
+
+
+def get_trace_exporter() -> Optional[TraceExporter]:
+    """Returns singleton trace exporter, or None when tracing is disabled."""
+    global _trace_exporter
+
+    settings = get_settings()
+    if not settings.tracing_enabled:
+        return None
+
+    if _trace_exporter is None:
+        options = {
+            "service_name": settings.tracing_service_name,
+            "queue_size": settings.tracing_queue_size,
+            "batch_size": settings.tracing_batch_size,
+        }
+        if settings.tracing_exporter == "otlp":
+            _trace_exporter = OTLPTraceExporter(settings.tracing_otlp_endpoint, **options)
+        else:
+            _trace_exporter = FileTraceExporter(settings.tracing_dir, **options)
+    return _trace_exporter
@@ -1,23 +1,123 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 
+from api.container import AppContainer
+from api.tracing import TracingMiddleware
 from api.v1 import bidding_router, stats_router
 from core.logging import setup_logging, get_logger
+from core.metrics import registry, render_metrics, run_snapshot_loop
 from core.settings import get_settings
-from infrastructure.db.session import init_db, close_db
+from infrastructure.cache import get_eligibility_cache, get_supply_registry
+from infrastructure.db.session import init_db, close_db, AsyncSessionLocal
+from infrastructure.persistence import AuctionPartitionManager, StatsBucketDownsampler
+from infrastructure.tracing import get_trace_exporter
 
 setup_logging()
 logger = get_logger(__name__)
 settings = get_settings()
 
 
+async def warm_up_caches() -> None:
+    """Preloads in-process caches so the first requests skip the database."""
+    eligibility_cache = get_eligibility_cache()
+    if eligibility_cache:
+        try:
+            async with AsyncSessionLocal() as session:
+                entries = await eligibility_cache.warm_up(session)
+            logger.info(f'Eligibility cache warmed up with {entries} entries')
+        except Exception as e:
+            logger.warning(f'Eligibility cache warm-up failed: {str(e)}')
+
+    supply_registry = get_supply_registry()
+    if supply_registry:
+        try:
+            async with AsyncSessionLocal() as session:
+                supplies = await supply_registry.refresh(session)
+            logger.info(f'Supply registry loaded with {supplies} supplies')
+        except Exception as e:
+            logger.warning(f'Supply registry load failed: {str(e)}')
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info('Starting FastAPI application')
     # Database initialization is done in entrypoint.sh before workers start
+    await warm_up_caches()
+
+    container = await AppContainer.create(settings)
+    app.state.container = container
+    registry.register_collector(container.collect_metrics)
+
+    auction_writer = container.auction_writer
+    if auction_writer:
+        await auction_writer.start()
+
+    stats_recorder = container.stats_recorder
+    if stats_recorder:
+        await stats_recorder.start()
+
+    event_log = container.event_log
+    if event_log:
+        await event_log.start()
+
+    trace_exporter = get_trace_exporter()
+    if trace_exporter:
+        trace_exporter.start()
+
+    background_tasks = []
+    supply_registry = container.supply_registry
+    if supply_registry:
+        background_tasks.append(asyncio.create_task(
+            supply_registry.run_refresh_loop(
+                AsyncSessionLocal,
+                settings.supply_registry_refresh_seconds
+            )
+        ))
+
+    partition_manager = AuctionPartitionManager(
+        session_factory=AsyncSessionLocal,
+        premake_days=settings.partition_premake_days,
+        retention_days=settings.partition_retention_days,
+        retention_mode=settings.partition_retention_mode
+    )
+    background_tasks.append(asyncio.create_task(
+        partition_manager.run_forever(settings.partition_maintenance_interval_seconds)
+    ))
+
+    if settings.metrics_enabled:
+        background_tasks.append(asyncio.create_task(
+            run_snapshot_loop(settings.metrics_dir, settings.metrics_snapshot_interval_seconds)
+        ))
+
+    if settings.stats_backend == "rollup" and settings.stats_buckets_enabled:
+        downsampler = StatsBucketDownsampler(
+            session_factory=AsyncSessionLocal,
+            minute_retention_hours=settings.stats_minute_bucket_retention_hours
+        )
+        background_tasks.append(asyncio.create_task(
+            downsampler.run_forever(settings.stats_downsample_interval_seconds)
+        ))
+
     yield
     logger.info('Shutting down FastAPI application')
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    if auction_writer:
+        await auction_writer.close()
+        logger.info(f'Auction writer flushed: {auction_writer.stats}')
+    if stats_recorder:
+        await stats_recorder.close()
+        logger.info(f'Stats recorder flushed: {stats_recorder.stats}')
+    if event_log:
+        await event_log.close()
+        logger.info(f'Auction event log flushed: {event_log.stats}')
+    if trace_exporter:
+        await asyncio.to_thread(trace_exporter.close)
+        logger.info(f'Trace exporter flushed: {trace_exporter.stats}')
+    await container.close()
     await close_db()
 
 
@@ -36,6 +136,13 @@ app.add_middleware(
     allow_headers=['*'],
 )
 
+if settings.tracing_enabled:
+    app.add_middleware(
+        TracingMiddleware,
+        exporter=get_trace_exporter(),
+        sample_rate=settings.tracing_sample_rate
+    )
+
 app.include_router(bidding_router, prefix='/api/v1')
 app.include_router(stats_router, prefix='/api/v1')
 
@@ -46,3 +153,15 @@ async def health_check():
         'status': 'healthy',
         'service': 'bidding-api'
     }
+
+
+@app.get('/metrics', tags=['health'], include_in_schema=False)
+async def metrics():
+    """Exposes metrics of all workers in the Prometheus text format."""
+    body = await asyncio.to_thread(
+        render_metrics,
+        settings.metrics_dir if settings.metrics_enabled else None,
+        settings.metrics_gauge_max_age_seconds,
+        registry.snapshot()
+    )
+    return Response(body, media_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,253 @@
+"""
+Management commands for the bidding service.
+
+Run from the src directory, e.g.:
+
+    python manage.py load-journal
+    python manage.py rebuild-rollups
+    python manage.py downsample-stats
+    python manage.py backfill-redis-stats
+    python manage.py maintain-partitions
+    python manage.py check-plans
+"""
+import argparse
+import asyncio
+
+from core.settings import get_settings
+
+
+async def load_journal(once: bool) -> None:
+    """Bulk-loads sealed auction journal segments into the primary database."""
+    from core.logging import setup_logging
+    from infrastructure.db.session import AsyncSessionLocal, close_db
+    from infrastructure.persistence import JournalLoader
+
+    setup_logging()
+    settings = get_settings()
+    loader = JournalLoader(
+        directory=settings.journal_dir,
+        session_factory=AsyncSessionLocal,
+        stale_segment_seconds=settings.journal_stale_segment_seconds,
+        quarantine_dir=settings.journal_quarantine_dir
+    )
+
+    try:
+        if once:
+            loaded = await loader.run_once()
+            print(f"Loaded {loaded} auctions from journal")
+        else:
+            await loader.run_forever(settings.journal_loader_interval_seconds)
+    finally:
+        await close_db()
+
+
+async def rebuild_rollups(chunk_size: int, workers: int) -> None:
+    """Recomputes the stats rollup tables from raw auctions and bids."""
+    from infrastructure.db.session import AsyncSessionLocal, close_db
+    from infrastructure.persistence import StatsRollupRebuilder
+
+    settings = get_settings()
+    rebuilder = StatsRollupRebuilder(
+        session_factory=AsyncSessionLocal,
+        chunk_size=chunk_size,
+        workers=workers,
+        minute_retention_hours=settings.stats_minute_bucket_retention_hours
+    )
+
+    try:
+        country_rows, bidder_rows = await rebuilder.rebuild()
+        print(
+            f"Rebuilt rollups: {country_rows} supply-country rows, "
+            f"{bidder_rows} supply-bidder rows"
+        )
+    finally:
+        await close_db()
+
+
+async def downsample_stats() -> None:
+    """Folds expired minute stats buckets into hour buckets."""
+    from infrastructure.db.session import AsyncSessionLocal, close_db
+    from infrastructure.persistence import StatsBucketDownsampler
+
+    settings = get_settings()
+    downsampler = StatsBucketDownsampler(
+        session_factory=AsyncSessionLocal,
+        minute_retention_hours=settings.stats_minute_bucket_retention_hours
+    )
+
+    try:
+        removed = await downsampler.run_once()
+        print(f"Downsampled {removed} minute buckets")
+    finally:
+        await close_db()
+
+
+async def backfill_redis_stats() -> None:
+    """Overwrites Redis stats counters with aggregates computed from Postgres."""
+    from infrastructure.db.session import AsyncSessionLocal, close_db
+    from infrastructure.repositories import RedisStatsRepository, StatsRepository
+
+    redis_stats = RedisStatsRepository()
+    await redis_stats.start()
+
+    try:
+        async with AsyncSessionLocal() as session:
+            stats = await StatsRepository(session, use_rollups=False).get_all_stats()
+
+        for supply_id, supply_stats in stats.items():
+            await redis_stats.replace_supply_stats(supply_id, supply_stats)
+        print(f"Backfilled Redis stats for {len(stats)} supplies")
+    finally:
+        await redis_stats.close()
+        await close_db()
+
+
+async def maintain_partitions(premake_days: int, retention_days: int, mode: str) -> None:
+    """Creates upcoming auction partitions and detaches or drops expired ones."""
+    from infrastructure.db.session import AsyncSessionLocal, close_db
+    from infrastructure.persistence import AuctionPartitionManager
+
+    manager = AuctionPartitionManager(
+        session_factory=AsyncSessionLocal,
+        premake_days=premake_days,
+        retention_days=retention_days,
+        retention_mode=mode
+    )
+
+    try:
+        created, expired = await manager.run_once()
+        print(f"Created {len(created)} partitions: {', '.join(created) or '-'}")
+        print(f"Expired ({mode}) {len(expired)} partitions: {', '.join(expired) or '-'}")
+    finally:
+        await close_db()
+
+
+async def check_plans(seed_auctions: int, min_table_rows: int) -> bool:
+    """Explains the stats queries and reports sequential scans of large tables."""
+    from infrastructure.db.query_plans import QueryPlanChecker
+    from infrastructure.db.session import AsyncSessionLocal, close_db
+
+    checker = QueryPlanChecker(
+        session_factory=AsyncSessionLocal,
+        seed_auctions=seed_auctions,
+        min_table_rows=min_table_rows
+    )
+
+    try:
+        checks = await checker.run()
+    finally:
+        await close_db()
+
+    for check in checks:
+        status = "ok" if check.ok else "SEQ SCAN " + ", ".join(check.seq_scans)
+        print(f"{check.name:<50} cost={check.cost:<12.2f} {status}")
+    failed = sum(not check.ok for check in checks)
+    print(f"{len(checks) - failed} of {len(checks)} query plans use indexes")
+    return failed == 0
+
+
+def main() -> None:
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(description="Bidding service management commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    journal_parser = subparsers.add_parser(
+        "load-journal",
+        help="Load sealed auction journal segments into Postgres"
+    )
+    journal_parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Load available segments and exit instead of polling"
+    )
+
+    rollups_parser = subparsers.add_parser(
+        "rebuild-rollups",
+        help="Recompute stats rollup tables from raw auctions and bids; "
+             "counts recorded by running workers during the rebuild may be lost or doubled"
+    )
+    rollups_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.stats_rebuild_chunk_size,
+        help="Auction IDs aggregated per query"
+    )
+    rollups_parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.stats_rebuild_workers,
+        help="Chunks aggregated concurrently"
+    )
+
+    subparsers.add_parser(
+        "downsample-stats",
+        help="Fold minute stats buckets past their retention into hour buckets"
+    )
+    subparsers.add_parser(
+        "backfill-redis-stats",
+        help="Overwrite Redis stats counters from Postgres; "
+             "increments made by running workers during the backfill may be lost"
+    )
+
+    partitions_parser = subparsers.add_parser(
+        "maintain-partitions",
+        help="Create upcoming daily partitions of auctions and bids and remove expired ones; "
+             "rollups keep counting expired days, but rebuild-rollups only recounts attached ones"
+    )
+    partitions_parser.add_argument(
+        "--premake-days",
+        type=int,
+        default=settings.partition_premake_days,
+        help="Days of partitions to create ahead of today"
+    )
+    partitions_parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=settings.partition_retention_days,
+        help="Days of raw history to keep; 0 keeps everything"
+    )
+    partitions_parser.add_argument(
+        "--mode",
+        choices=("detach", "drop"),
+        default=settings.partition_retention_mode,
+        help="Detach expired partitions as standalone tables or drop them"
+    )
+
+    plans_parser = subparsers.add_parser(
+        "check-plans",
+        help="EXPLAIN the stats queries on seeded data and fail on sequential scans of "
+             "large tables; seed rows are rolled back, so use a scratch database"
+    )
+    plans_parser.add_argument(
+        "--seed-auctions",
+        type=int,
+        default=100000,
+        help="Synthetic auctions inserted before explaining; 0 explains against existing data"
+    )
+    plans_parser.add_argument(
+        "--min-table-rows",
+        type=int,
+        default=10000,
+        help="Sequential scans of smaller tables and partitions are allowed"
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "load-journal":
+        asyncio.run(load_journal(args.once))
+    elif args.command == "rebuild-rollups":
+        asyncio.run(rebuild_rollups(args.chunk_size, args.workers))
+    elif args.command == "downsample-stats":
+        asyncio.run(downsample_stats())
+    elif args.command == "backfill-redis-stats":
+        asyncio.run(backfill_redis_stats())
+    elif args.command == "maintain-partitions":
+        asyncio.run(maintain_partitions(args.premake_days, args.retention_days, args.mode))
+    elif args.command == "check-plans":
+        if not asyncio.run(check_plans(args.seed_auctions, args.min_table_rows)):
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
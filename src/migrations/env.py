@@ -22,6 +22,13 @@ from infrastructure.db.models.bidding import (  # noqa: E402,F401
     bidder,
     supply,
 )
+from infrastructure.db.models.journal import segment  # noqa: E402,F401
+from infrastructure.db.models.stats import (  # noqa: E402,F401
+    bidder_bucket,
+    country_bucket,
+    supply_bidder,
+    supply_country,
+)
 
 # ----------------- CONFIG -----------------
 config = context.config
@@ -0,0 +1,64 @@
+"""stats rollups
+
+Revision ID: 7c2e91a4d5b3
+Revises: 251db3139b74
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e91a4d5b3'
+down_revision: Union[str, Sequence[str], None] = '251db3139b74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('stats_supply_country',
+    sa.Column('supply_id', sa.String(), nullable=False),
+    sa.Column('country', sa.String(length=2), nullable=False),
+    sa.Column('requests', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('supply_id', 'country')
+    )
+    op.create_table('stats_supply_bidder',
+    sa.Column('supply_id', sa.String(), nullable=False),
+    sa.Column('bidder_id', sa.String(), nullable=False),
+    sa.Column('wins', sa.BigInteger(), nullable=False),
+    sa.Column('total_revenue', sa.Float(), nullable=False),
+    sa.Column('no_bids', sa.BigInteger(), nullable=False),
+    sa.Column('timeouts', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('supply_id', 'bidder_id')
+    )
+
+    # Seed the rollups from existing history
+    op.execute("""
+        INSERT INTO stats_supply_country (supply_id, country, requests)
+        SELECT supply_id, country, count(*)
+        FROM auctions
+        GROUP BY supply_id, country
+    """)
+    op.execute("""
+        INSERT INTO stats_supply_bidder (supply_id, bidder_id, wins, total_revenue, no_bids, timeouts)
+        SELECT
+            a.supply_id,
+            b.bidder_id,
+            count(*) FILTER (WHERE a.winner_bidder_id = b.bidder_id),
+            coalesce(sum(b.price) FILTER (WHERE a.winner_bidder_id = b.bidder_id), 0),
+            count(*) FILTER (WHERE b.price IS NULL AND b.timed_out = 0),
+            count(*) FILTER (WHERE b.timed_out = 1)
+        FROM bids b
+        JOIN auctions a ON a.id = b.auction_id
+        GROUP BY a.supply_id, b.bidder_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('stats_supply_bidder')
+    op.drop_table('stats_supply_country')
@@ -0,0 +1,72 @@
+"""stats buckets
+
+Revision ID: a41f0c8e2d6b
+Revises: 7c2e91a4d5b3
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41f0c8e2d6b'
+down_revision: Union[str, Sequence[str], None] = '7c2e91a4d5b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('stats_bucket_country',
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('resolution_seconds', sa.Integer(), nullable=False),
+    sa.Column('supply_id', sa.String(), nullable=False),
+    sa.Column('country', sa.String(length=2), nullable=False),
+    sa.Column('requests', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket_start', 'resolution_seconds', 'supply_id', 'country')
+    )
+    op.create_table('stats_bucket_bidder',
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('resolution_seconds', sa.Integer(), nullable=False),
+    sa.Column('supply_id', sa.String(), nullable=False),
+    sa.Column('bidder_id', sa.String(), nullable=False),
+    sa.Column('wins', sa.BigInteger(), nullable=False),
+    sa.Column('total_revenue', sa.Float(), nullable=False),
+    sa.Column('no_bids', sa.BigInteger(), nullable=False),
+    sa.Column('timeouts', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket_start', 'resolution_seconds', 'supply_id', 'bidder_id')
+    )
+
+    # Seed existing history as hourly buckets
+    op.execute("""
+        INSERT INTO stats_bucket_country (bucket_start, resolution_seconds, supply_id, country, requests)
+        SELECT date_trunc('hour', created_at, 'UTC'), 3600, supply_id, country, count(*)
+        FROM auctions
+        WHERE created_at IS NOT NULL
+        GROUP BY 1, supply_id, country
+    """)
+    op.execute("""
+        INSERT INTO stats_bucket_bidder (bucket_start, resolution_seconds, supply_id, bidder_id, wins, total_revenue, no_bids, timeouts)
+        SELECT
+            date_trunc('hour', a.created_at, 'UTC'),
+            3600,
+            a.supply_id,
+            b.bidder_id,
+            count(*) FILTER (WHERE a.winner_bidder_id = b.bidder_id),
+            coalesce(sum(b.price) FILTER (WHERE a.winner_bidder_id = b.bidder_id), 0),
+            count(*) FILTER (WHERE b.price IS NULL AND b.timed_out = 0),
+            count(*) FILTER (WHERE b.timed_out = 1)
+        FROM bids b
+        JOIN auctions a ON a.id = b.auction_id
+        WHERE a.created_at IS NOT NULL
+        GROUP BY 1, a.supply_id, b.bidder_id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('stats_bucket_bidder')
+    op.drop_table('stats_bucket_country')
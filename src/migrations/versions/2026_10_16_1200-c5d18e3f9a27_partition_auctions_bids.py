@@ -0,0 +1,166 @@
+"""partition auctions and bids
+
+Revision ID: c5d18e3f9a27
+Revises: a41f0c8e2d6b
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d18e3f9a27'
+down_revision: Union[str, Sequence[str], None] = 'a41f0c8e2d6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Days of partitions created ahead; the application keeps extending them
+PREMAKE_DAYS = 7
+
+
+def create_daily_partitions(table: str, first_day, last_day) -> None:
+    """Creates one partition per UTC day in the inclusive range and a default partition."""
+    day = first_day
+    while day <= last_day:
+        next_day = day + timedelta(days=1)
+        op.execute(
+            f"CREATE TABLE {table}_p{day:%Y%m%d} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{day.isoformat()} 00:00:00+00') "
+            f"TO ('{next_day.isoformat()} 00:00:00+00')"
+        )
+        day = next_day
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Move the heap tables aside, keeping the ID sequences for the new tables
+    op.drop_constraint('bids_auction_id_fkey', 'bids', type_='foreignkey')
+    op.drop_index('ix_bids_bidder_id', table_name='bids')
+    op.drop_index('ix_bids_auction_id', table_name='bids')
+    op.drop_index('ix_auctions_supply_id', table_name='auctions')
+    op.drop_constraint('bids_pkey', 'bids', type_='primary')
+    op.drop_constraint('auctions_pkey', 'auctions', type_='primary')
+    op.execute("ALTER SEQUENCE auctions_id_seq OWNED BY NONE")
+    op.execute("ALTER SEQUENCE bids_id_seq OWNED BY NONE")
+    op.rename_table('auctions', 'auctions_unpartitioned')
+    op.rename_table('bids', 'bids_unpartitioned')
+
+    op.create_table('auctions',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('auctions_id_seq')"), nullable=False),
+    sa.Column('supply_id', sa.String(), nullable=False),
+    sa.Column('ip_address', sa.String(), nullable=False),
+    sa.Column('country', sa.String(length=2), nullable=False),
+    sa.Column('winner_bidder_id', sa.String(), nullable=True),
+    sa.Column('winning_price', sa.Float(), nullable=True),
+    sa.Column('tmax', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['supply_id'], ['supplies.id'], ),
+    sa.ForeignKeyConstraint(['winner_bidder_id'], ['bidders.id'], ),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)'
+    )
+    op.create_table('bids',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('bids_id_seq')"), nullable=False),
+    sa.Column('auction_id', sa.Integer(), nullable=False),
+    sa.Column('bidder_id', sa.String(), nullable=False),
+    sa.Column('price', sa.Float(), nullable=True),
+    sa.Column('latency_ms', sa.Integer(), nullable=True),
+    sa.Column('timed_out', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['auction_id', 'created_at'], ['auctions.id', 'auctions.created_at'], name='bids_auction_fkey'),
+    sa.ForeignKeyConstraint(['bidder_id'], ['bidders.id'], ),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)'
+    )
+    op.execute("ALTER SEQUENCE auctions_id_seq OWNED BY auctions.id")
+    op.execute("ALTER SEQUENCE bids_id_seq OWNED BY bids.id")
+
+    first_created = op.get_bind().scalar(sa.text(
+        "SELECT min(created_at) FROM auctions_unpartitioned"
+    ))
+    today = datetime.now(timezone.utc).date()
+    first_day = min(first_created.astimezone(timezone.utc).date(), today) if first_created else today
+    for table in ('auctions', 'bids'):
+        create_daily_partitions(table, first_day, today + timedelta(days=PREMAKE_DAYS))
+
+    # Bids take their auction's timestamp so both rows land in the same day
+    op.execute("""
+        INSERT INTO auctions (id, supply_id, ip_address, country, winner_bidder_id, winning_price, tmax, created_at)
+        SELECT id, supply_id, ip_address, country, winner_bidder_id, winning_price, tmax, coalesce(created_at, now())
+        FROM auctions_unpartitioned
+    """)
+    op.execute("""
+        INSERT INTO bids (id, auction_id, bidder_id, price, latency_ms, timed_out, created_at)
+        SELECT b.id, b.auction_id, b.bidder_id, b.price, b.latency_ms, b.timed_out, a.created_at
+        FROM bids_unpartitioned b
+        JOIN auctions a ON a.id = b.auction_id
+    """)
+    op.drop_table('bids_unpartitioned')
+    op.drop_table('auctions_unpartitioned')
+
+    op.create_index(op.f('ix_auctions_supply_id'), 'auctions', ['supply_id'], unique=False)
+    op.create_index(op.f('ix_bids_auction_id'), 'bids', ['auction_id'], unique=False)
+    op.create_index(op.f('ix_bids_bidder_id'), 'bids', ['bidder_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER SEQUENCE auctions_id_seq OWNED BY NONE")
+    op.execute("ALTER SEQUENCE bids_id_seq OWNED BY NONE")
+    op.rename_table('auctions', 'auctions_partitioned')
+    op.rename_table('bids', 'bids_partitioned')
+    op.drop_index('ix_bids_bidder_id', table_name='bids_partitioned')
+    op.drop_index('ix_bids_auction_id', table_name='bids_partitioned')
+    op.drop_index('ix_auctions_supply_id', table_name='auctions_partitioned')
+
+    op.create_table('auctions',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('auctions_id_seq')"), nullable=False),
+    sa.Column('supply_id', sa.String(), nullable=False),
+    sa.Column('ip_address', sa.String(), nullable=False),
+    sa.Column('country', sa.String(length=2), nullable=False),
+    sa.Column('winner_bidder_id', sa.String(), nullable=True),
+    sa.Column('winning_price', sa.Float(), nullable=True),
+    sa.Column('tmax', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['supply_id'], ['supplies.id'], ),
+    sa.ForeignKeyConstraint(['winner_bidder_id'], ['bidders.id'], ),
+    sa.PrimaryKeyConstraint('id', name='auctions_pkey_unpartitioned')
+    )
+    op.create_table('bids',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('bids_id_seq')"), nullable=False),
+    sa.Column('auction_id', sa.Integer(), nullable=False),
+    sa.Column('bidder_id', sa.String(), nullable=False),
+    sa.Column('price', sa.Float(), nullable=True),
+    sa.Column('latency_ms', sa.Integer(), nullable=True),
+    sa.Column('timed_out', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['bidder_id'], ['bidders.id'], ),
+    sa.PrimaryKeyConstraint('id', name='bids_pkey_unpartitioned')
+    )
+    op.execute("""
+        INSERT INTO auctions (id, supply_id, ip_address, country, winner_bidder_id, winning_price, tmax, created_at)
+        SELECT id, supply_id, ip_address, country, winner_bidder_id, winning_price, tmax, created_at
+        FROM auctions_partitioned
+    """)
+    op.execute("""
+        INSERT INTO bids (id, auction_id, bidder_id, price, latency_ms, timed_out, created_at)
+        SELECT id, auction_id, bidder_id, price, latency_ms, timed_out, created_at
+        FROM bids_partitioned
+    """)
+    # Drops every attached partition with its parent
+    op.drop_table('bids_partitioned')
+    op.drop_table('auctions_partitioned')
+
+    op.execute("ALTER TABLE auctions RENAME CONSTRAINT auctions_pkey_unpartitioned TO auctions_pkey")
+    op.execute("ALTER TABLE bids RENAME CONSTRAINT bids_pkey_unpartitioned TO bids_pkey")
+    op.create_foreign_key('bids_auction_id_fkey', 'bids', 'auctions', ['auction_id'], ['id'])
+    op.execute("ALTER SEQUENCE auctions_id_seq OWNED BY auctions.id")
+    op.execute("ALTER SEQUENCE bids_id_seq OWNED BY bids.id")
+    op.create_index(op.f('ix_auctions_supply_id'), 'auctions', ['supply_id'], unique=False)
+    op.create_index(op.f('ix_bids_auction_id'), 'bids', ['auction_id'], unique=False)
+    op.create_index(op.f('ix_bids_bidder_id'), 'bids', ['bidder_id'], unique=False)
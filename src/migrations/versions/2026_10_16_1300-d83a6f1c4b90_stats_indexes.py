@@ -0,0 +1,61 @@
+"""stats indexes
+
+Revision ID: d83a6f1c4b90
+Revises: c5d18e3f9a27
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd83a6f1c4b90'
+down_revision: Union[str, Sequence[str], None] = 'c5d18e3f9a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Request counts grouped by (supply_id, country) become index-only scans
+    op.create_index(
+        'ix_auctions_supply_id_country', 'auctions', ['supply_id', 'country'],
+        unique=False, postgresql_include=['winner_bidder_id']
+    )
+    op.drop_index('ix_auctions_supply_id', table_name='auctions')
+
+    # Bids are joined to auctions on the full auction key; the included columns
+    # are everything the bidder aggregates read from bids
+    op.create_index(
+        'ix_bids_auction_id_created_at', 'bids', ['auction_id', 'created_at'],
+        unique=False, postgresql_include=['bidder_id', 'price', 'timed_out']
+    )
+    op.drop_index('ix_bids_auction_id', table_name='bids')
+
+    # Rows arrive in created_at order, so block ranges narrow time filters inside a partition
+    op.create_index(
+        'ix_auctions_created_at_brin', 'auctions', ['created_at'],
+        unique=False, postgresql_using='brin'
+    )
+    op.create_index(
+        'ix_bids_created_at_brin', 'bids', ['created_at'],
+        unique=False, postgresql_using='brin'
+    )
+
+    # Bidder filters on the all-time rollup without a supply filter
+    op.create_index(
+        'ix_stats_supply_bidder_bidder_id', 'stats_supply_bidder', ['bidder_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_stats_supply_bidder_bidder_id', table_name='stats_supply_bidder')
+    op.drop_index('ix_bids_created_at_brin', table_name='bids')
+    op.drop_index('ix_auctions_created_at_brin', table_name='auctions')
+    op.create_index(op.f('ix_bids_auction_id'), 'bids', ['auction_id'], unique=False)
+    op.drop_index('ix_bids_auction_id_created_at', table_name='bids')
+    op.create_index(op.f('ix_auctions_supply_id'), 'auctions', ['supply_id'], unique=False)
+    op.drop_index('ix_auctions_supply_id_country', table_name='auctions')
@@ -3,6 +3,11 @@ from pydantic import BaseModel, Field, field_validator
 import re
 
 
+IPV4_PATTERN = re.compile(
+    r'^((25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])\.){3}(25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])$'
+)
+
+
 class BidRequest(BaseModel):
     """Request model for POST /bid endpoint."""
 
@@ -20,8 +25,7 @@ class BidRequest(BaseModel):
     @classmethod
     def validate_ip_address(cls, v: str) -> str:
         """Validate that the IP address follows the IPv4 pattern."""
-        ipv4_pattern = r'^((25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])\.){3}(25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])$'
-        if not re.match(ipv4_pattern, v):
+        if not IPV4_PATTERN.match(v):
             raise ValueError(
                 f"Invalid IP address format: '{v}'. "
                 "Expected IPv4 format (e.g., 192.168.1.1)"
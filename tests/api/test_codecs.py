@@ -0,0 +1,58 @@
+import json
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from api.v1 import codecs
+from api.v1.codecs import FastJSONResponse, FastJSONRoute, json_dumps, json_loads
+
+
+class Echo(BaseModel):
+    name: str
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    """Runs a test with orjson, when installed, and with the stdlib fallback."""
+    if request.param == "orjson" and codecs.orjson is None:
+        pytest.skip("orjson is not installed")
+    if request.param == "stdlib":
+        monkeypatch.setattr(codecs, "orjson", None)
+    return request.param
+
+
+def test_round_trip(codec):
+    content = {"supply_id": "s1", "price": 0.75, "bids": [None, True], "name": "Zürich"}
+
+    assert json_loads(json_dumps(content)) == content
+
+
+def test_dumps_is_compact(codec):
+    assert json_dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+
+def test_invalid_json_raises_stdlib_error(codec):
+    with pytest.raises(json.JSONDecodeError):
+        json_loads(b'{"supply_id": ')
+
+
+def test_fast_json_route_parses_and_validates_bodies():
+    router = APIRouter(route_class=FastJSONRoute)
+
+    @router.post("/echo", response_class=FastJSONResponse)
+    async def echo(body: Echo):
+        return {"name": body.name}
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    headers = {"Content-Type": "application/json"}
+
+    response = client.post("/echo", content=b'{"name":"s1"}', headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"name": "s1"}
+
+    assert client.post("/echo", content=b'{"name":', headers=headers).status_code == 422
+    assert client.post("/echo", content=b"{}", headers=headers).status_code == 422
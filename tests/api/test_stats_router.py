@@ -0,0 +1,57 @@
+import json
+
+import fakeredis
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api import container as container_module
+from api.container import AppContainer
+from api.v1.routers.stats import router
+from core.settings import Settings
+from infrastructure.repositories.redis_stats_repo import KEY_PREFIX, RedisStatsRepository
+
+
+def sql_repository(session):
+    raise AssertionError("unfiltered statistics must be read from Redis")
+
+
+@pytest.fixture
+def redis_server(monkeypatch):
+    """Serves Redis stats from an in-memory server shared with a sync client for seeding."""
+    server = fakeredis.FakeServer()
+    repository = RedisStatsRepository()
+    repository.redis = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    monkeypatch.setattr(container_module, "get_redis_stats_repository", lambda: repository)
+    return fakeredis.FakeRedis(server=server)
+
+
+def make_client(stats_repository_factory):
+    container = AppContainer(
+        settings=Settings(stats_backend="redis"),
+        bid_generator=None,
+        rate_limiter=None,
+        bidding_repository_factory=None,
+        stats_repository_factory=stats_repository_factory
+    )
+    app = FastAPI()
+    app.include_router(router)
+    app.state.container = container
+    return TestClient(app)
+
+
+def test_ndjson_streams_unfiltered_stats_from_redis(redis_server):
+    redis_server.hset(f"{KEY_PREFIX}s1", mapping={
+        "total_reqs": 3, "country:US": 3, "bidder:b1:wins": 1, "bidder:b1:total_revenue": 0.5,
+    })
+
+    response = make_client(sql_repository).get("/stat", params={"format": "ndjson"})
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [{
+        "supply_id": "s1",
+        "total_reqs": 3,
+        "reqs_per_country": {"US": 3},
+        "bidders": {"b1": {"wins": 1, "total_revenue": 0.5, "no_bids": 0, "timeouts": 0}},
+    }]
@@ -0,0 +1,189 @@
+import logging
+import queue
+from types import SimpleNamespace
+
+import pytest
+
+from application import RunAuctionUseCase, bidding_use_case
+from core import logging as core_logging
+from core.logging import DroppingQueueHandler, log_queue_stats, setup_logging, shutdown_logging
+from core.settings import Settings
+from domain.bidding import (
+    AuctionRequest,
+    AuctionResult,
+    Bid,
+    Bidder,
+    NoBidsReceivedException,
+    RateLimitDecision,
+    Supply,
+)
+
+
+@pytest.fixture
+def root_logger():
+    """Restores root logger handlers and level changed by a test."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_full_queue_drops_records_instead_of_blocking():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    logger = logging.Logger("dropping-test")
+    logger.addHandler(handler)
+
+    for i in range(5):
+        logger.warning("record %d", i)
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_queued_records_are_left_unformatted():
+    handler = DroppingQueueHandler(queue.Queue())
+    logger = logging.Logger("dropping-test")
+    logger.addHandler(handler)
+
+    logger.warning("supply=%s", "s1")
+
+    record = handler.queue.get_nowait()
+    assert (record.msg, record.args) == ("supply=%s", ("s1",))
+
+
+def test_log_queue_stats_reports_the_root_queue_handler(root_logger):
+    assert log_queue_stats() == {}
+
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    root_logger.addHandler(handler)
+    handler.handle(logging.makeLogRecord({"msg": "first"}))
+    handler.handle(logging.makeLogRecord({"msg": "second"}))
+
+    assert log_queue_stats() == {"depth": 1, "dropped": 1}
+
+
+def test_setup_logging_writes_through_the_queue_listener(root_logger, monkeypatch, tmp_path):
+    settings = Settings(log_level="INFO", log_queue_enabled=True, log_queue_size=10)
+    monkeypatch.setattr(core_logging, "get_settings", lambda: settings)
+    monkeypatch.setattr(core_logging, "Path", lambda _: tmp_path)
+    root_logger.handlers[:] = []
+
+    setup_logging()
+    [handler] = root_logger.handlers
+    assert isinstance(handler, DroppingQueueHandler)
+    assert handler.queue.maxsize == 10
+
+    logging.getLogger("setup-test").info("written by the listener")
+    shutdown_logging()
+
+    [log_file] = tmp_path.glob("app_*.log")
+    assert "written by the listener" in log_file.read_text()
+
+
+def test_setup_logging_without_queue_attaches_handlers_directly(root_logger, monkeypatch, tmp_path):
+    settings = Settings(log_level="INFO", log_queue_enabled=False)
+    monkeypatch.setattr(core_logging, "get_settings", lambda: settings)
+    monkeypatch.setattr(core_logging, "Path", lambda _: tmp_path)
+    root_logger.handlers[:] = []
+
+    setup_logging()
+
+    assert not any(isinstance(h, DroppingQueueHandler) for h in root_logger.handlers)
+    assert log_queue_stats() == {}
+
+
+class AuctionRepository:
+    """Repository stand-in with one supply and one eligible bidder."""
+
+    def __init__(self):
+        self.session = SimpleNamespace(commit=self._commit)
+
+    async def _commit(self):
+        pass
+
+    async def get_or_create_supply(self, supply_id):
+        return Supply(supply_id)
+
+    async def get_eligible_bidders_for_supply(self, supply_id, country):
+        return [Bidder("b1", country)]
+
+    async def save_auction_with_bids(self, record):
+        return 1
+
+
+class AuctionService:
+    """Auction service stand-in that either picks b1 or receives no bids."""
+
+    def __init__(self, no_bids=False):
+        self.no_bids = no_bids
+
+    async def run_auction(self, eligible_bidders, supply_id, country, tmax=None):
+        if self.no_bids:
+            raise NoBidsReceivedException(supply_id, [Bid("b1")])
+        return AuctionResult("b1", 1.25, [Bid("b1", price=1.25)], supply_id, country)
+
+
+class AllowAll:
+    async def check_rate_limit_detailed(self, key, max_requests=None, window_seconds=None):
+        return RateLimitDecision(allowed=True, limit=3, remaining=2, reset_seconds=60.0)
+
+
+@pytest.fixture
+def details(monkeypatch):
+    """Collects every auction detail record the use case builds."""
+    built = []
+
+    class RecordingDetails(bidding_use_case.AuctionLogDetails):
+        def __init__(self, *args):
+            super().__init__(*args)
+            built.append(self)
+
+    monkeypatch.setattr(bidding_use_case, "AuctionLogDetails", RecordingDetails)
+    return built
+
+
+async def run_auction(sample_rate, no_bids=False):
+    use_case = RunAuctionUseCase(
+        bidding_repository=AuctionRepository(),
+        rate_limiter=AllowAll(),
+        auction_service=AuctionService(no_bids=no_bids),
+        settings=Settings(auction_log_sample_rate=sample_rate)
+    )
+    request = AuctionRequest("s1", "10.0.0.1", "US")
+    if no_bids:
+        with pytest.raises(NoBidsReceivedException):
+            await use_case.execute(request)
+    else:
+        await use_case.execute(request)
+
+
+@pytest.mark.parametrize("no_bids", [False, True])
+async def test_auction_details_are_not_built_without_info(caplog, details, no_bids):
+    caplog.set_level(logging.WARNING, logger=bidding_use_case.logger.name)
+
+    await run_auction(sample_rate=1.0, no_bids=no_bids)
+
+    assert details == []
+
+
+async def test_sampled_auction_details_are_logged(caplog, details):
+    caplog.set_level(logging.INFO, logger=bidding_use_case.logger.name)
+
+    await run_auction(sample_rate=1.0)
+
+    assert len(details) == 1
+    assert "Auction for s1 (country=US)" in caplog.text
+    assert "b1 - price 1.25" in caplog.text
+
+
+async def test_zero_sample_rate_still_logs_failed_auctions(caplog, details):
+    caplog.set_level(logging.INFO, logger=bidding_use_case.logger.name)
+
+    await run_auction(sample_rate=0.0)
+    assert details == []
+
+    await run_auction(sample_rate=0.0, no_bids=True)
+    assert len(details) == 1
+    assert "FAILED Auction for s1 (country=US)" in caplog.text
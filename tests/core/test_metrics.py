@@ -0,0 +1,89 @@
+import json
+import time
+
+from application import bidding_use_case
+from core.metrics import SNAPSHOT_PREFIX, MetricsRegistry, render_metrics, write_snapshot
+from infrastructure.repositories import sqlalchemy_bidding_repo
+
+
+def worker_snapshot(pid, age_seconds=0.0, requests=1.0, queue_depth=0):
+    """Builds the snapshot another worker would have written."""
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests", ("route",)).inc("bid", amount=requests)
+    registry.register_collector(
+        lambda: [("queue_depth", "gauge", "Queued records", {}, queue_depth)]
+    )
+    snapshot = registry.snapshot()
+    snapshot["pid"] = pid
+    snapshot["time"] = time.time() - age_seconds
+    return snapshot
+
+
+def test_auction_stages_share_one_histogram():
+    assert bidding_use_case.AUCTION_STAGE_SECONDS is sqlalchemy_bidding_repo.AUCTION_STAGE_SECONDS
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("stage_seconds", "Stages", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, "persist")
+
+    text = render_metrics(snapshot=registry.snapshot())
+
+    assert 'stage_seconds_bucket{stage="persist",le="0.1"} 1' in text
+    assert 'stage_seconds_bucket{stage="persist",le="1.0"} 2' in text
+    assert 'stage_seconds_bucket{stage="persist",le="+Inf"} 3' in text
+    assert 'stage_seconds_sum{stage="persist"} 5.55' in text
+    assert 'stage_seconds_count{stage="persist"} 3' in text
+    assert "# TYPE stage_seconds histogram" in text
+
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter("errors_total", "Errors", ("message",)).inc('say "hi"\\\n')
+
+    text = render_metrics(snapshot=registry.snapshot())
+
+    assert 'errors_total{message="say \\"hi\\"\\\\\\n"} 1' in text
+
+
+def test_counters_are_summed_across_worker_snapshots(tmp_path):
+    (tmp_path / f"{SNAPSHOT_PREFIX}1.json").write_text(
+        json.dumps(worker_snapshot(pid=1, requests=2))
+    )
+
+    text = render_metrics(str(tmp_path), snapshot=worker_snapshot(pid=2, requests=3))
+
+    assert 'requests_total{route="bid"} 5' in text
+
+
+def test_stale_gauges_are_dropped(tmp_path):
+    (tmp_path / f"{SNAPSHOT_PREFIX}1.json").write_text(
+        json.dumps(worker_snapshot(pid=1, age_seconds=120, queue_depth=7))
+    )
+
+    text = render_metrics(
+        str(tmp_path), gauge_max_age_seconds=30, snapshot=worker_snapshot(pid=2, queue_depth=4)
+    )
+
+    assert 'queue_depth{pid="2"} 4' in text
+    assert 'pid="1"' not in text
+    assert 'requests_total{route="bid"} 2' in text
+
+
+def test_own_snapshot_file_is_not_counted_twice(tmp_path):
+    snapshot = worker_snapshot(pid=2, requests=3)
+    write_snapshot(str(tmp_path), snapshot)
+
+    text = render_metrics(str(tmp_path), snapshot=snapshot)
+
+    assert 'requests_total{route="bid"} 3' in text
+
+
+def test_unreadable_snapshots_are_skipped(tmp_path):
+    (tmp_path / f"{SNAPSHOT_PREFIX}1.json").write_text("{not json")
+
+    text = render_metrics(str(tmp_path), snapshot=worker_snapshot(pid=2))
+
+    assert 'requests_total{route="bid"} 1' in text
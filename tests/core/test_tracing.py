@@ -0,0 +1,152 @@
+import asyncio
+import json
+
+import pytest
+
+from api.tracing import TracingMiddleware
+from core.tracing import current_trace, detached_context, end_trace, span, start_trace
+from infrastructure.tracing import FileTraceExporter, TraceExporter
+
+
+TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class RecordingExporter(TraceExporter):
+    """Keeps exported traces in memory instead of delivering them."""
+
+    def __init__(self):
+        super().__init__("test")
+        self.traces = []
+
+    def export(self, trace):
+        self.traces.append(trace)
+
+    def write(self, payload):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def clean_trace():
+    yield
+    end_trace()
+
+
+def test_span_outside_a_trace_does_nothing():
+    with span("idle", timing="db"):
+        pass
+
+    assert current_trace() is None
+
+
+def test_spans_nest_and_sum_timings():
+    trace = start_trace(sample_rate=1.0)
+    with span("outer") as outer:
+        with span("query", timing="db"):
+            pass
+        with span("query", timing="db"):
+            pass
+
+    inner = [recorded for recorded in trace.spans if recorded.name == "query"]
+    assert [recorded.parent_id for recorded in inner] == [outer.span_id] * 2
+    assert set(trace.timings) == {"db"}
+    assert "db;dur=" in trace.server_timing()
+
+
+def test_unsampled_trace_keeps_timings_only():
+    trace = start_trace(sample_rate=0.0)
+    with span("query", timing="db"):
+        pass
+
+    assert trace.spans == []
+    assert "db" in trace.timings
+
+
+def test_traceparent_continues_the_callers_trace():
+    trace = start_trace(sample_rate=0.0, traceparent=TRACEPARENT)
+    with span("handler"):
+        pass
+
+    assert trace.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert trace.sampled
+    assert trace.spans[0].parent_id == "b7ad6b7169203331"
+
+
+async def test_spans_after_the_request_are_dropped():
+    trace = start_trace(sample_rate=1.0)
+    release = asyncio.Event()
+
+    async def lingering():
+        await release.wait()
+        with span("late", timing="db"):
+            pass
+
+    task = asyncio.create_task(lingering())
+    end_trace()
+    release.set()
+    await task
+
+    assert trace.finished
+    assert trace.spans == []
+    assert trace.timings == {}
+
+
+async def test_detached_tasks_do_not_inherit_the_trace():
+    start_trace(sample_rate=1.0)
+
+    async def background():
+        return current_trace()
+
+    assert await asyncio.create_task(background(), context=detached_context()) is None
+    assert current_trace() is not None
+
+
+def test_trace_exporter_requires_write():
+    class Incomplete(TraceExporter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete("test")
+
+
+def test_file_exporter_writes_otlp_lines(tmp_path):
+    exporter = FileTraceExporter(str(tmp_path), service_name="bidding-api")
+    trace = start_trace(sample_rate=1.0)
+    with span("auction", supply_id="s1"):
+        pass
+    end_trace()
+
+    exporter.start()
+    exporter.export(trace)
+    exporter.close()
+
+    [line] = exporter.path.read_text().splitlines()
+    [encoded] = json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert encoded["traceId"] == trace.trace_id
+    assert encoded["attributes"] == [{"key": "supply_id", "value": {"stringValue": "s1"}}]
+    assert exporter.stats["exported"] == 1
+
+
+async def test_middleware_adds_server_timing_and_exports():
+    exporter = RecordingExporter()
+
+    async def app(scope, receive, send):
+        with span("db.query", timing="db"):
+            pass
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = TracingMiddleware(app, exporter, sample_rate=1.0)
+    scope = {"type": "http", "method": "GET", "path": "/stats", "headers": []}
+    await middleware(scope, None, send)
+
+    headers = dict(sent[0]["headers"])
+    assert headers[b"server-timing"].startswith(b"db;dur=")
+    [trace] = exporter.traces
+    assert trace.finished
+    assert {recorded.name for recorded in trace.spans} == {"db.query", "GET /stats"}
+    assert current_trace() is None
@@ -0,0 +1,75 @@
+import asyncio
+from typing import Optional
+
+import pytest
+
+from domain.bidding import AuctionService, Bid, Bidder, IBidGenerator, NoBidsReceivedException
+
+
+class ScriptedBidGenerator(IBidGenerator):
+    """Answers with a fixed price per bidder; None means no bid, an exception fails the bidder."""
+
+    def __init__(self, answers: dict[str, object]):
+        self.answers = answers
+
+    async def generate_bid(self, bidder: Bidder, tmax: Optional[int] = None) -> Bid:
+        answer = self.answers[bidder.id]
+        if isinstance(answer, Exception):
+            raise answer
+        return Bid(bidder_id=bidder.id, price=answer, latency_ms=1)
+
+
+BIDDERS = [Bidder(id="b1", country="US"), Bidder(id="b2", country="US")]
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+async def test_highest_valid_bid_wins(concurrent):
+    service = AuctionService(
+        ScriptedBidGenerator({"b1": 0.5, "b2": 0.7}), concurrent_fan_out=concurrent
+    )
+
+    result = await service.run_auction(BIDDERS, "s1", "US", tmax=100)
+
+    assert result.winner_bidder_id == "b2"
+    assert result.winning_price == 0.7
+
+
+async def test_failing_bidder_is_recorded_as_no_bid():
+    service = AuctionService(
+        ScriptedBidGenerator({"b1": RuntimeError("bidder down"), "b2": 0.7}),
+        concurrent_fan_out=True
+    )
+
+    result = await service.run_auction(BIDDERS, "s1", "US", tmax=100)
+
+    assert result.winner_bidder_id == "b2"
+    failed = next(bid for bid in result.all_bids if bid.bidder_id == "b1")
+    assert failed.is_no_bid
+    assert failed.latency_ms is not None
+
+
+async def test_all_bidders_failing_raises_no_bids():
+    service = AuctionService(
+        ScriptedBidGenerator({"b1": RuntimeError("down"), "b2": RuntimeError("down")}),
+        concurrent_fan_out=True
+    )
+
+    with pytest.raises(NoBidsReceivedException) as raised:
+        await service.run_auction(BIDDERS, "s1", "US", tmax=100)
+
+    assert [bid.bidder_id for bid in raised.value.all_bids] == ["b1", "b2"]
+
+
+async def test_bidder_past_tmax_is_recorded_as_timed_out():
+    class SlowBidGenerator(ScriptedBidGenerator):
+        async def generate_bid(self, bidder: Bidder, tmax: Optional[int] = None) -> Bid:
+            if bidder.id == "b1":
+                await asyncio.sleep(1)
+            return await super().generate_bid(bidder, tmax)
+
+    service = AuctionService(SlowBidGenerator({"b1": 0.9, "b2": 0.7}), concurrent_fan_out=True)
+
+    result = await service.run_auction(BIDDERS, "s1", "US", tmax=20)
+
+    assert result.winner_bidder_id == "b2"
+    assert next(bid for bid in result.all_bids if bid.bidder_id == "b1").timed_out
@@ -0,0 +1,68 @@
+import json
+
+from domain.stats import BIDDER_ROW, COUNTRY_ROW, SUPPLY_ROW
+from domain.stats.encoder import StatsJSONWriter
+
+
+def supply_rows(supply_id, total=None):
+    return [
+        (supply_id, SUPPLY_ROW, None, total, None, None, None, None),
+        (supply_id, COUNTRY_ROW, "US", 3, None, None, None, None),
+        (supply_id, COUNTRY_ROW, "DE", 2, None, None, None, None),
+        (supply_id, BIDDER_ROW, "b1", None, 2, 1.005001, 1, 0),
+    ]
+
+
+def test_writes_the_stats_response_shape():
+    writer = StatsJSONWriter()
+    writer.write_rows(supply_rows("s1"))
+
+    encoded = writer.finish()
+
+    assert json.loads(encoded.body) == {
+        "s1": {
+            "total_reqs": 5,
+            "reqs_per_country": {"US": 3, "DE": 2},
+            "bidders": {"b1": {"wins": 2, "total_revenue": 1.01, "no_bids": 1, "timeouts": 0}},
+        }
+    }
+    assert encoded.supplies == 1
+    assert encoded.last_supply_id == "s1"
+
+
+def test_supply_row_total_overrides_country_sum():
+    writer = StatsJSONWriter()
+    writer.write_rows(supply_rows("s1", total=9))
+
+    assert json.loads(writer.finish().body)["s1"]["total_reqs"] == 9
+
+
+def test_supply_may_span_several_batches():
+    rows = supply_rows("s1") + supply_rows("s2")
+    writer = StatsJSONWriter()
+    writer.write_rows(rows[:2])
+    writer.write_rows(rows[2:6])
+    writer.write_rows(rows[6:])
+
+    encoded = writer.finish()
+
+    body = json.loads(encoded.body)
+    assert list(body) == ["s1", "s2"]
+    assert body["s1"]["reqs_per_country"] == {"US": 3, "DE": 2}
+    assert encoded.supplies == 2
+    assert encoded.last_supply_id == "s2"
+
+
+def test_names_are_escaped():
+    writer = StatsJSONWriter()
+    writer.write_rows([('s"1\\', SUPPLY_ROW, None, None, None, None, None, None)])
+
+    assert list(json.loads(writer.finish().body)) == ['s"1\\']
+
+
+def test_empty_result():
+    encoded = StatsJSONWriter().finish()
+
+    assert encoded.body == b"{}"
+    assert encoded.supplies == 0
+    assert encoded.last_supply_id is None
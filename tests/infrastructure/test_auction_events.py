@@ -0,0 +1,33 @@
+import json
+from datetime import datetime, timezone
+
+from domain.bidding import AuctionRecord, Bid
+from infrastructure.persistence.auction_events import BID_FIELDS, encode_event
+
+
+def test_event_is_one_compact_line():
+    record = AuctionRecord(
+        supply_id="s1",
+        ip_address="10.0.0.1",
+        country="US",
+        bids=[
+            Bid(bidder_id="b1", price=0.75, latency_ms=12),
+            Bid(bidder_id="b2", price=None, latency_ms=100, timed_out=True),
+        ],
+        winner_bidder_id="b1",
+        winning_price=0.75,
+        tmax=100,
+        created_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    )
+
+    line = encode_event(record)
+
+    assert b"\n" not in line
+    assert b" " not in line
+    event = json.loads(line)
+    assert event["ts"] == "2026-01-02T03:04:05+00:00"
+    assert event["winner"] == "b1"
+    assert [dict(zip(BID_FIELDS, bid)) for bid in event["bids"]] == [
+        {"bidder_id": "b1", "price": 0.75, "latency_ms": 12, "timed_out": False},
+        {"bidder_id": "b2", "price": None, "latency_ms": 100, "timed_out": True},
+    ]
@@ -0,0 +1,115 @@
+import time
+from types import SimpleNamespace
+
+from domain.bidding import Bidder
+from infrastructure.cache import EligibilityCache
+
+
+class StreamedRows:
+    """Async result over fixed rows that records how many were read."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.read = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.read == len(self.rows):
+            raise StopAsyncIteration
+        self.read += 1
+        return self.rows[self.read - 1]
+
+    async def close(self):
+        self.closed = True
+
+
+class StreamingSession:
+    """Session stand-in whose stream() yields (supply_id, bidder) rows ordered by pair."""
+
+    def __init__(self, rows):
+        self.result = StreamedRows(rows)
+
+    async def stream(self, statement):
+        return self.result
+
+
+def bidder_row(supply_id, bidder_id, country):
+    return supply_id, SimpleNamespace(id=bidder_id, country=country, name=None)
+
+
+def test_get_returns_copy_and_counts_hits_and_misses():
+    cache = EligibilityCache(max_size=10, ttl_seconds=60)
+    cache.set("s1", "US", [Bidder(id="b1", country="US")])
+
+    cached = cache.get("s1", "US")
+    cached.clear()
+
+    assert [b.id for b in cache.get("s1", "US")] == ["b1"]
+    assert cache.get("s1", "GB") is None
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_expired_entries_are_misses(monkeypatch):
+    cache = EligibilityCache(max_size=10, ttl_seconds=5)
+    cache.set("s1", "US", [])
+    monkeypatch.setattr(time, "monotonic", lambda: float("inf"))
+
+    assert cache.get("s1", "US") is None
+    assert cache.stats["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = EligibilityCache(max_size=2, ttl_seconds=60)
+    cache.set("s1", "US", [])
+    cache.set("s2", "US", [])
+    cache.get("s1", "US")
+    cache.set("s3", "US", [])
+
+    assert cache.get("s2", "US") is None
+    assert cache.get("s1", "US") == []
+    assert cache.evictions == 1
+
+
+def test_invalidate_by_country():
+    cache = EligibilityCache(max_size=10, ttl_seconds=60)
+    cache.set("s1", "US", [])
+    cache.set("s1", "GB", [])
+
+    cache.invalidate(country="US")
+
+    assert cache.get("s1", "US") is None
+    assert cache.get("s1", "GB") == []
+
+
+async def test_warm_up_loads_only_pairs_with_bidders():
+    cache = EligibilityCache(max_size=10, ttl_seconds=60)
+    session = StreamingSession([
+        bidder_row("s1", "b1", "GB"),
+        bidder_row("s1", "b2", "US"),
+        bidder_row("s1", "b3", "US"),
+        bidder_row("s2", "b1", "GB"),
+    ])
+
+    assert await cache.warm_up(session) == 3
+    assert [b.id for b in cache.get("s1", "US")] == ["b2", "b3"]
+    assert cache.get("s2", "US") is None
+
+
+async def test_warm_up_stops_at_max_size_without_evicting():
+    cache = EligibilityCache(max_size=2, ttl_seconds=60)
+    session = StreamingSession([
+        bidder_row("s1", "b1", "GB"),
+        bidder_row("s1", "b2", "US"),
+        bidder_row("s1", "b3", "US"),
+        bidder_row("s2", "b1", "GB"),
+        bidder_row("s3", "b1", "GB"),
+    ])
+
+    assert await cache.warm_up(session) == 2
+    assert session.result.read == 4
+    assert session.result.closed
+    assert cache.evictions == 0
+    assert [b.id for b in cache.get("s1", "US")] == ["b2", "b3"]
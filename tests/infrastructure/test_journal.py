@@ -0,0 +1,114 @@
+import asyncio
+import os
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from domain.bidding import AuctionRecord, Bid
+from infrastructure.persistence import JournalLoader
+from infrastructure.persistence.journal import decode_record, encode_record
+from infrastructure.persistence.segments import SEALED_SUFFIX, SegmentWriter
+
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+def record(supply_id="s1"):
+    return AuctionRecord(
+        supply_id=supply_id,
+        ip_address="10.0.0.1",
+        country="US",
+        bids=[
+            Bid(bidder_id="b1", price=0.75, latency_ms=12),
+            Bid(bidder_id="b2", price=None, latency_ms=100, timed_out=True),
+        ],
+        winner_bidder_id="b1",
+        winning_price=0.75,
+        tmax=100,
+        created_at=datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    )
+
+
+def write_segment(directory, lines):
+    path = directory / f"journal-test{SEALED_SUFFIX}"
+    path.write_bytes(b"".join(line + b"\n" for line in lines))
+    return path
+
+
+def unreachable_database():
+    raise ConnectionError("database is down")
+
+
+def test_record_round_trips_through_a_journal_line():
+    assert decode_record(encode_record(record())) == record()
+
+
+async def test_segment_writer_seals_segments(tmp_path):
+    writer = SegmentWriter(str(tmp_path), prefix="journal", max_bytes=1024, max_age_seconds=60)
+    writer.append(encode_record(record()))
+
+    await writer.close()
+
+    assert JournalLoader.read_segment(next(tmp_path.glob(f"*{SEALED_SUFFIX}"))) == [record()]
+
+
+def test_torn_trailing_line_is_skipped(tmp_path):
+    path = write_segment(tmp_path, [encode_record(record())])
+    with open(path, "ab") as segment:
+        segment.write(encode_record(record())[:20])
+
+    assert JournalLoader.read_segment(path) == [record()]
+
+
+async def test_undecodable_segment_is_quarantined(tmp_path):
+    path = write_segment(tmp_path, [b"{not json"])
+    loader = JournalLoader(str(tmp_path), unreachable_database, stale_segment_seconds=600)
+
+    assert await loader.run_once() == 0
+    assert not path.exists()
+    assert (tmp_path / "quarantine" / path.name).exists()
+    assert loader.quarantined_segments == 1
+
+
+async def test_unavailable_database_keeps_segment_for_retry(tmp_path):
+    path = write_segment(tmp_path, [encode_record(record())])
+    loader = JournalLoader(str(tmp_path), unreachable_database, stale_segment_seconds=600)
+
+    with pytest.raises(ConnectionError):
+        await loader.run_once()
+    assert path.exists()
+
+
+async def test_run_forever_survives_failed_runs(tmp_path):
+    write_segment(tmp_path, [encode_record(record())])
+    loader = JournalLoader(str(tmp_path), unreachable_database, stale_segment_seconds=600)
+
+    task = asyncio.create_task(loader.run_forever(0))
+    await asyncio.sleep(0.05)
+
+    assert not task.done()
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+async def test_segment_violating_foreign_keys_is_quarantined(tmp_path):
+    path = write_segment(tmp_path, [encode_record(record("journal-test-missing-supply"))])
+    engine = create_async_engine(TEST_DATABASE_URL)
+    try:
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        loader = JournalLoader(str(tmp_path), session_factory, stale_segment_seconds=600)
+
+        assert await loader.run_once() == 0
+        assert (tmp_path / "quarantine" / path.name).exists()
+
+        async with session_factory() as session:
+            checkpoints = await session.scalar(
+                text("SELECT count(*) FROM journal_segments WHERE name = :name"),
+                {"name": path.name}
+            )
+        assert checkpoints == 0
+    finally:
+        await engine.dispose()
@@ -0,0 +1,352 @@
+import asyncio
+import os
+import uuid
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+from redis.crc import key_slot
+from redis.exceptions import ConnectionError, ResponseError
+
+from core.settings import Settings, get_settings
+from infrastructure.rate_limiter import factory, redis_rate_limiter
+from infrastructure.rate_limiter.batching_rate_limiter import BatchingRateLimiter
+from infrastructure.rate_limiter.redis_rate_limiter import RedisRateLimiter
+from infrastructure.rate_limiter.two_tier_rate_limiter import TwoTierRateLimiter
+
+
+REDIS_URL = os.getenv("TEST_REDIS_URL")
+
+requires_redis = pytest.mark.skipif(
+    not REDIS_URL, reason="TEST_REDIS_URL is not set"
+)
+
+
+class LeaseCounters:
+    """In-memory stand-in for the lease script."""
+
+    def __init__(self):
+        self.used: dict[str, int] = {}
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        limit, _, requested = args
+        used = self.used.get(keys[0], 0)
+        granted = max(0, min(requested, limit - used))
+        self.used[keys[0]] = used + granted
+        return granted, limit - used - granted
+
+
+def make_two_tier(lease_fraction=0.1, min_lease=1, max_requests=3):
+    settings = SimpleNamespace(
+        rate_limit_max_requests=max_requests, rate_limit_window_seconds=3600
+    )
+    limiter = TwoTierRateLimiter(
+        redis_limiter=SimpleNamespace(settings=settings),
+        max_keys=100,
+        lease_fraction=lease_fraction,
+        sync_seconds=3600,
+        min_lease=min_lease
+    )
+    limiter._lease_script = LeaseCounters()
+    return limiter
+
+
+async def test_two_tier_admits_exactly_the_limit():
+    limiter = make_two_tier(lease_fraction=0.25, max_requests=10)
+
+    decisions = [await limiter.check_rate_limit("supply-1") for _ in range(15)]
+
+    assert decisions == [True] * 10 + [False] * 5
+
+
+async def test_two_tier_counts_only_local_grants_as_local_hits():
+    limiter = make_two_tier(lease_fraction=0.5, max_requests=4)
+
+    for _ in range(8):
+        await limiter.check_rate_limit("supply-1")
+
+    # Two leases of two tokens: the first request of each lease goes to Redis
+    assert limiter.redis_calls == 2
+    assert limiter.local_hits == 2
+
+
+async def test_two_tier_leases_at_least_min_lease():
+    limiter = make_two_tier(lease_fraction=0.1, min_lease=5, max_requests=100)
+
+    for _ in range(5):
+        assert await limiter.check_rate_limit("supply-1")
+
+    assert limiter.redis_calls == 1
+    assert limiter.local_hits == 4
+
+
+async def test_two_tier_small_limit_leases_one_token_by_default():
+    limiter = make_two_tier()
+
+    for _ in range(3):
+        assert await limiter.check_rate_limit("supply-1")
+
+    assert limiter.redis_calls == 3
+    assert limiter.local_hits == 0
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"rate_limit_algorithm": "sliding_window"},
+        {"rate_limit_algorithm": "fixed_window", "rate_limit_extra_windows": "5/1"},
+    ],
+)
+async def test_build_rejects_local_tier_with_unsupported_windows(monkeypatch, overrides):
+    settings = Settings(rate_limit_local_tier_enabled=True, **overrides)
+    monkeypatch.setattr(factory, "get_settings", lambda: settings)
+
+    with pytest.raises(ValueError):
+        await factory.build_rate_limiter()
+
+
+@pytest.fixture
+async def redis_settings(monkeypatch):
+    monkeypatch.setenv("REDIS_URL", REDIS_URL)
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@requires_redis
+@pytest.mark.parametrize("algorithm", ["fixed_window", "sliding_window", "token_bucket"])
+async def test_redis_limiter_admits_exactly_the_limit(redis_settings, algorithm):
+    limiter = RedisRateLimiter(algorithm=algorithm, extra_windows=[])
+    await limiter.initialize()
+    key = f"test:{uuid.uuid4()}"
+    try:
+        decisions = [
+            await limiter.check_rate_limit(key, max_requests=5, window_seconds=60)
+            for _ in range(7)
+        ]
+    finally:
+        await limiter.close()
+
+    assert decisions == [True] * 5 + [False] * 2
+
+
+@requires_redis
+async def test_redis_limiter_enforces_extra_windows(redis_settings):
+    limiter = RedisRateLimiter(algorithm="fixed_window", extra_windows=[(2, 1)])
+    await limiter.initialize()
+    key = f"test:{uuid.uuid4()}"
+    try:
+        decisions = [
+            await limiter.check_rate_limit(key, max_requests=5, window_seconds=60)
+            for _ in range(3)
+        ]
+    finally:
+        await limiter.close()
+
+    assert decisions == [True, True, False]
+
+
+@requires_redis
+async def test_two_tier_returns_unused_tokens_on_close(redis_settings):
+    redis_limiter = RedisRateLimiter(algorithm="fixed_window", extra_windows=[])
+    limiter = TwoTierRateLimiter(
+        redis_limiter=redis_limiter, max_keys=100, lease_fraction=0.5, sync_seconds=60
+    )
+    await limiter.initialize()
+    key = f"test:{uuid.uuid4()}"
+    assert await limiter.check_rate_limit(key, max_requests=10, window_seconds=60)
+    await limiter.close()
+
+    other = TwoTierRateLimiter(
+        redis_limiter=RedisRateLimiter(algorithm="fixed_window", extra_windows=[]),
+        max_keys=100,
+        lease_fraction=1.0,
+        sync_seconds=60
+    )
+    await other.initialize()
+    try:
+        decisions = [
+            await other.check_rate_limit(key, max_requests=10, window_seconds=60)
+            for _ in range(10)
+        ]
+    finally:
+        await other.close()
+
+    # One token was used before close; the other four leased ones came back
+    assert decisions == [True] * 9 + [False]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis_rate_limiter.aioredis, "from_url",
+        lambda url, **kwargs: fakeredis.aioredis.FakeRedis(server=server, **kwargs)
+    )
+    return server
+
+
+async def make_batching(window_ms=60000, max_batch_size=3):
+    limiter = BatchingRateLimiter(
+        redis_limiter=RedisRateLimiter(algorithm="fixed_window", extra_windows=[]),
+        window_ms=window_ms,
+        max_batch_size=max_batch_size
+    )
+    await limiter.initialize()
+    return limiter
+
+
+def check(limiter, key, max_requests=1):
+    return asyncio.create_task(
+        limiter.check_rate_limit_detailed(key, max_requests=max_requests, window_seconds=60)
+    )
+
+
+async def test_batching_sends_full_batch_without_waiting_for_the_window(fake_redis):
+    limiter = await make_batching(window_ms=60000, max_batch_size=3)
+
+    checks = [check(limiter, key) for key in ("a", "b", "c")]
+    await asyncio.wait_for(asyncio.gather(*checks), timeout=1)
+
+    assert limiter.stats["batches"] == 1
+    assert limiter.batch_size_histogram == {"4": 1}
+    await limiter.close()
+
+
+async def test_batching_sends_partial_batch_when_the_window_elapses(fake_redis):
+    limiter = await make_batching(window_ms=20, max_batch_size=100)
+
+    checks = [check(limiter, "a"), check(limiter, "b")]
+    await asyncio.sleep(0)
+    assert limiter.batches == 0
+
+    await asyncio.wait_for(asyncio.gather(*checks), timeout=1)
+    assert limiter.batches == 1
+    assert limiter.checks == 2
+    await limiter.close()
+
+
+async def test_batching_resolves_each_caller_with_its_own_result(fake_redis):
+    limiter = await make_batching(max_batch_size=4)
+
+    decisions = await asyncio.gather(
+        check(limiter, "a", max_requests=1),
+        check(limiter, "a", max_requests=1),
+        check(limiter, "b", max_requests=5),
+        check(limiter, "c", max_requests=2),
+    )
+
+    assert [decision.allowed for decision in decisions] == [True, False, True, True]
+    assert [decision.limit for decision in decisions] == [1, 1, 5, 2]
+    assert decisions[2].remaining == 4
+    await limiter.close()
+
+
+async def test_batching_fails_only_the_check_whose_script_errored(fake_redis):
+    limiter = await make_batching(max_batch_size=2)
+    # A hash under the counter key makes the script's GET fail with WRONGTYPE
+    await limiter.redis_limiter.redis.hset("rate_limit:{broken}:fw:60", "tokens", 1)
+
+    results = await asyncio.gather(
+        check(limiter, "broken"), check(limiter, "ok"), return_exceptions=True
+    )
+
+    assert isinstance(results[0], ResponseError)
+    assert results[1].allowed
+    await limiter.close()
+
+
+async def test_batching_fails_every_waiter_when_the_pipeline_fails(fake_redis):
+    limiter = await make_batching(max_batch_size=3)
+    fake_redis.connected = False
+
+    results = await asyncio.gather(
+        *(check(limiter, key) for key in ("a", "b", "c")), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert limiter.batches == 1
+    fake_redis.connected = True
+    await limiter.close()
+
+
+async def test_batching_close_flushes_pending_checks(fake_redis):
+    limiter = await make_batching(window_ms=60000, max_batch_size=100)
+
+    pending = check(limiter, "a")
+    await asyncio.sleep(0)
+    assert not pending.done()
+
+    await limiter.close()
+
+    assert (await pending).allowed
+    assert limiter.batches == 1
+
+
+async def test_batching_stats_bucket_batch_sizes(fake_redis):
+    limiter = await make_batching(window_ms=10, max_batch_size=3)
+
+    await check(limiter, "a")
+    await asyncio.gather(*(check(limiter, key) for key in ("b", "c", "d", "e", "f")))
+    await limiter.close()
+
+    # Five concurrent checks split into a full batch of three and a timed batch of two
+    assert limiter.stats == {
+        "batches": 3,
+        "checks": 6,
+        "avg_batch_size": 2.0,
+        "batch_size_histogram": {"1": 1, "2": 1, "4": 1},
+    }
+
+
+def test_fixed_window_is_the_default_algorithm():
+    assert Settings().rate_limit_algorithm == "fixed_window"
+
+
+@pytest.mark.parametrize("algorithm", ["fixed_window", "sliding_window", "token_bucket"])
+async def test_scripts_touch_only_the_keys_they_are_passed(fake_redis, algorithm):
+    limiter = RedisRateLimiter(algorithm=algorithm, extra_windows=[(10, 1), (100, 3600)])
+    await limiter.initialize()
+    keys, args = limiter.script_arguments("10.0.0.1", max_requests=5, window_seconds=60)
+
+    assert await limiter.check_rate_limit("10.0.0.1", max_requests=5, window_seconds=60)
+
+    assert args == [5, 60, 10, 1, 100, 3600]
+    assert set(await limiter.redis.keys("*")) == set(keys)
+    assert len({key_slot(key.encode()) for key in keys}) == 1
+    await limiter.close()
+
+
+@pytest.mark.parametrize("algorithm", ["fixed_window", "sliding_window", "token_bucket"])
+async def test_fake_redis_limiter_enforces_the_tightest_window(fake_redis, algorithm):
+    limiter = RedisRateLimiter(algorithm=algorithm, extra_windows=[(3, 3600)])
+    await limiter.initialize()
+
+    decisions = [
+        await limiter.check_rate_limit_detailed("10.0.0.1", max_requests=5, window_seconds=60)
+        for _ in range(4)
+    ]
+
+    assert [decision.allowed for decision in decisions] == [True, True, True, False]
+    assert decisions[0].limit == 3
+    await limiter.close()
+
+
+@pytest.mark.parametrize("buckets_ago, allowed", [(1, False), (2, True)])
+async def test_sliding_window_weighs_only_the_previous_bucket(fake_redis, buckets_ago, allowed):
+    # A window this long keeps the current bucket well inside its first half
+    window = 10 ** 9
+    limiter = RedisRateLimiter(algorithm="sliding_window", extra_windows=[])
+    await limiter.initialize()
+    [key], _ = limiter.script_arguments("10.0.0.1", max_requests=5, window_seconds=window)
+    seconds, _ = await limiter.redis.time()
+    await limiter.redis.hset(key, mapping={
+        "bucket": seconds // window - buckets_ago, "current": 1000, "previous": 0
+    })
+
+    assert await limiter.check_rate_limit(
+        "10.0.0.1", max_requests=5, window_seconds=window
+    ) is allowed
+    await limiter.close()
@@ -0,0 +1,132 @@
+import json
+
+import fakeredis
+import pytest
+
+from domain.bidding import AuctionRecord, Bid
+from domain.stats import StatsJSONWriter, StatsNotAvailableException, StatsQuery
+from infrastructure.repositories.redis_stats_repo import KEY_PREFIX, RedisStatsRepository
+
+
+@pytest.fixture
+async def repository():
+    repository = RedisStatsRepository(scan_count=2)
+    repository.redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield repository
+    await repository.close()
+
+
+def auction(supply_id="s1", country="US", price=0.1):
+    return AuctionRecord(
+        supply_id=supply_id,
+        ip_address="10.0.0.1",
+        country=country,
+        bids=[
+            Bid(bidder_id="b1", price=price, latency_ms=10),
+            Bid(bidder_id="b2", price=None, latency_ms=20),
+            Bid(bidder_id="b3", price=None, latency_ms=100, timed_out=True),
+        ],
+        winner_bidder_id="b1",
+        winning_price=price
+    )
+
+
+async def seed(repository, supply_ids):
+    for supply_id in supply_ids:
+        await repository.redis.hset(
+            f"{KEY_PREFIX}{supply_id}",
+            mapping={"total_reqs": 2, "country:US": 2, "bidder:b1:wins": 1},
+        )
+
+
+async def test_stream_stats_yields_every_supply_across_scan_pages(repository):
+    await seed(repository, ["s1", "s2", "s3", "s4", "s5"])
+
+    streamed = dict([item async for item in repository.stream_stats(StatsQuery())])
+
+    assert sorted(streamed) == ["s1", "s2", "s3", "s4", "s5"]
+    assert streamed["s3"]["reqs_per_country"] == {"US": 2}
+    assert streamed == await repository.get_all_stats()
+
+
+async def test_stream_stats_rejects_filtered_queries(repository):
+    with pytest.raises(StatsNotAvailableException):
+        async for _ in repository.stream_stats(StatsQuery(limit=10)):
+            pass
+
+
+async def test_record_auction_increments_supply_counters(repository):
+    await repository.record_auction(auction(country="US"))
+    await repository.record_auction(auction(country="DE"))
+
+    assert await repository.get_supply_stats("s1") == {
+        "total_reqs": 2,
+        "reqs_per_country": {"US": 1, "DE": 1},
+        "bidders": {
+            "b1": {"wins": 2, "total_revenue": pytest.approx(0.2), "no_bids": 0, "timeouts": 0},
+            "b2": {"wins": 0, "total_revenue": 0.0, "no_bids": 2, "timeouts": 0},
+            "b3": {"wins": 0, "total_revenue": 0.0, "no_bids": 0, "timeouts": 2},
+        },
+    }
+
+
+async def test_record_auction_does_not_fail_the_auction_when_redis_is_down(repository, caplog):
+    server = fakeredis.FakeServer()
+    server.connected = False
+    repository.redis = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+    await repository.record_auction(auction())
+
+    assert "Redis stats update failed for supply=s1" in caplog.text
+
+
+async def test_get_all_stats_reads_every_supply(repository):
+    for supply_id in ("s1", "s2", "s3"):
+        await repository.record_auction(auction(supply_id))
+
+    stats = await repository.get_all_stats()
+
+    assert sorted(stats) == ["s1", "s2", "s3"]
+    assert stats["s2"]["total_reqs"] == 1
+
+
+async def test_stream_stats_rows_round_revenue_like_the_sql_backend(repository):
+    # Float increments accumulate to 0.30000000000000004
+    for price in (0.1, 0.2):
+        await repository.record_auction(auction(price=price))
+
+    writer = StatsJSONWriter()
+    async for rows in repository.stream_stats_rows(StatsQuery()):
+        writer.write_rows(rows)
+    body = json.loads(writer.finish().body)
+
+    assert body["s1"]["total_reqs"] == 2
+    assert body["s1"]["bidders"]["b1"]["total_revenue"] == 0.3
+
+
+async def test_stream_stats_rows_rejects_filtered_queries(repository):
+    with pytest.raises(StatsNotAvailableException):
+        async for _ in repository.stream_stats_rows(StatsQuery(country="US")):
+            pass
+
+
+async def test_replace_supply_stats_overwrites_counters(repository):
+    await repository.record_auction(auction(country="US"))
+    backfilled = {
+        "total_reqs": 5,
+        "reqs_per_country": {"DE": 5},
+        "bidders": {"b9": {"wins": 1, "total_revenue": 1.5, "no_bids": 4, "timeouts": 0}},
+    }
+
+    await repository.replace_supply_stats("s1", backfilled)
+
+    assert await repository.get_supply_stats("s1") == backfilled
+
+
+async def test_backfilled_supplies_without_auctions_are_listed(repository):
+    await repository.replace_supply_stats(
+        "s1", {"total_reqs": 0, "reqs_per_country": {}, "bidders": {}}
+    )
+    await repository.record_auction(auction("s2"))
+
+    assert sorted(await repository.get_all_stats()) == ["s1", "s2"]
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from core.tracing import current_trace, end_trace, start_trace
+from infrastructure.cache.stats_cache import StatsResultCache
+
+
+class CountingLoader:
+    """Loader returning how many times it has been called."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.calls
+
+
+async def test_fresh_entry_is_served_without_loading():
+    cache = StatsResultCache(ttl_seconds=60, stale_seconds=60, max_entries=10)
+    loader = CountingLoader()
+
+    assert (await cache.get("key", loader))[0] == 1
+    value, age = await cache.get("key", loader)
+
+    assert value == 1
+    assert age < 60
+    assert loader.calls == 1
+    assert cache.stats["hits"] == 1
+
+
+async def test_concurrent_misses_share_one_load():
+    cache = StatsResultCache(ttl_seconds=60, stale_seconds=60, max_entries=10)
+    loader = CountingLoader(delay=0.01)
+
+    results = await asyncio.gather(*(cache.get("key", loader) for _ in range(5)))
+
+    assert [value for value, _ in results] == [1] * 5
+    assert loader.calls == 1
+
+
+async def test_stale_entry_is_served_while_refreshing():
+    cache = StatsResultCache(ttl_seconds=0, stale_seconds=60, max_entries=10)
+    loader = CountingLoader()
+
+    await cache.get("key", loader)
+    value, _ = await cache.get("key", loader)
+    assert value == 1
+    await asyncio.sleep(0)
+
+    assert loader.calls == 2
+    assert cache.stats["stale_hits"] == 1
+
+
+async def test_expired_entry_waits_for_reload():
+    cache = StatsResultCache(ttl_seconds=0, stale_seconds=0, max_entries=10)
+    loader = CountingLoader()
+
+    await cache.get("key", loader)
+    value, _ = await cache.get("key", loader)
+
+    assert value == 2
+
+
+async def test_entry_evicted_before_the_caller_resumes():
+    cache = StatsResultCache(ttl_seconds=60, stale_seconds=60, max_entries=1)
+
+    results = await asyncio.gather(
+        cache.get("first", CountingLoader()),
+        cache.get("second", CountingLoader()),
+    )
+
+    assert [value for value, _ in results] == [1, 1]
+    assert cache.stats["entries"] == 1
+
+
+async def test_failed_load_is_not_cached():
+    cache = StatsResultCache(ttl_seconds=60, stale_seconds=60, max_entries=10)
+
+    async def failing():
+        raise RuntimeError("replica down")
+
+    with pytest.raises(RuntimeError):
+        await cache.get("key", failing)
+
+    assert (await cache.get("key", CountingLoader()))[0] == 1
+    assert cache.stats["load_errors"] == 1
+
+
+async def test_background_refresh_is_not_traced_with_the_request():
+    cache = StatsResultCache(ttl_seconds=0, stale_seconds=60, max_entries=10)
+    traces = []
+
+    async def loader():
+        traces.append(current_trace())
+        return len(traces)
+
+    await cache.get("key", loader)
+    start_trace(sample_rate=1.0)
+    try:
+        await cache.get("key", loader)
+        await asyncio.sleep(0)
+    finally:
+        end_trace()
+
+    assert traces == [None, None]
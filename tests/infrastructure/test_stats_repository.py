@@ -0,0 +1,53 @@
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from domain.stats.entities import StatsQuery
+from infrastructure.repositories.sqlalchemy_stats_repo import StatsRepository
+
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+
+SEED = (
+    "INSERT INTO supplies (id) VALUES ('0-test-a'), ('0-test-b'), ('0-test-c')",
+    "INSERT INTO bidders (id, country) VALUES ('0-test-bidder', 'US')",
+    """
+    INSERT INTO auctions (supply_id, ip_address, country, winner_bidder_id, winning_price, tmax, created_at)
+    SELECT supply_id, '10.0.0.1', 'US', '0-test-bidder', 0.5, 100, now()
+    FROM unnest(ARRAY['0-test-a', '0-test-b', '0-test-c']) supply_id
+    """,
+    """
+    INSERT INTO stats_supply_country (supply_id, country, requests)
+    SELECT supply_id, 'US', 1 FROM unnest(ARRAY['0-test-a', '0-test-b', '0-test-c']) supply_id
+    """,
+)
+
+
+@pytest.fixture
+async def session():
+    """Yields a session over seeded rows that are rolled back afterwards."""
+    engine = create_async_engine(TEST_DATABASE_URL)
+    try:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            await session.begin()
+            for statement in SEED:
+                await session.execute(text(statement))
+            yield session
+            await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("use_rollups", [False, True])
+async def test_query_stats_skips_supplies_before_the_cursor(session, use_rollups):
+    repository = StatsRepository(session, use_rollups=use_rollups, use_buckets=False)
+
+    stats = await repository.query_stats(StatsQuery(after_supply_id="0-test-b"))
+
+    assert "0-test-c" in stats
+    assert "0-test-a" not in stats
+    assert "0-test-b" not in stats
@@ -0,0 +1,248 @@
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.elements import TextClause
+
+from domain.bidding import AuctionRecord, Bid
+from domain.stats import BidderStats
+from infrastructure.persistence.stats_buckets import HOUR_BUCKET, MINUTE_BUCKET
+from infrastructure.persistence.stats_rollup import StatsRollupAccumulator
+from infrastructure.persistence.stats_rollup_rebuilder import StatsRollupRebuilder
+
+
+CREATED_AT = datetime(2024, 5, 1, 12, 30, 45, tzinfo=timezone.utc)
+MINUTE = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+
+class RollupSession:
+    """Session stand-in recording executed statements; fails while `failures` is positive."""
+
+    def __init__(self, database):
+        self.database = database
+
+    async def execute(self, statement, params=None):
+        if self.database["failures"]:
+            self.database["failures"] -= 1
+            raise ConnectionError("connection reset")
+        self.database["statements"].append((statement, params))
+
+    async def commit(self):
+        self.database["commits"] += 1
+
+
+def make_accumulator(database, buckets_enabled=True):
+    @asynccontextmanager
+    async def session_factory():
+        yield RollupSession(database)
+
+    return StatsRollupAccumulator(
+        session_factory=session_factory,
+        flush_interval_seconds=3600,
+        buckets_enabled=buckets_enabled
+    )
+
+
+def new_database(failures=0):
+    return {"statements": [], "commits": 0, "failures": failures}
+
+
+def upserts(database):
+    return {statement.table.name: params for statement, params in database["statements"]}
+
+
+def auction(supply_id="s1", country="US", bids=(), winner=None):
+    return AuctionRecord(
+        supply_id=supply_id, ip_address="10.0.0.1", country=country, bids=list(bids),
+        winner_bidder_id=winner, created_at=CREATED_AT
+    )
+
+
+async def test_flush_upserts_accumulated_deltas():
+    database = new_database()
+    accumulator = make_accumulator(database)
+
+    await accumulator.record_auction(auction(
+        bids=[Bid("b2", price=None), Bid("b1", price=1.5)], winner="b1"
+    ))
+    await accumulator.record_auction(auction(bids=[Bid("b1", timed_out=True)]))
+    await accumulator.record_auction(auction(country="DE"))
+    await accumulator.flush()
+
+    rows = upserts(database)
+    assert rows["stats_supply_country"] == [
+        {"supply_id": "s1", "country": "DE", "requests": 1},
+        {"supply_id": "s1", "country": "US", "requests": 2},
+    ]
+    assert rows["stats_supply_bidder"] == [
+        {"supply_id": "s1", "bidder_id": "b1", "wins": 1, "total_revenue": 1.5, "no_bids": 0, "timeouts": 1},
+        {"supply_id": "s1", "bidder_id": "b2", "wins": 0, "total_revenue": 0.0, "no_bids": 1, "timeouts": 0},
+    ]
+    assert rows["stats_bucket_country"][1] == {
+        "bucket_start": MINUTE, "resolution_seconds": MINUTE_BUCKET,
+        "supply_id": "s1", "country": "US", "requests": 2,
+    }
+    assert [row["bidder_id"] for row in rows["stats_bucket_bidder"]] == ["b1", "b2"]
+    assert database["commits"] == 1
+    assert accumulator.stats["pending_rows"] == 0
+    assert accumulator.flushed_rows == 8
+
+
+async def test_flush_adds_deltas_to_existing_counters():
+    database = new_database()
+    accumulator = make_accumulator(database, buckets_enabled=False)
+
+    await accumulator.record_auction(auction(bids=[Bid("b1", price=2.0)], winner="b1"))
+    await accumulator.flush()
+
+    statement, _ = database["statements"][1]
+    compiled = str(statement.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (supply_id, bidder_id) DO UPDATE" in compiled
+    assert "wins = (stats_supply_bidder.wins + excluded.wins)" in compiled
+    assert len(database["statements"]) == 2
+
+
+async def test_failed_flush_merges_deltas_back():
+    database = new_database(failures=1)
+    accumulator = make_accumulator(database)
+
+    await accumulator.record_auction(auction(bids=[Bid("b1", price=1.0)], winner="b1"))
+    await accumulator.flush()
+
+    assert accumulator.failed_flushes == 1
+    assert database["commits"] == 0
+    assert accumulator.stats["pending_rows"] == 4
+
+    await accumulator.record_auction(auction(bids=[Bid("b1", price=0.5)], winner="b1"))
+    await accumulator.flush()
+
+    rows = upserts(database)
+    assert rows["stats_supply_country"] == [{"supply_id": "s1", "country": "US", "requests": 2}]
+    assert rows["stats_supply_bidder"] == [
+        {"supply_id": "s1", "bidder_id": "b1", "wins": 2, "total_revenue": 1.5, "no_bids": 0, "timeouts": 0},
+    ]
+    assert rows["stats_bucket_country"][0]["requests"] == 2
+    assert rows["stats_bucket_bidder"][0]["wins"] == 2
+    assert database["commits"] == 1
+    assert accumulator.stats["pending_rows"] == 0
+
+
+async def test_flush_without_deltas_opens_no_session():
+    database = new_database(failures=1)
+    accumulator = make_accumulator(database)
+
+    await accumulator.flush()
+
+    assert database["failures"] == 1
+    assert accumulator.flushes == 0
+
+
+class RebuildSession:
+    """Session stand-in serving the auction ID range and one set of rows per chunk query."""
+
+    def __init__(self, database):
+        self.database = database
+
+    async def execute(self, statement, params=None):
+        if isinstance(statement, TextClause):
+            self.database["statements"].append(statement.text)
+            return None
+        if params is not None:
+            self.database["statements"].append(f"INSERT {statement.table.name}")
+            self.database["inserts"][statement.table.name] = params
+            return None
+
+        columns = statement.selected_columns.keys()
+        if "country_count" in columns:
+            self.database["chunks"] += 1
+            rows = self.database["request_rows"]
+        elif "wins" in columns:
+            rows = self.database["bidder_rows"]
+        else:
+            return SimpleNamespace(one=lambda: self.database["id_range"])
+        return SimpleNamespace(all=lambda: rows)
+
+    async def commit(self):
+        self.database["statements"].append("COMMIT")
+
+
+def make_rebuilder(database, chunk_size=10):
+    @asynccontextmanager
+    async def session_factory():
+        yield RebuildSession(database)
+
+    return StatsRollupRebuilder(
+        session_factory=session_factory,
+        chunk_size=chunk_size,
+        workers=2,
+        minute_retention_hours=24
+    )
+
+
+def rebuild_database(id_range):
+    hour = datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+    return {
+        "id_range": id_range,
+        "chunks": 0,
+        "statements": [],
+        "inserts": {},
+        "request_rows": [
+            SimpleNamespace(
+                supply_id="s1", country="US", country_count=2,
+                bucket_start=hour, resolution_seconds=HOUR_BUCKET
+            ),
+        ],
+        "bidder_rows": [
+            SimpleNamespace(
+                supply_id="s1", bidder_id="b1", wins=1, total_revenue="0.25", no_bids=1, timeouts=0,
+                bucket_start=hour, resolution_seconds=HOUR_BUCKET
+            ),
+        ],
+    }
+
+
+async def test_rebuild_merges_chunk_totals():
+    database = rebuild_database((1, 25))
+    rebuilder = make_rebuilder(database)
+
+    assert await rebuilder.rebuild() == (1, 1)
+
+    # IDs 1-25 in chunks of 10 give three chunks whose rows land on the same keys
+    assert database["chunks"] == 3
+    inserts = database["inserts"]
+    assert inserts["stats_supply_country"] == [{"supply_id": "s1", "country": "US", "requests": 6}]
+    assert inserts["stats_supply_bidder"] == [
+        {"supply_id": "s1", "bidder_id": "b1", "wins": 3, "total_revenue": 0.75, "no_bids": 3, "timeouts": 0},
+    ]
+    assert inserts["stats_bucket_country"][0]["requests"] == 6
+    assert inserts["stats_bucket_bidder"][0]["resolution_seconds"] == HOUR_BUCKET
+    assert rebuilder._bidders[("s1", "b1")] == BidderStats(wins=3, total_revenue=0.75, no_bids=3)
+
+
+async def test_rebuild_truncates_before_inserting_in_one_transaction():
+    database = rebuild_database((1, 5))
+    rebuilder = make_rebuilder(database)
+
+    await rebuilder.rebuild()
+
+    assert database["statements"] == [
+        "TRUNCATE stats_supply_country, stats_supply_bidder, "
+        "stats_bucket_country, stats_bucket_bidder",
+        "INSERT stats_supply_country",
+        "INSERT stats_supply_bidder",
+        "INSERT stats_bucket_country",
+        "INSERT stats_bucket_bidder",
+        "COMMIT",
+    ]
+
+
+async def test_rebuild_without_auctions_empties_the_rollups():
+    database = rebuild_database((None, None))
+    rebuilder = make_rebuilder(database)
+
+    assert await rebuilder.rebuild() == (0, 0)
+
+    assert database["chunks"] == 0
+    assert database["statements"][0].startswith("TRUNCATE ")
+    assert database["statements"][1:] == ["COMMIT"]
@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+
+import pytest
+
+from application import RunAuctionUseCase
+from core.settings import Settings
+from domain.bidding import AuctionRequest, NoEligibleBiddersException, RateLimitDecision
+from infrastructure.cache import SupplyRegistry
+from infrastructure.repositories import BiddingRepository
+
+
+class SupplySession:
+    """Session stand-in holding a set of existing supply IDs."""
+
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.queries = 0
+        self.added = []
+
+    async def execute(self, statement):
+        self.queries += 1
+        supply_id = statement.whereclause.right.value
+        found = SimpleNamespace(id=supply_id, name=None) if supply_id in self.existing else None
+        return SimpleNamespace(scalar_one_or_none=lambda: found)
+
+    def add(self, model):
+        self.added.append(model)
+
+    async def flush(self):
+        pass
+
+
+class AllowAll:
+    async def check_rate_limit_detailed(self, key, max_requests=None, window_seconds=None):
+        return RateLimitDecision(allowed=True, limit=3, remaining=2, reset_seconds=60.0)
+
+
+def registry():
+    return SupplyRegistry(negative_cache_size=10, negative_ttl_seconds=60)
+
+
+def test_unknown_supplies_are_auto_created_by_default():
+    assert Settings().supply_auto_create is True
+
+
+async def test_unknown_supply_is_answered_as_new_without_an_insert():
+    session = SupplySession()
+    repository = BiddingRepository(session, supply_registry=registry())
+
+    supply = await repository.get_or_create_supply("new-supply")
+
+    assert supply.id == "new-supply"
+    assert session.added == []
+    # No eligible bidders keeps the 400 answer, without an eligibility query
+    assert await repository.get_eligible_bidders_for_supply("new-supply", "US") == []
+    assert session.queries == 1
+
+
+async def test_unknown_supply_is_negative_cached_when_auto_create_is_enabled():
+    supplies = registry()
+    first = SupplySession()
+    await BiddingRepository(first, supply_registry=supplies).get_or_create_supply("garbage")
+
+    second = SupplySession()
+    repository = BiddingRepository(second, supply_registry=supplies)
+    supply = await repository.get_or_create_supply("garbage")
+
+    assert supply.id == "garbage"
+    assert await repository.get_eligible_bidders_for_supply("garbage", "US") == []
+    assert second.queries == 0
+    assert supplies.stats["negative_hits"] == 1
+
+
+async def test_unknown_supply_is_not_inserted_without_a_registry():
+    session = SupplySession()
+    repository = BiddingRepository(session)
+
+    assert (await repository.get_or_create_supply("new-supply")).id == "new-supply"
+    assert session.added == []
+
+
+async def test_unknown_supply_is_remembered_as_missing_without_auto_create():
+    session = SupplySession()
+    repository = BiddingRepository(
+        session, supply_registry=registry(), auto_create_supplies=False
+    )
+
+    assert await repository.get_or_create_supply("missing") is None
+    assert await repository.get_or_create_supply("missing") is None
+    assert session.queries == 1
+    assert session.added == []
+
+
+async def test_known_supply_is_answered_without_a_query():
+    session = SupplySession(existing={"s1"})
+    repository = BiddingRepository(session, supply_registry=registry())
+
+    assert (await repository.get_or_create_supply("s1")).id == "s1"
+    assert (await repository.get_or_create_supply("s1")).id == "s1"
+    assert session.queries == 1
+
+
+def test_added_supply_leaves_the_negative_cache():
+    supplies = registry()
+    supplies.mark_missing("s1")
+    supplies.add("s1")
+
+    assert supplies.is_known("s1")
+    assert not supplies.is_known_missing("s1")
+
+
+async def test_auction_for_unknown_supply_still_has_no_eligible_bidders():
+    session = SupplySession()
+    use_case = RunAuctionUseCase(
+        bidding_repository=BiddingRepository(session, supply_registry=registry()),
+        rate_limiter=AllowAll(),
+        auction_service=None,
+        settings=Settings()
+    )
+
+    with pytest.raises(NoEligibleBiddersException):
+        await use_case.execute(AuctionRequest("garbage", "10.0.0.1", "US"))
+    assert session.added == []
@@ -0,0 +1,177 @@
+import os
+from contextlib import asynccontextmanager
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from domain.bidding import AuctionRecord, Bid
+from infrastructure.persistence import JournalLoader, write_behind_queue
+from infrastructure.persistence.journal import decode_record
+from infrastructure.persistence.segments import SEALED_SUFFIX
+from infrastructure.persistence.write_behind_queue import WriteBehindQueue
+
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+class FakeSession:
+    """Session stand-in whose savepoints and commits are no-ops."""
+
+    def __init__(self, database):
+        self.database = database
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+    async def commit(self):
+        pass
+
+
+class FakeRepository:
+    """Repository writing into a list; supplies listed in `bad` fail like an FK violation."""
+
+    def __init__(self, session):
+        self.database = session.database
+
+    async def save_auctions_with_bids(self, records):
+        self.database["batch_calls"] += 1
+        if self.database["outages"]:
+            self.database["outages"] -= 1
+            raise ConnectionError("connection reset")
+        if any(record.supply_id in self.database["bad"] for record in records):
+            raise ValueError("foreign key violation")
+        self.database["rows"].extend(records)
+
+    async def save_auction_with_bids(self, record):
+        if record.supply_id in self.database["bad"]:
+            raise ValueError("foreign key violation")
+        self.database["rows"].append(record)
+
+
+@pytest.fixture
+def database(monkeypatch):
+    monkeypatch.setattr(write_behind_queue, "BiddingRepository", FakeRepository)
+    return {"rows": [], "bad": set(), "outages": 0, "batch_calls": 0}
+
+
+def make_queue(database, spill_dir=None):
+    @asynccontextmanager
+    async def session_factory():
+        yield FakeSession(database)
+
+    return WriteBehindQueue(
+        session_factory=session_factory,
+        max_size=100,
+        batch_size=10,
+        flush_interval_ms=10,
+        max_retries=2,
+        retry_backoff_ms=1,
+        spill_dir=spill_dir
+    )
+
+
+def record(supply_id, bidder_id="b1"):
+    return AuctionRecord(
+        supply_id=supply_id, ip_address="10.0.0.1", country="US",
+        bids=[Bid(bidder_id=bidder_id, price=0.5, latency_ms=10)],
+        winner_bidder_id=bidder_id, winning_price=0.5
+    )
+
+
+async def test_transient_failure_is_retried(database):
+    database["outages"] = 2
+    queue = make_queue(database)
+
+    await queue._flush([record("s1"), record("s2")])
+
+    assert len(database["rows"]) == 2
+    assert queue.retried_batches == 2
+    assert queue.isolated_batches == 0
+
+
+async def test_bad_record_only_fails_itself_and_is_spilled(database, tmp_path):
+    database["bad"] = {"new-supply"}
+    queue = make_queue(database, spill_dir=str(tmp_path))
+
+    await queue._flush([record("s1"), record("new-supply"), record("s2")])
+
+    assert [row.supply_id for row in database["rows"]] == ["s1", "s2"]
+    assert queue.flushed_records == 2
+    assert queue.spilled_records == 1
+    assert queue.failed_records == 0
+
+    segments = list(tmp_path.glob(f"*{SEALED_SUFFIX}"))
+    assert len(segments) == 1
+    spilled = [decode_record(line) for line in segments[0].read_bytes().splitlines()]
+    assert [row.supply_id for row in spilled] == ["new-supply"]
+
+
+async def test_failed_records_are_counted_without_spill_dir(database):
+    database["bad"] = {"new-supply"}
+    queue = make_queue(database)
+
+    await queue._flush([record("new-supply")])
+
+    assert queue.failed_records == 1
+    assert database["batch_calls"] == 3
+
+
+async def test_close_flushes_queued_records(database):
+    queue = make_queue(database)
+    await queue.start()
+    for supply_id in ("s1", "s2", "s3"):
+        await queue.submit(record(supply_id))
+
+    await queue.close()
+
+    assert sorted(row.supply_id for row in database["rows"]) == ["s1", "s2", "s3"]
+    assert queue.stats["depth"] == 0
+
+
+async def test_spills_in_the_same_second_get_distinct_segments(database, tmp_path):
+    database["bad"] = {"first", "second"}
+    queue = make_queue(database, spill_dir=str(tmp_path))
+
+    await queue._flush([record("first")])
+    await queue._flush([record("second")])
+
+    loader = JournalLoader(str(tmp_path), session_factory=None, stale_segment_seconds=600)
+    segments = loader.sealed_segments()
+    assert len(segments) == 2
+    assert [
+        [row.supply_id for row in loader.read_segment(path)] for path in segments
+    ] == [["first"], ["second"]]
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+async def test_spilled_batches_are_all_loaded(database, tmp_path):
+    supply_id, bidder_id = "0-spill-test-supply", "0-spill-test-bidder"
+    database["bad"] = {supply_id}
+    queue = make_queue(database, spill_dir=str(tmp_path))
+
+    await queue._flush([record(supply_id, bidder_id)])
+    await queue._flush([record(supply_id, bidder_id), record(supply_id, bidder_id)])
+
+    engine = create_async_engine(TEST_DATABASE_URL)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    try:
+        async with session_factory() as session, session.begin():
+            await session.execute(text("INSERT INTO supplies (id) VALUES (:id)"), {"id": supply_id})
+            await session.execute(
+                text("INSERT INTO bidders (id, country) VALUES (:id, 'US')"), {"id": bidder_id}
+            )
+
+        loader = JournalLoader(str(tmp_path), session_factory, stale_segment_seconds=600)
+        assert await loader.run_once() == 3
+        assert loader.quarantined_segments == 0
+    finally:
+        async with session_factory() as session, session.begin():
+            params = {"supply_id": supply_id, "bidder_id": bidder_id}
+            await session.execute(text("DELETE FROM bids WHERE bidder_id = :bidder_id"), params)
+            await session.execute(text("DELETE FROM auctions WHERE supply_id = :supply_id"), params)
+            await session.execute(text("DELETE FROM bidders WHERE id = :bidder_id"), params)
+            await session.execute(text("DELETE FROM supplies WHERE id = :supply_id"), params)
+            await session.execute(text("DELETE FROM journal_segments WHERE name LIKE 'write-behind-%'"))
+        await engine.dispose()